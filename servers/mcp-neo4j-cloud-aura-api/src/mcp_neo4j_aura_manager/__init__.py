@@ -1,6 +1,6 @@
-from . import server
 import asyncio
 import argparse
+import importlib
 import os
 import logging
 import sys 
@@ -25,6 +25,9 @@ def main():
         logger.error("Client ID and Client Secret are required. Provide them as arguments or environment variables.")
         sys.exit(1)
     
+    # requests and the MCP server stack are only imported once the arguments are valid
+    from . import server
+
     try:
         asyncio.run(server.main(args.client_id, args.client_secret))
     except KeyboardInterrupt:
@@ -33,5 +36,13 @@ def main():
         logger.error(f"Error starting server: {str(e)}")
         sys.exit(1)
 
+
+def __getattr__(name):
+    # import the server lazily, so that `--help` does not load requests and mcp
+    if name == "server":
+        return importlib.import_module(f"{__name__}.server")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Optionally expose other important items at package level
 __all__ = ["main", "server"]
@@ -1,5 +1,5 @@
 if [ -f .env ]; then
     uv run --env-file .env pytest tests
 else
-    uv run pytest tests/test_aura_manager.py
+    uv run pytest tests/test_aura_manager.py tests/test_startup.py
 fi
@@ -0,0 +1,132 @@
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+SRC = str(Path(__file__).parents[1] / "src")
+
+# budgets can be raised on slow machines, the defaults leave headroom for CI
+IMPORT_BUDGET_MS = float(os.getenv("STARTUP_IMPORT_BUDGET_MS", "100"))
+INITIALIZE_BUDGET_S = float(os.getenv("STARTUP_INITIALIZE_BUDGET_S", "10"))
+
+HEAVY_MODULES = ("requests", "mcp", "pydantic")
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "startup-benchmark", "version": "0.0.0"},
+    },
+}
+
+
+def _env(**overrides: str) -> dict[str, str]:
+    return dict(os.environ, PYTHONPATH=SRC, **overrides)
+
+
+def _import_time_ms(module: str) -> float:
+    """Cumulative import time of `module` as reported by `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.split("|")
+        if name.strip() == module:
+            return int(cumulative) / 1000
+    raise AssertionError(f"{module} not found in the import time report")
+
+
+def test_package_import_does_not_load_the_server():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, mcp_neo4j_aura_manager; "
+            f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])",
+        ],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_package_import_time():
+    # warm up the bytecode cache so that compilation is not measured
+    _import_time_ms("mcp_neo4j_aura_manager")
+    elapsed = _import_time_ms("mcp_neo4j_aura_manager")
+    assert elapsed < IMPORT_BUDGET_MS, f"import took {elapsed:.1f}ms"
+
+
+def test_help_does_not_load_the_server():
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, mcp_neo4j_aura_manager\n"
+            "try:\n"
+            "    mcp_neo4j_aura_manager.main()\n"
+            "except SystemExit:\n"
+            f"    print([m for m in {HEAVY_MODULES!r} if m in sys.modules])",
+            "--help",
+        ],
+        env=_env(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip().endswith("[]")
+
+
+def _read_line(process: subprocess.Popen, timeout: float) -> bytes:
+    """The next line written by `process`, fails if none is written within `timeout` seconds."""
+    lines: queue.Queue[bytes] = queue.Queue()
+    threading.Thread(
+        target=lambda: lines.put(process.stdout.readline()), daemon=True
+    ).start()
+    try:
+        return lines.get(timeout=timeout)
+    except queue.Empty:
+        raise AssertionError(f"no response within {timeout:.2f}s") from None
+
+
+def test_time_to_initialize():
+    # the Aura API is only called by tools, placeholder credentials are enough
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import mcp_neo4j_aura_manager; mcp_neo4j_aura_manager.main()",
+        ],
+        env=_env(NEO4J_AURA_CLIENT_ID="client", NEO4J_AURA_CLIENT_SECRET="secret"),
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        start = time.perf_counter()
+        process.stdin.write(json.dumps(INITIALIZE).encode() + b"\n")
+        process.stdin.flush()
+        # a server that hangs fails the test instead of blocking it
+        line = _read_line(process, INITIALIZE_BUDGET_S)
+        response = json.loads(line)
+        elapsed = time.perf_counter() - start
+    finally:
+        process.kill()
+        process.wait()
+
+    assert response["id"] == 1
+    assert response["result"]["serverInfo"]["name"] == "mcp-neo4j-aura-manager"
+    assert elapsed < INITIALIZE_BUDGET_S, f"initialize took {elapsed:.2f}s"
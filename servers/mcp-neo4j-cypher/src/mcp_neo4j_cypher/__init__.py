@@ -1,8 +1,29 @@
 import argparse
-import asyncio
+import importlib
 import os
+from typing import Any, Optional
 
-from . import server
+
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    return int(value) if value else None
+
+
+def _optional_float(value: Optional[str]) -> Optional[float]:
+    return float(value) if value else None
+
+
+def _optional_list(value: Optional[str]) -> Optional[list[str]]:
+    return (
+        [item.strip() for item in value.split(",") if item.strip()] if value else None
+    )
+
+
+def _flag(value: Optional[str]) -> bool:
+    return value is not None and value.lower() in ("1", "true", "yes")
+
+
+def _optional_flag(value: Optional[str]) -> Optional[bool]:
+    return _flag(value) if value else None
 
 
 def main():
@@ -12,16 +33,313 @@ def main():
     parser.add_argument("--username", default=None, help="Neo4j username")
     parser.add_argument("--password", default=None, help="Neo4j password")
     parser.add_argument("--database", default=None, help="Neo4j database name")
+    parser.add_argument(
+        "--databases",
+        default=None,
+        help="Comma separated databases that tools may run on besides the default one",
+    )
+    parser.add_argument(
+        "--causal-consistency",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Make the reads of each client see its own writes, enabled by default",
+    )
+    parser.add_argument(
+        "--query-timeout",
+        type=float,
+        default=None,
+        help="Seconds after which Neo4j terminates the transaction of a query",
+    )
+    parser.add_argument(
+        "--max-retries",
+        type=int,
+        default=None,
+        help="Times a read or write is run again after a transient error, 0 disables retries",
+    )
+    parser.add_argument(
+        "--retry-deadline",
+        type=float,
+        default=None,
+        help="Seconds after the first attempt of a query after which it is not retried",
+    )
+    parser.add_argument(
+        "--max-concurrent-reads",
+        type=int,
+        default=None,
+        help="Maximum number of read tool calls running at once, others wait in a queue",
+    )
+    parser.add_argument(
+        "--max-concurrent-writes",
+        type=int,
+        default=None,
+        help="Maximum number of write tool calls running at once, others wait in a queue",
+    )
+    parser.add_argument(
+        "--max-queued-calls",
+        type=int,
+        default=None,
+        help="Maximum number of read and of write calls waiting, more are rejected as busy",
+    )
+    parser.add_argument(
+        "--slow-query-threshold",
+        type=float,
+        default=None,
+        help="Seconds after which read and write queries are logged as slow",
+    )
+    parser.add_argument(
+        "--slow-query-log",
+        default=None,
+        help="Rotating NDJSON file to append slow queries and their profiles to",
+    )
+    parser.add_argument(
+        "--slow-query-sample-rate",
+        type=float,
+        default=None,
+        help="Share of the slow reads run again with PROFILE, between 0 and 1",
+    )
+    parser.add_argument(
+        "--schema-cache-ttl",
+        type=float,
+        default=None,
+        help="Seconds to cache the database schema, 0 disables caching",
+    )
+    parser.add_argument(
+        "--schema-sample-size",
+        type=int,
+        default=None,
+        help="Number of nodes sampled per label to build the schema",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=None,
+        help="Number of records returned per page of a read query",
+    )
+    parser.add_argument(
+        "--max-rows",
+        type=int,
+        default=None,
+        help="Maximum number of records read from the result of a read query",
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=int,
+        default=None,
+        help="Maximum number of bytes of JSON read from the result of a read query",
+    )
+    parser.add_argument(
+        "--result-cache-size",
+        type=int,
+        default=None,
+        help="Bytes of read query results to cache, 0 disables the cache",
+    )
+    parser.add_argument(
+        "--result-cache-ttl",
+        type=float,
+        default=None,
+        help="Seconds to cache the result of a read query",
+    )
+
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Plan queries with EXPLAIN to classify them before they run",
+    )
+    parser.add_argument(
+        "--max-estimated-rows",
+        type=int,
+        default=None,
+        help="Reject queries whose plan estimates more rows in any step",
+    )
+    parser.add_argument(
+        "--reject-cartesian-products",
+        action="store_true",
+        help="Reject queries whose plan contains a cartesian product",
+    )
+    parser.add_argument(
+        "--reject-unbounded-expansions",
+        action="store_true",
+        help="Reject queries with variable length relationships without an upper bound",
+    )
+    parser.add_argument(
+        "--autoparameterize",
+        action="store_true",
+        help="Run reads with their literals as parameters, so that their plans are reused",
+    )
+
+    parser.add_argument(
+        "--import-dir",
+        default=None,
+        help="Directory of the files that bulk writes can read rows from",
+    )
+
+    parser.add_argument(
+        "--coalesce-writes",
+        action="store_true",
+        help="Commit concurrent small writes together in one transaction",
+    )
+    parser.add_argument(
+        "--coalesce-window",
+        type=float,
+        default=None,
+        help="Seconds to wait for more writes to commit together",
+    )
+    parser.add_argument(
+        "--coalesce-max-batch",
+        type=int,
+        default=None,
+        help="Maximum number of writes committed together",
+    )
+
+    parser.add_argument(
+        "--max-connection-pool-size",
+        type=int,
+        default=None,
+        help="Maximum number of connections per Neo4j server",
+    )
+    parser.add_argument(
+        "--connection-acquisition-timeout",
+        type=float,
+        default=None,
+        help="Seconds to wait for a connection from the pool",
+    )
+    parser.add_argument(
+        "--max-connection-lifetime",
+        type=float,
+        default=None,
+        help="Seconds after which pooled connections are closed",
+    )
+    parser.add_argument(
+        "--liveness-check-timeout",
+        type=float,
+        default=None,
+        help="Seconds a connection can be idle before it is checked when taken from the pool",
+    )
+    parser.add_argument(
+        "--keep-alive",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Enable TCP keep-alive on the Neo4j connections",
+    )
+    parser.add_argument(
+        "--fetch-size",
+        type=int,
+        default=None,
+        help="Number of records fetched from the server at a time",
+    )
+
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http", "sse"],
+        default=None,
+        help="Serve a single client over stdio, or many over streamable HTTP or SSE",
+    )
+    parser.add_argument(
+        "--host",
+        default=None,
+        help="Address the HTTP and SSE transports listen on",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="Port the HTTP and SSE transports listen on",
+    )
 
     args = parser.parse_args()
-    asyncio.run(
-        server.main(
-            args.db_url or os.getenv("NEO4J_URI", "bolt://localhost:7687"),
-            args.username or os.getenv("NEO4J_USERNAME", "neo4j"),
-            args.password or os.getenv("NEO4J_PASSWORD", "password"),
-            args.database or os.getenv("NEO4J_DATABASE", "neo4j"),
-        )
+
+    # the driver and the MCP server stack are only imported once the arguments are valid
+    from . import server
+
+    # options left unset keep the defaults of the driver
+    driver_config = {
+        "max_connection_pool_size": args.max_connection_pool_size
+        or _optional_int(os.getenv("NEO4J_MAX_CONNECTION_POOL_SIZE")),
+        "connection_acquisition_timeout": args.connection_acquisition_timeout
+        or _optional_float(os.getenv("NEO4J_CONNECTION_ACQUISITION_TIMEOUT")),
+        "max_connection_lifetime": args.max_connection_lifetime
+        or _optional_float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME")),
+        "liveness_check_timeout": args.liveness_check_timeout
+        if args.liveness_check_timeout is not None
+        else _optional_float(os.getenv("NEO4J_LIVENESS_CHECK_TIMEOUT")),
+        "keep_alive": args.keep_alive
+        if args.keep_alive is not None
+        else _optional_flag(os.getenv("NEO4J_KEEP_ALIVE")),
+    }
+
+    server.main(
+        args.db_url or os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        args.username or os.getenv("NEO4J_USERNAME", "neo4j"),
+        args.password or os.getenv("NEO4J_PASSWORD", "password"),
+        args.database or os.getenv("NEO4J_DATABASE", "neo4j"),
+        args.schema_cache_ttl
+        if args.schema_cache_ttl is not None
+        else float(os.getenv("NEO4J_SCHEMA_CACHE_TTL", "60")),
+        args.schema_sample_size or int(os.getenv("NEO4J_SCHEMA_SAMPLE_SIZE", "100")),
+        args.page_size or int(os.getenv("NEO4J_PAGE_SIZE", "100")),
+        args.max_rows or _optional_int(os.getenv("NEO4J_MAX_ROWS")),
+        args.max_bytes or _optional_int(os.getenv("NEO4J_MAX_BYTES")),
+        args.result_cache_size
+        if args.result_cache_size is not None
+        else int(os.getenv("NEO4J_RESULT_CACHE_SIZE", "0")),
+        args.result_cache_ttl
+        if args.result_cache_ttl is not None
+        else float(os.getenv("NEO4J_RESULT_CACHE_TTL", "60")),
+        args.explain or _flag(os.getenv("NEO4J_EXPLAIN")),
+        args.max_estimated_rows or _optional_int(os.getenv("NEO4J_MAX_ESTIMATED_ROWS")),
+        args.reject_cartesian_products
+        or _flag(os.getenv("NEO4J_REJECT_CARTESIAN_PRODUCTS")),
+        args.reject_unbounded_expansions
+        or _flag(os.getenv("NEO4J_REJECT_UNBOUNDED_EXPANSIONS")),
+        args.import_dir or os.getenv("NEO4J_IMPORT_DIR"),
+        args.coalesce_writes or _flag(os.getenv("NEO4J_COALESCE_WRITES")),
+        args.coalesce_window
+        if args.coalesce_window is not None
+        else float(os.getenv("NEO4J_COALESCE_WINDOW", "0.005")),
+        args.coalesce_max_batch or int(os.getenv("NEO4J_COALESCE_MAX_BATCH", "32")),
+        fetch_size=args.fetch_size or int(os.getenv("NEO4J_FETCH_SIZE", "1000")),
+        driver_config={
+            name: value for name, value in driver_config.items() if value is not None
+        },
+        transport=args.transport or os.getenv("NEO4J_TRANSPORT", "stdio"),
+        host=args.host or os.getenv("NEO4J_MCP_SERVER_HOST", "127.0.0.1"),
+        port=args.port or int(os.getenv("NEO4J_MCP_SERVER_PORT", "8000")),
+        databases=_optional_list(args.databases or os.getenv("NEO4J_DATABASES")),
+        causal_consistency=args.causal_consistency
+        if args.causal_consistency is not None
+        else _flag(os.getenv("NEO4J_CAUSAL_CONSISTENCY", "true")),
+        query_timeout=args.query_timeout
+        or _optional_float(os.getenv("NEO4J_QUERY_TIMEOUT")),
+        max_concurrent_reads=args.max_concurrent_reads
+        or _optional_int(os.getenv("NEO4J_MAX_CONCURRENT_READS")),
+        max_concurrent_writes=args.max_concurrent_writes
+        or _optional_int(os.getenv("NEO4J_MAX_CONCURRENT_WRITES")),
+        max_queued_calls=args.max_queued_calls
+        if args.max_queued_calls is not None
+        else int(os.getenv("NEO4J_MAX_QUEUED_CALLS", "64")),
+        slow_query_threshold=args.slow_query_threshold
+        if args.slow_query_threshold is not None
+        else _optional_float(os.getenv("NEO4J_SLOW_QUERY_THRESHOLD")),
+        slow_query_log=args.slow_query_log or os.getenv("NEO4J_SLOW_QUERY_LOG"),
+        slow_query_sample_rate=args.slow_query_sample_rate
+        if args.slow_query_sample_rate is not None
+        else float(os.getenv("NEO4J_SLOW_QUERY_SAMPLE_RATE", "0")),
+        autoparameterize=args.autoparameterize
+        or _flag(os.getenv("NEO4J_AUTOPARAMETERIZE")),
+        max_retries=args.max_retries
+        if args.max_retries is not None
+        else int(os.getenv("NEO4J_MAX_RETRIES", "3")),
+        retry_deadline=args.retry_deadline
+        if args.retry_deadline is not None
+        else float(os.getenv("NEO4J_RETRY_DEADLINE", "10")),
     )
 
 
+def __getattr__(name: str) -> Any:
+    # import the server lazily, so that `--help` does not load the driver
+    if name == "server":
+        return importlib.import_module(f"{__name__}.server")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ["main", "server"]
@@ -0,0 +1,157 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Hashable, Literal, Optional
+
+Kind = Literal["read", "write"]
+
+
+class ServerBusy(Exception):
+    """Raised when a call cannot wait for a slot because the queue is full."""
+
+
+class Gate:
+    """
+    Bounds the calls of one kind running at once. Calls over the limit wait in
+    a queue bounded in length, served round robin between clients and in order
+    within a client, so that a client sending a burst does not hold up the
+    calls of the others. When the queue is full the newest call of the client
+    with the most queued calls is rejected, or the arriving call if that client
+    is not ahead of the others.
+    A limit of `None` admits every call at once.
+    """
+
+    def __init__(self, kind: Kind, limit: Optional[int], max_queue: int) -> None:
+        self.kind = kind
+        self.limit = limit
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.queued = 0
+        # clients in the order they are served
+        self._queues: dict[Hashable, deque[asyncio.Future]] = {}
+
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    @asynccontextmanager
+    async def slot(self, client: Hashable) -> AsyncIterator[None]:
+        """Run the body in a slot, raises `ServerBusy` if the queue is full."""
+
+        await self._acquire(client)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, client: Hashable) -> None:
+        if self.limit is None or (self.in_flight < self.limit and not self.queued):
+            self.in_flight += 1
+            self.admitted += 1
+            return
+
+        if self.queued >= self.max_queue and not self._evict_for(client):
+            self.rejected += 1
+            raise self._busy()
+
+        future = asyncio.get_running_loop().create_future()
+        queue = self._queues.setdefault(client, deque())
+        queue.append(future)
+        self.queued += 1
+        started = time.monotonic()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled() and future.exception() is None:
+                # the slot was granted as the call was cancelled, pass it on
+                self._release()
+            elif future in queue:
+                self._dequeue(client, queue, future)
+            raise
+
+        waited = time.monotonic() - started
+        self.admitted += 1
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        while self._queues and self.in_flight < self.limit:
+            client, queue = next(iter(self._queues.items()))
+            # the client moves to the back of the round
+            del self._queues[client]
+            future = queue.popleft()
+            self.queued -= 1
+            if queue:
+                self._queues[client] = queue
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+
+    def _evict_for(self, client: Hashable) -> bool:
+        """Make room in a full queue for a call of `client`, if it is fair to."""
+
+        if not self._queues:
+            return False
+        longest = max(self._queues, key=lambda c: len(self._queues[c]))
+        queue = self._queues[longest]
+        if len(queue) <= len(self._queues.get(client, ())) + 1:
+            return False
+        future = queue[-1]
+        self._dequeue(longest, queue, future)
+        if not future.done():
+            future.set_exception(self._busy())
+        self.rejected += 1
+        return True
+
+    def _dequeue(
+        self, client: Hashable, queue: deque[asyncio.Future], future: asyncio.Future
+    ) -> None:
+        queue.remove(future)
+        self.queued -= 1
+        if not queue:
+            del self._queues[client]
+
+    def _busy(self) -> ServerBusy:
+        return ServerBusy(
+            f"Server busy: {self.in_flight} {self.kind} calls are running and "
+            f"{self.queued} are waiting, retry later"
+        )
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_queue": self.max_queue,
+            "clients_queued": len(self._queues),
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "mean_wait_ms": round(self.wait_seconds / self.admitted * 1000, 3)
+            if self.admitted
+            else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+        }
+
+
+class Admission:
+    """Separate gates for read and write calls, with a queue of `max_queue` each."""
+
+    def __init__(
+        self,
+        max_reads: Optional[int] = None,
+        max_writes: Optional[int] = None,
+        max_queue: int = 64,
+    ) -> None:
+        self.gates: dict[Kind, Gate] = {
+            "read": Gate("read", max_reads, max_queue),
+            "write": Gate("write", max_writes, max_queue),
+        }
+
+    def slot(self, kind: Kind, client: Hashable) -> Any:
+        return self.gates[kind].slot(client)
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        return {kind: gate.stats() for kind, gate in self.gates.items()}
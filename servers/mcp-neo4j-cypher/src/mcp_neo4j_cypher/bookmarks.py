@@ -0,0 +1,46 @@
+import weakref
+from typing import Any, Optional
+
+from neo4j import AsyncGraphDatabase, Bookmarks
+from neo4j.api import AsyncBookmarkManager
+
+
+class SessionBookmarks:
+    """
+    One bookmark manager per MCP client session. Transactions run for a client
+    start after the transactions it committed before, so its reads see its own
+    writes even when they are routed to a replica, while clients do not wait
+    for the writes of each other.
+    Managers are dropped with their client session. Calls made outside of a
+    client session, with `None`, share one manager.
+    """
+
+    def __init__(self) -> None:
+        self._managers: weakref.WeakKeyDictionary[Any, AsyncBookmarkManager] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._default = AsyncGraphDatabase.bookmark_manager()
+
+    def __len__(self) -> int:
+        return len(self._managers)
+
+    def get(self, session: Optional[Any]) -> AsyncBookmarkManager:
+        if session is None:
+            return self._default
+        manager = self._managers.get(session)
+        if manager is None:
+            manager = self._managers[session] = AsyncGraphDatabase.bookmark_manager()
+        return manager
+
+
+async def current_bookmarks(
+    manager: Optional[AsyncBookmarkManager],
+) -> frozenset[str]:
+    """The bookmarks of a manager, or none without a manager."""
+    if manager is None:
+        return frozenset()
+    return frozenset(await manager.get_bookmarks())
+
+
+def as_bookmarks(raw_values: frozenset[str]) -> Optional[Bookmarks]:
+    return Bookmarks.from_raw_values(raw_values) if raw_values else None
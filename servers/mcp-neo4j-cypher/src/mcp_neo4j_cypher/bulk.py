@@ -0,0 +1,193 @@
+import asyncio
+import csv
+import logging
+import math
+from pathlib import Path
+from typing import Any, Iterator, Literal, Optional
+
+import orjson
+from neo4j import AsyncDriver, AsyncManagedTransaction, Query, unit_of_work
+from neo4j.api import AsyncBookmarkManager
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+BulkMode = Literal["unwind", "transactions"]
+
+UNWIND_QUERY = "UNWIND $rows AS row\n{statement}"
+
+# every batch runs in its own transaction, failed batches are reported and skipped
+IN_TRANSACTIONS_QUERY = """
+UNWIND $rows AS row
+CALL {{
+    WITH row
+    {statement}
+}} IN TRANSACTIONS OF {batch_size} ROWS
+ON ERROR CONTINUE
+REPORT STATUS AS status
+RETURN status.transactionId AS transaction, status.committed AS committed,
+    status.errorMessage AS error
+"""
+
+
+def read_rows(path: Path) -> list[dict[str, Any]]:
+    """Read rows from a newline delimited JSON (`.ndjson`, `.jsonl`) or CSV file."""
+
+    suffix = path.suffix.lower()
+    if suffix in (".ndjson", ".jsonl"):
+        with path.open("rb") as f:
+            return [orjson.loads(line) for line in f if line.strip()]
+    if suffix == ".csv":
+        # values are strings, as with LOAD CSV
+        with path.open(newline="", encoding="utf-8") as f:
+            return list(csv.DictReader(f))
+    raise ValueError(f"Unsupported file type {suffix!r}, use .ndjson, .jsonl or .csv")
+
+
+def resolve_path(import_dir: Optional[Path], path: str) -> Path:
+    """Resolve a file path inside `import_dir`, refusing paths that leave it."""
+
+    if import_dir is None:
+        raise ValueError("Reading rows from files is disabled, set NEO4J_IMPORT_DIR")
+
+    resolved = (import_dir / path).resolve()
+    if not resolved.is_relative_to(import_dir.resolve()):
+        raise ValueError(f"{path} is outside of the import directory")
+    return resolved
+
+
+def _batches(
+    rows: list[dict[str, Any]], batch_size: int
+) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+    for start in range(0, len(rows), batch_size):
+        yield start, rows[start : start + batch_size]
+
+
+def add_counters(total: dict[str, int], counters: dict[str, Any]) -> None:
+    for name, value in counters.items():
+        if not name.startswith("_") and not isinstance(value, bool):
+            total[name] = total.get(name, 0) + value
+
+
+async def _run_batch(
+    tx: AsyncManagedTransaction, query: str, params: dict[str, Any]
+) -> dict[str, Any]:
+    result = await tx.run(query, params)
+    summary = await result.consume()
+    return summary.counters.__dict__
+
+
+async def write_unwind(
+    neo4j_driver: AsyncDriver,
+    database: str,
+    statement: str,
+    rows: list[dict[str, Any]],
+    params: Optional[dict[str, Any]] = None,
+    *,
+    batch_size: int = 1000,
+    concurrency: int = 4,
+    bookmark_manager: Optional[AsyncBookmarkManager] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """
+    Run `statement` for each row, `UNWIND` over batches of `batch_size` rows.
+    Each batch is a managed transaction, retried on transient errors, and up to
+    `concurrency` batches run at once. A failed batch does not stop the others.
+    """
+
+    query = UNWIND_QUERY.format(statement=statement)
+    run_batch = unit_of_work(metadata=metadata)(_run_batch)
+    semaphore = asyncio.Semaphore(concurrency)
+    counters: dict[str, int] = {}
+    failures = []
+
+    async def run(start: int, batch: list[dict[str, Any]]) -> None:
+        async with semaphore:
+            try:
+                async with neo4j_driver.session(
+                    database=database, bookmark_manager=bookmark_manager
+                ) as session:
+                    batch_counters = await session.execute_write(
+                        run_batch, query, {**(params or {}), "rows": batch}
+                    )
+                add_counters(counters, batch_counters)
+            except Exception as e:
+                logger.error(f"Bulk write batch at row {start} failed: {e}")
+                failures.append(
+                    {
+                        "batch": start // batch_size,
+                        "rows": [start, start + len(batch)],
+                        "error": str(e),
+                    }
+                )
+
+    batches = list(_batches(rows, batch_size))
+    await asyncio.gather(*(run(start, batch) for start, batch in batches))
+
+    return {
+        "rows": len(rows),
+        "batches": len(batches),
+        "committed_batches": len(batches) - len(failures),
+        "counters": counters,
+        "failures": sorted(failures, key=lambda f: f["batch"]),
+    }
+
+
+async def write_in_transactions(
+    neo4j_driver: AsyncDriver,
+    database: str,
+    statement: str,
+    rows: list[dict[str, Any]],
+    params: Optional[dict[str, Any]] = None,
+    *,
+    batch_size: int = 1000,
+    bookmark_manager: Optional[AsyncBookmarkManager] = None,
+    metadata: Optional[dict[str, Any]] = None,
+) -> dict[str, Any]:
+    """
+    Run `statement` for each row with `CALL {} IN TRANSACTIONS`, which commits
+    every `batch_size` rows server side. All rows are sent in a single request.
+    Requires Neo4j 5.7 or later to report failed batches.
+    """
+
+    query = IN_TRANSACTIONS_QUERY.format(
+        statement=statement, batch_size=int(batch_size)
+    )
+
+    # CALL IN TRANSACTIONS cannot run in a managed transaction
+    async with neo4j_driver.session(
+        database=database, bookmark_manager=bookmark_manager
+    ) as session:
+        result = await session.run(
+            Query(query, metadata=metadata), {**(params or {}), "rows": rows}
+        )
+        statuses = await result.data()
+        summary = await result.consume()
+
+    counters: dict[str, int] = {}
+    add_counters(counters, summary.counters.__dict__)
+
+    # rows of a batch share the status of its transaction, in batch order
+    transactions: dict[str, dict[str, Any]] = {}
+    for status in statuses:
+        transactions.setdefault(status["transaction"], status)
+
+    failures = []
+    for batch, status in enumerate(transactions.values()):
+        if not status["committed"]:
+            start = batch * batch_size
+            failures.append(
+                {
+                    "batch": batch,
+                    "rows": [start, min(start + batch_size, len(rows))],
+                    "error": status["error"],
+                }
+            )
+
+    batches = math.ceil(len(rows) / batch_size)
+    return {
+        "rows": len(rows),
+        "batches": batches,
+        "committed_batches": batches - len(failures),
+        "counters": counters,
+        "failures": failures,
+    }
@@ -0,0 +1,211 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, NamedTuple, Optional
+
+import orjson
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+# Write counters that indicate the shape of the graph may have changed. Property
+# keys and relationship types change with most writes, they are left to the TTL.
+SCHEMA_COUNTERS = (
+    "labels_added",
+    "labels_removed",
+    "indexes_added",
+    "indexes_removed",
+    "constraints_added",
+    "constraints_removed",
+)
+
+
+def is_schema_change(counters: dict[str, Any]) -> bool:
+    """Check if the counters of a write query report a schema-relevant change."""
+    return any(counters.get(name, 0) for name in SCHEMA_COUNTERS)
+
+
+def has_updates(counters: dict[str, Any]) -> bool:
+    """Check if the counters of a write query report any change at all."""
+    return any(value for name, value in counters.items() if not name.startswith("_"))
+
+
+Schema = dict[str, dict[str, Any]]
+
+
+class SchemaCache:
+    """
+    Caches the schema of a database, keyed by label, for `ttl` seconds.
+    Concurrent callers that miss the cache share a single in-flight load.
+    A `ttl` of 0 disables caching, but in-flight loads are still shared.
+    """
+
+    def __init__(self, ttl: float = 60.0) -> None:
+        self.ttl = ttl
+        self._value: Optional[Schema] = None
+        self._expires_at = 0.0
+        self._generation = 0
+        self._inflight: Optional[asyncio.Task] = None
+
+    def fresh(self) -> bool:
+        """Whether a schema is cached and has not expired."""
+        return self._value is not None and time.monotonic() < self._expires_at
+
+    async def get(self, loader: Callable[[], Awaitable[Schema]]) -> Schema:
+        if self.fresh():
+            return self._value
+
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._load(loader, self._generation))
+
+        # shield the load so a cancelled caller does not cancel it for the others
+        return await asyncio.shield(self._inflight)
+
+    async def _load(
+        self, loader: Callable[[], Awaitable[Schema]], generation: int
+    ) -> Schema:
+        try:
+            value = await loader()
+        finally:
+            self._inflight = None
+
+        # a write invalidated the cache while loading, the result may be stale
+        if generation == self._generation and self.ttl > 0:
+            self._value = value
+            self._expires_at = time.monotonic() + self.ttl
+        return value
+
+    def update(self, entries: dict[str, Optional[dict[str, Any]]]) -> Optional[Schema]:
+        """
+        Merge re-profiled labels into the cached schema, `None` entries are removed.
+        Returns the merged schema, or `None` when nothing is cached.
+        """
+
+        if not self.fresh():
+            return None
+
+        value = dict(self._value)
+        for label, entry in entries.items():
+            if entry is None:
+                value.pop(label, None)
+            else:
+                value[label] = entry
+
+        self._value = value
+        return value
+
+    def invalidate(self) -> None:
+        logger.debug("Invalidating schema cache")
+        self._generation += 1
+        self._value = None
+        self._expires_at = 0.0
+
+
+def params_key(params: Optional[dict[str, Any]]) -> bytes:
+    """Encode query parameters canonically, with sorted keys at every level."""
+    return orjson.dumps(params or {}, default=str, option=orjson.OPT_SORT_KEYS)
+
+
+class _Entry(NamedTuple):
+    value: Any
+    size: int
+    scope: Optional[frozenset[str]]
+    expires_at: float
+
+
+class ResultCache:
+    """
+    A least recently used cache of read results, bounded by the total `size` of
+    its entries in bytes rather than by their number. Entries expire after `ttl`
+    seconds. Each entry records the labels and relationship types its query can
+    observe, or `None` when it may observe anything, so that writes can
+    invalidate only the entries they may have changed.
+    Results read before an invalidation are not cached: the `generation` read
+    before running a query must be passed back to `put`.
+    """
+
+    def __init__(self, max_bytes: int, ttl: float = 60.0) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.generation = 0
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            entry = None
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry.value
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        size: int,
+        scope: Optional[frozenset[str]] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Cache a value of `size` bytes, values larger than the cache are skipped."""
+
+        if generation is not None and generation != self.generation:
+            # a write may have changed the result while it was read
+            return
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes or self.ttl <= 0:
+            return
+
+        while self.bytes + size > self.max_bytes:
+            oldest, _ = next(iter(self._entries.items()))
+            self._remove(oldest)
+            self.evictions += 1
+
+        self._entries[key] = _Entry(value, size, scope, time.monotonic() + self.ttl)
+        self.bytes += size
+
+    def invalidate(self, scope: Optional[frozenset[str]] = None) -> None:
+        """
+        Drop the entries that may observe a change to `scope`, the labels and
+        relationship types changed by a write, or every entry when it is `None`.
+        """
+
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if scope is None or entry.scope is None or entry.scope & scope
+        ]
+        logger.debug(f"Invalidating {len(stale)} cached results")
+        self.generation += 1
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
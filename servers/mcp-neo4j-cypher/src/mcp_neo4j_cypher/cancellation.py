@@ -0,0 +1,79 @@
+import asyncio
+import logging
+import secrets
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+from neo4j import WRITE_ACCESS, AsyncDriver
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+# the transaction metadata key holding the id of the tool call
+METADATA_KEY = "mcp_call"
+
+SHOW_QUERY = (
+    "SHOW TRANSACTIONS YIELD transactionId, metaData "
+    f"WHERE metaData.{METADATA_KEY} = $call RETURN transactionId"
+)
+TERMINATE_QUERY = "TERMINATE TRANSACTIONS $ids"
+
+
+class Terminator:
+    """
+    Terminates the transactions of cancelled tool calls. Cancelling a call
+    makes the driver drop the connection of its transaction, but Neo4j keeps
+    running a query until it sends results, so the transactions of each call
+    carry its id in their metadata and are terminated by it in the background.
+    """
+
+    def __init__(self, neo4j_driver: AsyncDriver) -> None:
+        self.neo4j_driver = neo4j_driver
+        self._tasks: set[asyncio.Task] = set()
+
+    @asynccontextmanager
+    async def cancellable(
+        self,
+        database: str,
+        access_mode: str = WRITE_ACCESS,
+        metadata: Optional[dict[str, str]] = None,
+    ) -> AsyncIterator[dict[str, str]]:
+        """
+        Yield the metadata to tag the transactions of a call with, or reuse the
+        `metadata` of an earlier call that opened the transaction.
+        """
+
+        if metadata is None:
+            metadata = {METADATA_KEY: secrets.token_urlsafe(12)}
+        try:
+            yield metadata
+        except asyncio.CancelledError:
+            call = metadata[METADATA_KEY]
+            self.terminate(database, call, access_mode)
+            raise
+
+    def terminate(
+        self, database: str, call: str, access_mode: str = WRITE_ACCESS
+    ) -> asyncio.Task:
+        task = asyncio.create_task(self._terminate(database, call, access_mode))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _terminate(self, database: str, call: str, access_mode: str) -> list[str]:
+        try:
+            # a cluster terminates the transactions of the server it routes to
+            async with self.neo4j_driver.session(
+                database=database, default_access_mode=access_mode
+            ) as session:
+                result = await session.run(SHOW_QUERY, call=call)
+                ids = [record["transactionId"] async for record in result]
+                if ids:
+                    result = await session.run(TERMINATE_QUERY, ids=ids)
+                    await result.consume()
+        except Exception as e:
+            logger.warning(f"Failed to terminate the transactions of call {call}: {e}")
+            return []
+
+        if ids:
+            logger.info(f"Terminated transactions {ids} of cancelled call {call}")
+        return ids
@@ -0,0 +1,170 @@
+import asyncio
+import logging
+from typing import Any, NamedTuple, Optional
+
+from neo4j import AsyncDriver, AsyncManagedTransaction, unit_of_work
+from neo4j.api import AsyncBookmarkManager
+
+from .bookmarks import as_bookmarks, current_bookmarks
+from .cypher import tokenize
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+# statements that must run in a transaction of their own, or outside of one
+_EXCLUSIVE_KEYWORDS = (
+    "INDEX",
+    "CONSTRAINT",
+    "DATABASE",
+    "ALIAS",
+    "USER",
+    "ROLE",
+    "PRIVILEGE",
+    "GRANT",
+    "DENY",
+    "REVOKE",
+    "TRANSACTIONS",
+    "USE",
+)
+
+
+def is_coalescible(query: str) -> bool:
+    """Check if a write can share a transaction with other writes."""
+    previous = None
+    for token in tokenize(query):
+        if previous not in (".", ":") and token.is_keyword(*_EXCLUSIVE_KEYWORDS):
+            return False
+        previous = token.text
+    return True
+
+
+class _Write(NamedTuple):
+    query: str
+    params: Optional[dict[str, Any]]
+    bookmark_manager: Optional[AsyncBookmarkManager]
+    future: "asyncio.Future[dict[str, Any]]"
+
+
+async def _run_writes(
+    tx: AsyncManagedTransaction, writes: list[_Write]
+) -> list[dict[str, Any]]:
+    counters = []
+    for write in writes:
+        result = await tx.run(write.query, write.params)
+        summary = await result.consume()
+        counters.append(summary.counters.__dict__)
+    return counters
+
+
+def _fail(writes: list[_Write], error: Exception) -> None:
+    for write in writes:
+        if not write.future.done():
+            write.future.set_exception(error)
+
+
+class WriteCoalescer:
+    """
+    Group commit for small writes: writes submitted within `window` seconds of
+    each other, up to `max_batch` of them, run in order in a single transaction,
+    and every caller receives the counters of its own statement.
+    When the transaction fails, the batch is split in halves that are retried
+    separately, until the failing statement is alone and only its caller fails.
+    A batch starts after the bookmarks of all its callers, and its bookmark is
+    passed on to each of their bookmark managers. Batches time out after
+    `timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        neo4j_driver: AsyncDriver,
+        database: str = "neo4j",
+        *,
+        window: float = 0.005,
+        max_batch: int = 32,
+        timeout: Optional[float] = None,
+    ) -> None:
+        self.neo4j_driver = neo4j_driver
+        self.database = database
+        self.window = window
+        self.max_batch = max_batch
+        self._run_writes = unit_of_work(timeout=timeout)(_run_writes)
+        self._pending: list[_Write] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._commits: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]] = None,
+        bookmark_manager: Optional[AsyncBookmarkManager] = None,
+    ) -> dict[str, Any]:
+        """Run a write with the next batch, returns the counters of the write."""
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(_Write(query, params, bookmark_manager, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._flush)
+
+        # a cancelled caller is skipped if its batch has not started yet
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch = [write for write in self._pending if not write.future.done()]
+        self._pending = []
+        if batch:
+            task = asyncio.create_task(self._commit(batch))
+            self._commits.add(task)
+            task.add_done_callback(self._commits.discard)
+
+    async def _commit(self, batch: list[_Write]) -> None:
+        # callers wait on their futures, none of them may be left pending
+        try:
+            await self._commit_batch(batch)
+        except asyncio.CancelledError:
+            _fail(
+                batch,
+                RuntimeError("The write was cancelled before its commit was confirmed"),
+            )
+            raise
+        except Exception as e:
+            _fail(batch, e)
+
+    async def _commit_batch(self, batch: list[_Write]) -> None:
+        previous: dict[AsyncBookmarkManager, frozenset[str]] = {}
+        for write in batch:
+            manager = write.bookmark_manager
+            if manager is not None and manager not in previous:
+                previous[manager] = await current_bookmarks(manager)
+
+        try:
+            async with self.neo4j_driver.session(
+                database=self.database,
+                bookmarks=as_bookmarks(frozenset().union(*previous.values())),
+            ) as session:
+                counters = await session.execute_write(self._run_writes, batch)
+                bookmarks = await session.last_bookmarks()
+        except Exception as e:
+            if len(batch) == 1:
+                if not batch[0].future.done():
+                    batch[0].future.set_exception(e)
+                return
+
+            logger.debug(f"Batch of {len(batch)} writes failed, retrying halves: {e}")
+            middle = len(batch) // 2
+            await self._commit_batch(batch[:middle])
+            await self._commit_batch(batch[middle:])
+            return
+
+        logger.debug(f"Committed {len(batch)} writes in one transaction")
+        for manager, raw_values in previous.items():
+            await manager.update_bookmarks(raw_values, bookmarks.raw_values)
+        for write, write_counters in zip(batch, counters):
+            if not write.future.done():
+                write.future.set_result(write_counters)
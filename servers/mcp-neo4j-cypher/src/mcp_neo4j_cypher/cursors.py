@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import secrets
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from neo4j import AsyncResult, AsyncSession, AsyncTransaction
+
+from .formats import ResultFormat, RowsEncoder, page_encoder
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+
+class Cursor:
+    """
+    An open read result that is consumed page by page.
+    At most `max_rows` records and `max_bytes` of encoded records are returned
+    over the lifetime of the cursor. The `database` and transaction `metadata`
+    identify its transaction to terminate it when a read is cancelled.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        tx: AsyncTransaction,
+        result: AsyncResult,
+        *,
+        keys: Optional[list[str]] = None,
+        result_format: ResultFormat = "rows",
+        max_rows: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        database: Optional[str] = None,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> None:
+        self.session = session
+        self.tx = tx
+        self.result = result
+        self.keys = keys or []
+        self.result_format = result_format
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.database = database
+        self.metadata = metadata
+        self.rows = 0
+        self.bytes = 0
+        self.closed = False
+        self.lock = asyncio.Lock()
+        self.last_used = time.monotonic()
+
+    def encoder(self) -> RowsEncoder:
+        """Create an encoder for the next page in the format of the cursor."""
+        return page_encoder(self.result_format, self.keys)
+
+    async def fetch(
+        self, n: int, encoder: RowsEncoder
+    ) -> tuple[int, bool, Optional[str]]:
+        """
+        Pull up to `n` records within the budgets of the cursor into `encoder`.
+        Returns the number of records added, whether more records remain and,
+        when a budget was exhausted, the name of that budget.
+        """
+
+        if self.max_rows is not None:
+            n = min(n, self.max_rows - self.rows)
+
+        records = await self.result.fetch(n) if n > 0 else []
+        self.last_used = time.monotonic()
+
+        added = 0
+        for record in records:
+            size = encoder.encode(record)
+            if self.max_bytes is not None and self.bytes + size > self.max_bytes:
+                return added, False, "max_bytes"
+            encoder.accept()
+            added += 1
+            self.rows += 1
+            self.bytes += size
+
+        has_more = await self.result.peek() is not None
+        if has_more and self.max_rows is not None and self.rows >= self.max_rows:
+            return added, False, "max_rows"
+        return added, has_more, None
+
+    async def close(self) -> None:
+        self.closed = True
+        try:
+            # rolling back the read transaction discards the rest of the result
+            await self.tx.close()
+        finally:
+            await self.session.close()
+
+
+class CursorRegistry:
+    """
+    Keeps open read results between tool calls, addressed by continuation token.
+    Cursors idle for more than `idle_timeout` seconds are closed, and opening more
+    than `max_open` cursors closes the least recently used one that is not being
+    read. If all of them are being read, the new cursor is closed and rejected.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, max_open: int = 16) -> None:
+        self.idle_timeout = idle_timeout
+        self.max_open = max_open
+        self._cursors: OrderedDict[str, Cursor] = OrderedDict()
+        self._reaper: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    async def register(self, cursor: Cursor) -> str:
+        await self._expire()
+
+        while len(self._cursors) >= self.max_open:
+            # a cursor read by a concurrent call keeps its transaction
+            token = next(
+                (t for t, c in self._cursors.items() if not c.lock.locked()), None
+            )
+            if token is None:
+                await self._close(cursor)
+                raise ValueError(
+                    f"Too many open results ({len(self._cursors)}) being read, "
+                    "retry once one of them is read"
+                )
+            logger.debug(f"Too many open cursors, closing cursor {token}")
+            await self.close(token)
+
+        token = secrets.token_urlsafe(16)
+        self._cursors[token] = cursor
+
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap())
+
+        return token
+
+    async def get(self, token: str) -> Cursor:
+        await self._expire()
+
+        cursor = self._cursors.get(token)
+        if cursor is None:
+            raise ValueError(
+                "Unknown or expired continuation token, run the query again"
+            )
+
+        self._cursors.move_to_end(token)
+        cursor.last_used = time.monotonic()
+        return cursor
+
+    async def close(self, token: str) -> None:
+        cursor = self._cursors.pop(token, None)
+        if cursor is not None:
+            await self._close(cursor)
+
+    async def close_all(self) -> None:
+        while self._cursors:
+            _, cursor = self._cursors.popitem()
+            await self._close(cursor)
+
+    async def _close(self, cursor: Cursor) -> None:
+        try:
+            await cursor.close()
+        except Exception as e:
+            logger.debug(f"Error closing cursor: {e}")
+
+    async def _expire(self) -> None:
+        deadline = time.monotonic() - self.idle_timeout
+        expired = [
+            token
+            for token, cursor in self._cursors.items()
+            if cursor.last_used < deadline and not cursor.lock.locked()
+        ]
+        for token in expired:
+            logger.debug(f"Closing idle cursor {token}")
+            await self.close(token)
+
+    async def _reap(self) -> None:
+        while self._cursors:
+            await asyncio.sleep(self.idle_timeout / 2)
+            await self._expire()
@@ -0,0 +1,542 @@
+import re
+from functools import lru_cache
+from typing import Any, Iterator, NamedTuple, Optional
+
+# comments and whitespace are matched but never emitted as tokens
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+    | (?P<string>'(?:[^'\\]|\\.)*(?:'|\Z)|"(?:[^"\\]|\\.)*(?:"|\Z))
+    | (?P<name>`(?:[^`]|``)*(?:`|\Z)|[^\W\d]\w*)
+    | (?P<number>0[xX][0-9a-fA-F_]+|0o[0-7_]+|(?:\d[\d_]*(?:\.\d[\d_]*)?|\.\d[\d_]*)(?:[eE][+-]?\d+)?)
+    | (?P<parameter>\$(?:`(?:[^`]|``)*(?:`|\Z)|\w+))
+    | (?P<symbol>\.\.|<>|<=|>=|=~|\+=|::|.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+class Token(NamedTuple):
+    kind: str
+    text: str
+
+    @property
+    def value(self) -> str:
+        """The text of the token, without the quoting of backticked names."""
+        if self.kind == "name" and self.text.startswith("`"):
+            return self.text[1:-1].replace("``", "`")
+        return self.text
+
+    def is_keyword(self, *keywords: str) -> bool:
+        return self.kind == "name" and self.text.upper() in keywords
+
+
+def tokenize(query: str) -> Iterator[Token]:
+    """Split a Cypher query into tokens in a single pass, dropping comments."""
+    for match in _TOKEN_RE.finditer(query):
+        kind = match.lastgroup
+        if kind != "space" and kind != "comment":
+            yield Token(kind, match.group())
+
+
+def normalize_query(query: str) -> str:
+    """Normalize the whitespace and strip the comments of a Cypher query."""
+    return " ".join(token.text for token in tokenize(query))
+
+
+# clauses that change data, the schema or the system
+WRITE_CLAUSES = (
+    "CREATE",
+    # the GQL synonym of CREATE
+    "INSERT",
+    "MERGE",
+    "SET",
+    "DELETE",
+    "DETACH",
+    "REMOVE",
+    "DROP",
+    "ALTER",
+    "RENAME",
+    "GRANT",
+    "DENY",
+    "REVOKE",
+)
+
+# clauses that only write when followed by one of these keywords
+ADMINISTRATION_CLAUSES = ("START", "STOP")
+ADMINISTRATION_TARGETS = ("DATABASE", "DATABASES")
+
+# procedures that write, by name prefix
+WRITE_PROCEDURES = (
+    "apoc.atomic.",
+    "apoc.create.",
+    "apoc.custom.",
+    "apoc.cypher.doIt",
+    "apoc.cypher.runFile",
+    "apoc.cypher.runMany",
+    "apoc.cypher.runSchema",
+    "apoc.cypher.runWrite",
+    "apoc.do.",
+    "apoc.graph.",
+    "apoc.import.",
+    "apoc.lock.",
+    "apoc.merge.",
+    "apoc.nodes.delete",
+    "apoc.nodes.link",
+    "apoc.periodic.",
+    "apoc.refactor.",
+    "apoc.schema.assert",
+    "apoc.systemdb.",
+    "apoc.trigger.",
+    "apoc.uuid.",
+    "db.create",
+    "db.index.fulltext.create",
+    "db.index.fulltext.drop",
+    "db.index.vector.create",
+    "dbms.",
+)
+
+
+def _procedure(tokens: list[Token], i: int) -> str:
+    """Read the dotted procedure name starting at `i`."""
+    parts = []
+    while i < len(tokens) and tokens[i].kind == "name":
+        parts.append(tokens[i].value)
+        if i + 1 < len(tokens) and tokens[i + 1].text == ".":
+            i += 2
+        else:
+            break
+    return ".".join(parts)
+
+
+# procedures that match a write prefix but only read
+READ_PROCEDURES = ("apoc.cypher.runManyReadOnly",)
+
+
+def _is_write_procedure(name: str) -> bool:
+    if name in READ_PROCEDURES:
+        return False
+    # graph data science procedures write to the database in `write` mode
+    return name.startswith(WRITE_PROCEDURES) or (
+        name.startswith("gds.") and name.endswith(".write")
+    )
+
+
+@lru_cache(maxsize=1024)
+def is_write_query(query: str) -> bool:
+    """
+    Check if a query may write, from its tokens: keywords inside string literals,
+    comments, property keys and labels are ignored, while write clauses in
+    subqueries and calls to known write procedures are detected.
+    """
+
+    tokens = list(tokenize(query))
+    in_labels = False
+    for i, token in enumerate(tokens):
+        previous = tokens[i - 1].text if i > 0 else None
+        if token.kind != "name":
+            # label expressions such as :A|B&!C continue across these symbols
+            in_labels = in_labels and token.text in ("|", "&", "!")
+            continue
+        if previous == ":" or (in_labels and previous in ("|", "&", "!")):
+            in_labels = True
+            continue
+        in_labels = False
+        following = tokens[i + 1].text if i + 1 < len(tokens) else None
+        # property access, map keys and quoted names
+        if previous == "." or following == ":" or token.text.startswith("`"):
+            continue
+        if token.is_keyword(*WRITE_CLAUSES):
+            return True
+        if token.is_keyword(*ADMINISTRATION_CLAUSES) and (
+            i + 1 < len(tokens) and tokens[i + 1].is_keyword(*ADMINISTRATION_TARGETS)
+        ):
+            return True
+        if token.is_keyword("CALL") and _is_write_procedure(_procedure(tokens, i + 1)):
+            return True
+    return False
+
+
+# keywords after which a parenthesis opens a pattern rather than a function call
+_PATTERN_KEYWORDS = (
+    "MATCH",
+    "MERGE",
+    "CREATE",
+    "WHERE",
+    "AND",
+    "OR",
+    "XOR",
+    "NOT",
+    "WITH",
+    "RETURN",
+    "EXISTS",
+    "IN",
+)
+
+_WRITE_SCOPE_BLOCKERS = (
+    "SET",
+    "REMOVE",
+    "DELETE",
+    "DETACH",
+    "MERGE",
+    "FOREACH",
+    "CALL",
+    "LOAD",
+    "DROP",
+    "ALTER",
+)
+
+
+class _Scope:
+    """The labels and relationship types a query touches, see `read_scope`."""
+
+    def __init__(self, tokens: list[Token]) -> None:
+        self.tokens = tokens
+        self.names: set[str] = set()
+        self.unbounded = False
+        self.dynamic = False
+
+    def _opens_pattern(self, i: int) -> bool:
+        if i == 0:
+            return True
+        previous = self.tokens[i - 1]
+        if previous.kind == "symbol":
+            return previous.text != "."
+        return previous.is_keyword(*_PATTERN_KEYWORDS)
+
+    def _labels(self, i: int) -> tuple[list[str], int]:
+        """Collect the label expression starting at a colon, returns the end index."""
+        labels = []
+        while i < len(self.tokens) and self.tokens[i].text in (":", "|", "&", "!"):
+            i += 1
+            if i < len(self.tokens) and self.tokens[i].text == "!":
+                i += 1
+            if i >= len(self.tokens):
+                break
+            token = self.tokens[i]
+            if token.kind == "name":
+                labels.append(token.value)
+                i += 1
+            else:
+                # dynamic labels, wildcards and parenthesized label expressions
+                self.unbounded = True
+                self.dynamic = True
+                break
+        return labels, i
+
+    def _node(self, i: int) -> tuple[Optional[str], list[str]]:
+        """Parse the node pattern opened at `i`, or return no variable and no labels."""
+        j = i + 1
+        variable = None
+        if j < len(self.tokens) and self.tokens[j].kind == "name":
+            following = self.tokens[j + 1] if j + 1 < len(self.tokens) else None
+            if following is None or not (
+                following.text in (":", ")", "{") or following.is_keyword("WHERE")
+            ):
+                return None, []
+            variable = self.tokens[j].value
+            j += 1
+        if j < len(self.tokens) and self.tokens[j].text == ":":
+            labels, _ = self._labels(j)
+            return variable, labels
+        if j < len(self.tokens) and self.tokens[j].text in (")", "{"):
+            return variable, []
+        return None, []
+
+    def analyze(self) -> Optional[frozenset[str]]:
+        tokens = self.tokens
+        labelled: set[str] = set()
+        nodes = []
+
+        for i, token in enumerate(tokens):
+            if token.text == "(" and self._opens_pattern(i):
+                variable, labels = self._node(i)
+                if variable is None and not labels:
+                    if i + 1 < len(tokens) and tokens[i + 1].text == ")":
+                        # anonymous node without labels
+                        self.unbounded = True
+                    continue
+                nodes.append((variable, labels))
+                if labels and variable is not None:
+                    labelled.add(variable)
+                self.names.update(labels)
+
+            elif token.text == "[" and i > 0 and tokens[i - 1].text == "-":
+                j = i + 1
+                if j < len(tokens) and tokens[j].kind == "name":
+                    j += 1
+                types, _ = self._labels(j) if j < len(tokens) else ([], j)
+                if not types:
+                    self.unbounded = True
+                self.names.update(types)
+
+            elif token.text == "-" and i + 1 < len(tokens):
+                following = tokens[i + 1].text
+                if following == "-" and i > 0 and tokens[i - 1].text in (")", "<"):
+                    # relationship without a type, -- or -->
+                    self.unbounded = True
+
+            elif token.text == "(" and i > 0 and tokens[i - 1].kind == "name":
+                # namespaced functions and procedures can read anything
+                if i > 1 and tokens[i - 2].text == ".":
+                    self.unbounded = True
+
+            elif token.is_keyword("CALL"):
+                following = tokens[i + 1] if i + 1 < len(tokens) else None
+                if following is not None and following.kind == "name":
+                    self.unbounded = True
+
+        for variable, labels in nodes:
+            if not labels and variable not in labelled:
+                self.unbounded = True
+
+        if self.unbounded:
+            return None
+        return frozenset(self.names)
+
+
+def read_scope(query: str) -> Optional[frozenset[str]]:
+    """
+    Labels and relationship types a read query can observe, or `None` when it
+    may observe any part of the graph: it matches a node without a label or a
+    relationship without a type, or calls a procedure or namespaced function.
+    """
+    return _Scope(list(tokenize(query))).analyze()
+
+
+def write_scope(query: str) -> Optional[frozenset[str]]:
+    """
+    Labels and relationship types a write query can change, or `None` when that
+    cannot be determined. Only queries that create new nodes and relationships
+    are scoped: updating or deleting matched nodes can affect nodes carrying
+    labels that the query never mentions.
+    """
+    tokens = list(tokenize(query))
+
+    for i, token in enumerate(tokens):
+        previous = tokens[i - 1].text if i > 0 else None
+        if previous in (".", ":") or token.kind != "name":
+            continue
+        if token.is_keyword(*_WRITE_SCOPE_BLOCKERS):
+            return None
+        if token.is_keyword("CREATE"):
+            following = tokens[i + 1] if i + 1 < len(tokens) else None
+            if following is None or following.kind == "name":
+                # CREATE INDEX, CREATE CONSTRAINT, CREATE DATABASE, ...
+                return None
+
+    scope = _Scope(tokens)
+    scope.analyze()
+    if scope.dynamic:
+        return None
+    return frozenset(scope.names)
+
+
+# commands whose literals are names or options rather than values
+_UNPARAMETERIZED_KEYWORDS = ("SHOW", "USE", "TERMINATE")
+# clauses that end the projection of a RETURN
+_PROJECTION_END = ("ORDER", "SKIP", "OFFSET", "LIMIT", "UNION")
+
+_COMPLETE_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"", re.DOTALL)
+_ESCAPE_RE = re.compile(r"\\(u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|.)", re.DOTALL)
+_ESCAPES = {
+    "t": "\t",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "f": "\f",
+    "'": "'",
+    '"': '"',
+    "\\": "\\",
+}
+
+
+def _literal(token: Token) -> tuple[bool, Any]:
+    """The value of a string or number literal, and whether it could be read."""
+
+    if token.kind == "number":
+        text = token.text.replace("_", "")
+        if text[:2].lower() in ("0x", "0o"):
+            return True, int(text, 0)
+        if any(c in text for c in ".eE"):
+            return True, float(text)
+        # integers with a leading zero are octal in older Cypher versions
+        if len(text) > 1 and text.startswith("0"):
+            return False, None
+        return True, int(text)
+
+    if not _COMPLETE_STRING_RE.fullmatch(token.text):
+        return False, None
+    invalid = False
+
+    def unescape(match: re.Match) -> str:
+        nonlocal invalid
+        escape = match.group(1)
+        if escape[0] in "uU" and len(escape) > 1:
+            return chr(int(escape[1:], 16))
+        if escape not in _ESCAPES:
+            invalid = True
+            return escape
+        return _ESCAPES[escape]
+
+    value = _ESCAPE_RE.sub(unescape, token.text[1:-1])
+    return not invalid, value
+
+
+def _is_clause_keyword(tokens: list[Token], i: int, *keywords: str) -> bool:
+    # not a property key, a map key or a label
+    previous = tokens[i - 1].text if i > 0 else None
+    following = tokens[i + 1].text if i + 1 < len(tokens) else None
+    return (
+        tokens[i].is_keyword(*keywords)
+        and previous not in (".", ":")
+        and following != ":"
+    )
+
+
+def _unaliased_items(tokens: list[Token], start: int) -> Iterator[int]:
+    """The tokens of the items of a RETURN starting at `start` that have no alias."""
+
+    items: list[list[int]] = [[]]
+    aliased = [False]
+    depth = 0
+    for i in range(start, len(tokens)):
+        token = tokens[i]
+        if token.kind == "symbol" and token.text in ("(", "[", "{"):
+            depth += 1
+        elif token.kind == "symbol" and token.text in (")", "]", "}"):
+            depth -= 1
+            # the end of the subquery holding the RETURN
+            if depth < 0:
+                break
+        elif depth == 0:
+            if token.text == ";" or _is_clause_keyword(tokens, i, *_PROJECTION_END):
+                break
+            if token.text == ",":
+                items.append([])
+                aliased.append(False)
+                continue
+            if _is_clause_keyword(tokens, i, "AS"):
+                aliased[-1] = True
+        items[-1].append(i)
+
+    for item, has_alias in zip(items, aliased):
+        if not has_alias:
+            yield from item
+
+
+def _is_length(tokens: list[Token], i: int) -> bool:
+    """Whether the token at `i` is the `*` of a relationship, as in `[*2]` or `[r:T*2]`."""
+    if i < 1 or tokens[i].text != "*":
+        return False
+    previous = tokens[i - 1]
+    if previous.text == "[":
+        return True
+    # a variable or a type, otherwise `*` multiplies
+    return previous.kind == "name" and i > 1 and tokens[i - 2].text in ("[", ":", "|")
+
+
+def _options_end(tokens: list[Token]) -> int:
+    """
+    The number of tokens of the options that precede a query, such as
+    `CYPHER 5 runtime=slotted` or `EXPLAIN`.
+    """
+
+    i = 0
+    cypher = False
+    while i < len(tokens):
+        if tokens[i].is_keyword("CYPHER"):
+            cypher = True
+            i += 1
+        elif tokens[i].is_keyword("EXPLAIN", "PROFILE"):
+            i += 1
+        elif cypher and tokens[i].kind == "number":
+            i += 1
+        elif cypher and i + 2 < len(tokens) and tokens[i + 1].text == "=":
+            i += 3
+        else:
+            break
+    return i
+
+
+def _structural_literals(tokens: list[Token]) -> set[int]:
+    """
+    The literals that cannot be parameters: the Cypher version and options
+    before the query, bounds of variable length relationships such as `*1..3`,
+    quantifiers of path patterns such as `{1,3}`, and literals in unaliased
+    RETURN items, which name their columns.
+    """
+
+    fixed = set(range(_options_end(tokens)))
+    for i, token in enumerate(tokens):
+        if token.kind == "number":
+            previous = tokens[i - 1].text if i > 0 else None
+            following = tokens[i + 1].text if i + 1 < len(tokens) else None
+            if previous == ".." or following == ".." or _is_length(tokens, i - 1):
+                fixed.add(i)
+        elif token.kind == "symbol" and token.text == "{":
+            end = i + 1
+            while end < len(tokens) and (
+                tokens[end].kind == "number" or tokens[end].text == ","
+            ):
+                end += 1
+            if end < len(tokens) and tokens[end].text == "}":
+                fixed.update(range(i + 1, end))
+        elif _is_clause_keyword(tokens, i, "RETURN"):
+            fixed.update(_unaliased_items(tokens, i + 1))
+    return fixed
+
+
+def parameterize(
+    query: str, params: Optional[dict[str, Any]] = None
+) -> tuple[str, dict[str, Any]]:
+    """
+    Lift the string and number literals of a query into parameters, and
+    normalize its whitespace and comments, so that queries that only differ in
+    their literals have the same text and share a plan in the Neo4j query cache.
+    Literals that are part of the structure of the query are kept.
+    Returns the query and its parameters, with the lifted ones added.
+    """
+
+    params = dict(params or {})
+    matches = list(_TOKEN_RE.finditer(query))
+    tokens = [
+        Token(m.lastgroup, m.group())
+        for m in matches
+        if m.lastgroup != "space" and m.lastgroup != "comment"
+    ]
+    if any(
+        _is_clause_keyword(tokens, i, *_UNPARAMETERIZED_KEYWORDS)
+        for i in range(len(tokens))
+    ):
+        return query, params
+
+    # generated names cannot collide with the parameters of the query
+    prefix = "lit"
+    used = set(params) | {t.text[1:] for t in tokens if t.kind == "parameter"}
+    while any(name.startswith(prefix) for name in used):
+        prefix = "_" + prefix
+
+    fixed = _structural_literals(tokens)
+    parts: list[str] = []
+    lifted = 0
+    i = -1
+    for match in matches:
+        if match.lastgroup == "space" or match.lastgroup == "comment":
+            if parts and parts[-1] != " ":
+                parts.append(" ")
+            continue
+        i += 1
+        token = tokens[i]
+        if token.kind in ("string", "number") and i not in fixed:
+            readable, value = _literal(token)
+            if readable:
+                name = f"{prefix}{lifted}"
+                lifted += 1
+                params[name] = value
+                parts.append("$" + name)
+                continue
+        parts.append(token.text)
+
+    return "".join(parts).strip(), params
@@ -0,0 +1,45 @@
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Databases:
+    """
+    The databases that tools may run on: the default database and an allow-list
+    of others. Database names are case insensitive, as in Neo4j.
+    """
+
+    def __init__(self, default: str, allowed: Optional[Iterable[str]] = None) -> None:
+        self.default = default.lower()
+        self.allowed = {self.default, *(name.lower() for name in allowed or ())}
+
+    def resolve(self, name: Optional[str]) -> str:
+        """The database to run on, raises a `ValueError` if it is not allowed."""
+
+        if name is None:
+            return self.default
+        name = name.lower()
+        if name not in self.allowed:
+            raise ValueError(
+                f"Database {name!r} is not allowed, use one of: "
+                + ", ".join(sorted(self.allowed))
+            )
+        return name
+
+
+class PerDatabase(Generic[T]):
+    """Objects bound to a database, created by `factory` when it is first used."""
+
+    def __init__(self, factory: Callable[[str], T]) -> None:
+        self.factory = factory
+        self._values: dict[str, T] = {}
+
+    def __getitem__(self, database: str) -> T:
+        value = self._values.get(database)
+        if value is None:
+            value = self._values[database] = self.factory(database)
+        return value
+
+    def get(self, database: str) -> Optional[T]:
+        """The object of a database if it was created, without creating it."""
+        return self._values.get(database)
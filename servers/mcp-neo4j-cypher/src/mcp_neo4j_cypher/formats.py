@@ -0,0 +1,147 @@
+from typing import Any, Literal, Optional
+
+from neo4j import Record
+from neo4j.graph import Node, Path, Relationship
+
+from .serialization import dump_record, dumpb
+
+ResultFormat = Literal["rows", "columnar", "graph"]
+
+
+class RowsEncoder:
+    """Encodes a page as a list of objects keyed by column name."""
+
+    def __init__(self, keys: list[str]) -> None:
+        self.keys = keys
+        self._parts: list[bytes] = []
+        self._staged: Optional[bytes] = None
+
+    def _encode_row(self, record: Record) -> bytes:
+        return dump_record(record)
+
+    def encode(self, record: Record) -> int:
+        """Stage a record, returns the number of bytes it adds to the page."""
+        self._staged = self._encode_row(record)
+        # each row is followed by a separator, or the closing bracket
+        return len(self._staged) + 1
+
+    def accept(self) -> None:
+        """Add the staged record to the page."""
+        self._parts.append(self._staged)
+
+    def _rows(self) -> bytes:
+        return b"[" + b",".join(self._parts) + b"]"
+
+    def page(self) -> bytes:
+        return self._rows()
+
+
+class ColumnarEncoder(RowsEncoder):
+    """Encodes a page as the column names once, followed by one value array per row."""
+
+    def _encode_row(self, record: Record) -> bytes:
+        return dumpb(list(record.values()))
+
+    def page(self) -> bytes:
+        return b'{"columns":' + dumpb(self.keys) + b',"rows":' + self._rows() + b"}"
+
+
+class GraphEncoder(RowsEncoder):
+    """
+    Encodes a page as deduplicated nodes and relationships keyed by element id,
+    and rows in which graph values are replaced by references to them.
+    """
+
+    def __init__(self, keys: list[str]) -> None:
+        super().__init__(keys)
+        self._nodes: dict[str, bytes] = {}
+        self._relationships: dict[str, bytes] = {}
+        self._staged_nodes: dict[str, bytes] = {}
+        self._staged_relationships: dict[str, bytes] = {}
+
+    def _node(self, node: Node) -> dict[str, str]:
+        element_id = node.element_id
+        if element_id not in self._nodes and element_id not in self._staged_nodes:
+            self._staged_nodes[element_id] = dumpb(
+                {"labels": sorted(node.labels), "properties": dict(node)}
+            )
+        return {"$node": element_id}
+
+    def _relationship(self, relationship: Relationship) -> dict[str, str]:
+        element_id = relationship.element_id
+        if (
+            element_id not in self._relationships
+            and element_id not in self._staged_relationships
+        ):
+            self._staged_relationships[element_id] = dumpb(
+                {
+                    "type": relationship.type,
+                    "start": relationship.start_node.element_id,
+                    "end": relationship.end_node.element_id,
+                    "properties": dict(relationship),
+                }
+            )
+        return {"$relationship": element_id}
+
+    def _reference(self, value: Any) -> Any:
+        if isinstance(value, Node):
+            return self._node(value)
+        if isinstance(value, Relationship):
+            return self._relationship(value)
+        if isinstance(value, Path):
+            return {
+                "$path": {
+                    "nodes": [self._node(n)["$node"] for n in value.nodes],
+                    "relationships": [
+                        self._relationship(r)["$relationship"]
+                        for r in value.relationships
+                    ],
+                }
+            }
+        if isinstance(value, list):
+            return [self._reference(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self._reference(v) for k, v in value.items()}
+        return value
+
+    def encode(self, record: Record) -> int:
+        self._staged_nodes = {}
+        self._staged_relationships = {}
+        self._staged = dumpb({k: self._reference(v) for k, v in record.items()})
+
+        size = len(self._staged) + 1
+        for entities in (self._staged_nodes, self._staged_relationships):
+            # quoted element id, colon and separator
+            size += sum(len(k) + len(v) + 4 for k, v in entities.items())
+        return size
+
+    def accept(self) -> None:
+        super().accept()
+        self._nodes.update(self._staged_nodes)
+        self._relationships.update(self._staged_relationships)
+
+    @staticmethod
+    def _entities(entities: dict[str, bytes]) -> bytes:
+        return b"{" + b",".join(dumpb(k) + b":" + v for k, v in entities.items()) + b"}"
+
+    def page(self) -> bytes:
+        return (
+            b'{"nodes":'
+            + self._entities(self._nodes)
+            + b',"relationships":'
+            + self._entities(self._relationships)
+            + b',"rows":'
+            + self._rows()
+            + b"}"
+        )
+
+
+ENCODERS: dict[str, type[RowsEncoder]] = {
+    "rows": RowsEncoder,
+    "columnar": ColumnarEncoder,
+    "graph": GraphEncoder,
+}
+
+
+def page_encoder(result_format: ResultFormat, keys: list[str]) -> RowsEncoder:
+    return ENCODERS[result_format](keys)
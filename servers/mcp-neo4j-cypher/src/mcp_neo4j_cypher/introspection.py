@@ -0,0 +1,258 @@
+import asyncio
+import logging
+from typing import Any, Iterable, Optional
+
+from neo4j import READ_ACCESS, AsyncDriver
+from neo4j.spatial import Point
+from neo4j.time import Date, DateTime, Duration, Time
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+LABELS_QUERY = "CALL db.labels() YIELD label RETURN label"
+
+RELATIONSHIP_TYPES_QUERY = (
+    "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType"
+)
+
+APOC_AVAILABLE_QUERY = """
+SHOW FUNCTIONS YIELD name
+WHERE name = 'apoc.meta.cypher.type'
+RETURN count(*) > 0 AS available
+"""
+
+INDEXES_QUERY = """
+SHOW INDEXES YIELD entityType, labelsOrTypes, properties
+WHERE entityType = 'NODE' AND labelsOrTypes IS NOT NULL
+RETURN labelsOrTypes, properties
+"""
+
+UNIQUE_CONSTRAINTS_QUERY = """
+SHOW CONSTRAINTS YIELD entityType, type, labelsOrTypes, properties
+WHERE entityType = 'NODE' AND (type CONTAINS 'UNIQUENESS' OR type = 'NODE_KEY')
+RETURN labelsOrTypes, properties
+"""
+
+# property types are computed server side, only one type per key is returned
+APOC_PROPERTIES_QUERY = """
+MATCH (n:{label})
+WITH n LIMIT $sample_size
+UNWIND keys(n) AS key
+RETURN key, head(collect(DISTINCT apoc.meta.cypher.type(n[key]))) AS type
+"""
+
+# labels of nodes without properties or relationships are still reported
+NODES_QUERY = """
+MATCH (n:{label})
+WITH n LIMIT 1
+RETURN count(n) > 0 AS found
+"""
+
+# one sample value per key is returned and typed by the client
+PROPERTIES_QUERY = """
+MATCH (n:{label})
+WITH n LIMIT $sample_size
+UNWIND keys(n) AS key
+RETURN key, head(collect(n[key])) AS value
+"""
+
+# relationships in both directions, like apoc.meta.data, outgoing ones are
+# preferred when a type connects the label to different labels
+RELATIONSHIPS_QUERY = """
+MATCH (n:{label})
+WITH n LIMIT $sample_size
+CALL (n) {{
+    MATCH (n)-[r]-(m)
+    RETURN r, m LIMIT $rels_per_node
+}}
+WITH type(r) AS type, startNode(r) = n AS outgoing,
+     [l IN labels(m) WHERE NOT l STARTS WITH '_'] AS others
+WHERE size(others) > 0
+WITH type, outgoing, others[0] AS other
+ORDER BY outgoing DESC
+RETURN type, head(collect(other)) AS target
+"""
+
+
+def _quote(name: str) -> str:
+    """Quote a label or relationship type for use in a Cypher pattern."""
+    return "`" + name.replace("`", "``") + "`"
+
+
+def _property_type(value: Any) -> str:
+    """Name the Cypher type of a sampled property value like `apoc.meta.cypher.type`."""
+    if isinstance(value, bool):
+        return "BOOLEAN"
+    if isinstance(value, int):
+        return "INTEGER"
+    if isinstance(value, float):
+        return "FLOAT"
+    if isinstance(value, str):
+        return "STRING"
+    if isinstance(value, (bytes, bytearray)):
+        return "BYTE_ARRAY"
+    if isinstance(value, DateTime):
+        return "LOCAL_DATE_TIME" if value.tzinfo is None else "DATE_TIME"
+    if isinstance(value, Date):
+        return "DATE"
+    if isinstance(value, Time):
+        return "LOCAL_TIME" if value.tzinfo is None else "TIME"
+    if isinstance(value, Duration):
+        return "DURATION"
+    if isinstance(value, Point):
+        return "POINT"
+    if isinstance(value, (list, tuple)):
+        if not value:
+            return "LIST"
+        return f"LIST OF {_property_type(value[0])}"
+    return type(value).__name__.upper()
+
+
+class SchemaIntrospector:
+    """
+    Builds the node schema of a database from bounded per-label samples.
+    Labels come from `db.labels()` and index information from `SHOW INDEXES` and
+    `SHOW CONSTRAINTS`, so no full store scan is needed. Labels are profiled
+    concurrently over up to `concurrency` sessions.
+    APOC is used to type property values server side when it is installed.
+    """
+
+    def __init__(
+        self,
+        neo4j_driver: AsyncDriver,
+        database: str = "neo4j",
+        *,
+        sample_size: int = 100,
+        rels_per_node: int = 10,
+        concurrency: int = 4,
+    ) -> None:
+        self.neo4j_driver = neo4j_driver
+        self.database = database
+        self.sample_size = sample_size
+        self.rels_per_node = rels_per_node
+        self.concurrency = concurrency
+        self._apoc_available: Optional[bool] = None
+
+    def _session(self):
+        return self.neo4j_driver.session(
+            database=self.database, default_access_mode=READ_ACCESS
+        )
+
+    async def _run(self, query: str, **params: Any) -> list[dict[str, Any]]:
+        async with self._session() as session:
+            result = await session.run(query, params)
+            return await result.data()
+
+    async def _has_apoc(self) -> bool:
+        if self._apoc_available is None:
+            try:
+                records = await self._run(APOC_AVAILABLE_QUERY)
+                self._apoc_available = bool(records and records[0]["available"])
+            except Exception as e:
+                logger.debug(f"Could not detect APOC, sampling without it: {e}")
+                self._apoc_available = False
+        return self._apoc_available
+
+    async def labels(self) -> list[str]:
+        records = await self._run(LABELS_QUERY)
+        return sorted(r["label"] for r in records if not r["label"].startswith("_"))
+
+    async def _indexed_properties(self, query: str) -> dict[str, set[str]]:
+        properties: dict[str, set[str]] = {}
+        for record in await self._run(query):
+            # composite indexes mark each of their properties as indexed
+            for label in record["labelsOrTypes"]:
+                properties.setdefault(label, set()).update(record["properties"])
+        return properties
+
+    async def _profile_label(
+        self,
+        label: str,
+        use_apoc: bool,
+        with_relationships: bool,
+        unique: set[str],
+        indexed: set[str],
+    ) -> Optional[dict[str, Any]]:
+        query = APOC_PROPERTIES_QUERY if use_apoc else PROPERTIES_QUERY
+        async with self._session() as session:
+            result = await session.run(
+                query.format(label=_quote(label)), sample_size=self.sample_size
+            )
+            property_records = await result.data()
+
+            relationship_records: list[dict[str, Any]] = []
+            if with_relationships:
+                result = await session.run(
+                    RELATIONSHIPS_QUERY.format(label=_quote(label)),
+                    sample_size=self.sample_size,
+                    rels_per_node=self.rels_per_node,
+                )
+                relationship_records = await result.data()
+
+            # none of the sampled nodes has properties or relationships to
+            # report, the label is kept if it still has nodes
+            if not property_records and not relationship_records:
+                result = await session.run(NODES_QUERY.format(label=_quote(label)))
+                records = await result.data()
+                if not (records and records[0]["found"]):
+                    return None
+
+        attributes = {}
+        for record in sorted(property_records, key=lambda r: r["key"]):
+            key = record["key"]
+            attribute = record["type"] if use_apoc else _property_type(record["value"])
+            if key in unique:
+                attribute += " unique"
+            if key in indexed:
+                attribute += " indexed"
+            attributes[key] = attribute
+
+        relationships = {
+            record["type"]: record["target"]
+            for record in sorted(relationship_records, key=lambda r: r["type"])
+        }
+
+        return {
+            "label": label,
+            "attributes": attributes,
+            "relationships": relationships,
+        }
+
+    async def introspect(
+        self, labels: Optional[Iterable[str]] = None
+    ) -> dict[str, Optional[dict[str, Any]]]:
+        """
+        Profile the given labels, or every label of the database when omitted.
+        Returns the schema entry of each label keyed by label name, labels without
+        any node map to `None`.
+        """
+
+        if labels is None:
+            labels = await self.labels()
+        else:
+            # internal labels are left out, as when listing every label
+            labels = sorted({label for label in labels if not label.startswith("_")})
+
+        use_apoc, relationship_types, unique, indexed = await asyncio.gather(
+            self._has_apoc(),
+            self._run(RELATIONSHIP_TYPES_QUERY),
+            self._indexed_properties(UNIQUE_CONSTRAINTS_QUERY),
+            self._indexed_properties(INDEXES_QUERY),
+        )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def profile(label: str) -> Optional[dict[str, Any]]:
+            async with semaphore:
+                return await self._profile_label(
+                    label,
+                    use_apoc,
+                    bool(relationship_types),
+                    unique.get(label, set()),
+                    indexed.get(label, set()),
+                )
+
+        entries = await asyncio.gather(*(profile(label) for label in labels))
+
+        logger.debug(f"Profiled {len(labels)} labels, APOC available: {use_apoc}")
+
+        return dict(zip(labels, entries))
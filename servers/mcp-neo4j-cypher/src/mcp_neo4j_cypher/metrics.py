@@ -0,0 +1,191 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+# latencies of tool calls, in seconds
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# sizes of results, in rows or bytes
+SIZE_BUCKETS = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+Sample = tuple[str, tuple[str, ...], float]
+
+M = TypeVar("M", bound="Metric")
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(str(v))}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, description: str, labels: tuple[str, ...] = ()
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.labels = labels
+
+    @abstractmethod
+    def samples(self) -> Iterator[Sample]:
+        """The samples of the metric as name suffix, label values and value."""
+
+    def label_names(self, suffix: str) -> tuple[str, ...]:
+        return self.labels
+
+
+class Counter(Metric):
+    """
+    A value that only goes up, per combination of label values. Its name ends
+    with `_total`.
+    """
+
+    kind = "counter"
+
+    def __init__(
+        self, name: str, description: str, labels: tuple[str, ...] = ()
+    ) -> None:
+        super().__init__(name, description, labels)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in list(self._values.items()):
+            yield "", labels, value
+
+
+class Histogram(Metric):
+    """
+    Counts observations in buckets of upper bounds, per combination of label
+    values. Observations are counted in their own bucket only and summed up
+    when the histogram is rendered, so that observing stays cheap.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS,
+    ) -> None:
+        super().__init__(name, description, labels)
+        self.buckets = tuple(buckets)
+        # per label values: the counts per bucket, the last one is +Inf, and the sum
+        self._values: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        entry = self._values.get(labels)
+        if entry is None:
+            entry = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1][0] += value
+
+    def count(self, *labels: str) -> int:
+        entry = self._values.get(labels)
+        return sum(entry[0]) if entry is not None else 0
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, (counts, total) in list(self._values.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, float("inf")), list(counts)):
+                cumulative += count
+                yield "_bucket", (*labels, _format_value(bound)), cumulative
+            yield "_sum", labels, total[0]
+            yield "_count", labels, cumulative
+
+    def label_names(self, suffix: str) -> tuple[str, ...]:
+        return (*self.labels, "le") if suffix == "_bucket" else self.labels
+
+
+class Gauge(Metric):
+    """A value read when the metrics are collected, from a callback."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: tuple[str, ...],
+        collect: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+        kind: Optional[str] = None,
+    ) -> None:
+        super().__init__(name, description, labels)
+        self.collect = collect
+        # a callback may also report a counter kept elsewhere
+        if kind is not None:
+            self.kind = kind
+
+    def samples(self) -> Iterator[Sample]:
+        for labels, value in self.collect():
+            yield "", labels, value
+
+
+class Registry:
+    """The metrics of a server, rendered in the Prometheus text format."""
+
+    def __init__(self, prefix: str = "") -> None:
+        self.prefix = prefix
+        self.metrics: list[Metric] = []
+
+    def register(self, metric: M) -> M:
+        metric.name = self.prefix + metric.name
+        self.metrics.append(metric)
+        return metric
+
+    def counter(
+        self, name: str, description: str, labels: tuple[str, ...] = ()
+    ) -> Counter:
+        return self.register(Counter(name, description, labels))
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DURATION_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, description, labels, buckets))
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        labels: tuple[str, ...],
+        collect: Callable[[], Iterable[tuple[tuple[str, ...], float]]],
+        kind: Optional[str] = None,
+    ) -> Gauge:
+        return self.register(Gauge(name, description, labels, collect, kind))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {_escape(metric.description)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                names = metric.label_names(suffix)
+                lines.append(
+                    f"{metric.name}{suffix}{_format_labels(names, labels)} "
+                    f"{_format_value(value)}"
+                )
+        return "\n".join(lines) + "\n"
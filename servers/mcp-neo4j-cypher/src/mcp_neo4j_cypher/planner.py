@@ -0,0 +1,145 @@
+import logging
+import re
+from collections import OrderedDict
+from typing import Any, Iterator, NamedTuple, Optional
+
+from neo4j import READ_ACCESS, WRITE_ACCESS, AsyncDriver
+
+from .cypher import normalize_query
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+# variable length relationships without an upper bound, as rendered in plan
+# details: -[*]-, -[r*2..]-, and quantified path patterns such as {1, *}
+_UNBOUNDED_RE = re.compile(r"\*\s*(?:\d*\s*\.\.\s*)?\]|\{\s*\d*\s*,\s*\*?\s*\}|\)[+*]")
+
+# a leading EXPLAIN or PROFILE is replaced when planning or profiling a query
+PLAN_PREFIX_RE = re.compile(r"^\s*(?:EXPLAIN|PROFILE)\b", re.IGNORECASE)
+
+# query types reported by the server, `r` is the only one that does not write
+READ_ONLY = "r"
+
+
+class QueryRejected(ValueError):
+    """Raised for a query that the tool it was sent to does not run."""
+
+
+class PlanSummary(NamedTuple):
+    query_type: Optional[str]
+    estimated_rows: float
+    cartesian_product: bool
+    unbounded_expansion: bool
+
+    @property
+    def writes(self) -> bool:
+        return self.query_type != READ_ONLY
+
+
+def plan_operators(plan: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """The operators of a plan or profile, depth first from the root."""
+    yield plan
+    for child in plan.get("children", []):
+        yield from plan_operators(child)
+
+
+def summarize_plan(query_type: Optional[str], plan: dict[str, Any]) -> PlanSummary:
+    """
+    Reduce an `EXPLAIN` plan to what the guard checks. The estimated rows are
+    the largest estimate of any operator, as intermediate results can be far
+    larger than the final one.
+    """
+
+    estimated_rows = 0.0
+    cartesian_product = False
+    unbounded_expansion = False
+    for operator in plan_operators(plan):
+        # operator types are suffixed with the runtime, as in `Expand(All)@neo4j`
+        operator_type = operator.get("operatorType", "").split("@")[0]
+        arguments = operator.get("args", {})
+        estimated_rows = max(estimated_rows, float(arguments.get("EstimatedRows", 0)))
+        if operator_type.startswith("CartesianProduct"):
+            cartesian_product = True
+        if operator_type.startswith(
+            ("VarLengthExpand", "Repeat", "ShortestPath", "StatefulShortestPath")
+        ) and _UNBOUNDED_RE.search(str(arguments.get("Details", ""))):
+            unbounded_expansion = True
+
+    return PlanSummary(
+        query_type, estimated_rows, cartesian_product, unbounded_expansion
+    )
+
+
+class QueryGuard:
+    """
+    Plans queries with `EXPLAIN` before they run, to classify them as reads or
+    writes from the plan and to reject the ones that look too expensive: more
+    than `max_estimated_rows` rows in any step of the plan, cartesian products
+    or variable length expansions without an upper bound.
+    Plan summaries are cached per normalized query, up to `cache_size` queries.
+    """
+
+    def __init__(
+        self,
+        neo4j_driver: AsyncDriver,
+        database: str = "neo4j",
+        *,
+        max_estimated_rows: Optional[int] = None,
+        reject_cartesian_products: bool = False,
+        reject_unbounded_expansions: bool = False,
+        cache_size: int = 256,
+    ) -> None:
+        self.neo4j_driver = neo4j_driver
+        self.database = database
+        self.max_estimated_rows = max_estimated_rows
+        self.reject_cartesian_products = reject_cartesian_products
+        self.reject_unbounded_expansions = reject_unbounded_expansions
+        self.cache_size = cache_size
+        self._plans: OrderedDict[str, PlanSummary] = OrderedDict()
+
+    async def plan(
+        self, query: str, params: Optional[dict[str, Any]] = None, write: bool = False
+    ) -> PlanSummary:
+        key = normalize_query(query)
+        summary = self._plans.get(key)
+        if summary is not None:
+            self._plans.move_to_end(key)
+            return summary
+
+        async with self.neo4j_driver.session(
+            database=self.database,
+            default_access_mode=WRITE_ACCESS if write else READ_ACCESS,
+        ) as session:
+            result = await session.run(
+                "EXPLAIN " + PLAN_PREFIX_RE.sub("", query, count=1), params
+            )
+            result_summary = await result.consume()
+
+        summary = summarize_plan(result_summary.query_type, result_summary.plan or {})
+        logger.debug(f"Planned query: {summary}")
+
+        self._plans[key] = summary
+        while len(self._plans) > self.cache_size:
+            self._plans.popitem(last=False)
+        return summary
+
+    def check(self, summary: PlanSummary) -> None:
+        """Raise a `QueryRejected` if the planned query exceeds the limits of the guard."""
+
+        if (
+            self.max_estimated_rows is not None
+            and summary.estimated_rows > self.max_estimated_rows
+        ):
+            raise QueryRejected(
+                f"Query rejected: the planner estimates {summary.estimated_rows:,.0f} "
+                f"rows, more than the limit of {self.max_estimated_rows:,}"
+            )
+        if self.reject_cartesian_products and summary.cartesian_product:
+            raise QueryRejected(
+                "Query rejected: the plan contains a cartesian product, "
+                "connect the patterns or match them in separate queries"
+            )
+        if self.reject_unbounded_expansions and summary.unbounded_expansion:
+            raise QueryRejected(
+                "Query rejected: the plan contains a variable length relationship "
+                "without an upper bound, such as -[*]- or -[*2..]-"
+            )
@@ -0,0 +1,34 @@
+from typing import Any
+
+from neo4j import AsyncDriver
+
+
+def pool_status(neo4j_driver: AsyncDriver) -> dict[str, Any]:
+    """
+    Report the connections of the driver pool per server address.
+    The driver has no public API for this, so its pool is inspected directly and
+    an empty report is returned if its internals change.
+    """
+
+    pool = getattr(neo4j_driver, "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return {"addresses": {}}
+
+    addresses = {}
+    # copied first, the pool may change while the report is built
+    for address, address_connections in list(connections.items()):
+        address_connections = list(address_connections)
+        in_use = sum(1 for c in address_connections if c.in_use)
+        addresses[str(address)] = {
+            "in_use": in_use,
+            "idle": len(address_connections) - in_use,
+        }
+
+    pool_config = getattr(pool, "pool_config", None)
+    return {
+        "max_connection_pool_size": getattr(
+            pool_config, "max_connection_pool_size", None
+        ),
+        "addresses": addresses,
+    }
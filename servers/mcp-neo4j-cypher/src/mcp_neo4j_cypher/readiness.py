@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import random
+from typing import Optional
+
+from neo4j import AsyncDriver
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+
+class Readiness:
+    """
+    Checks that Neo4j is reachable in the background, so the server can answer
+    the client while the database starts. The check is retried up to `attempts`
+    times with exponential backoff from `initial_delay` to `max_delay` seconds,
+    with jitter. Callers wait for it only when they need the database, and a
+    failed check is run again by the next caller.
+    """
+
+    def __init__(
+        self,
+        neo4j_driver: AsyncDriver,
+        *,
+        attempts: int = 5,
+        initial_delay: float = 0.5,
+        max_delay: float = 8.0,
+    ) -> None:
+        self.neo4j_driver = neo4j_driver
+        self.attempts = attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        return (
+            self._task is not None
+            and self._task.done()
+            and not self._task.cancelled()
+            and self._task.exception() is None
+        )
+
+    def start(self) -> asyncio.Task:
+        """Start the check unless it is running or has succeeded."""
+        if self._task is None or (self._task.done() and not self.ready):
+            self._task = asyncio.create_task(self._check())
+            self._task.add_done_callback(self._done)
+        return self._task
+
+    async def wait(self) -> None:
+        """Wait until Neo4j is reachable, raises the last error if it is not."""
+        if not self.ready:
+            # shield the check so a cancelled caller does not cancel it for the others
+            await asyncio.shield(self.start())
+
+    async def _check(self) -> None:
+        delay = self.initial_delay
+        for attempt in range(1, self.attempts + 1):
+            try:
+                await self.neo4j_driver.verify_connectivity()
+                logger.info("Connected to Neo4j")
+                return
+            except Exception as e:
+                if attempt == self.attempts:
+                    raise
+                # half of the delay is fixed, the other half random
+                sleep = delay / 2 + random.uniform(0, delay / 2)
+                logger.warning(
+                    f"Neo4j is not reachable (attempt {attempt}/{self.attempts}), "
+                    f"retrying in {sleep:.1f} seconds: {e}"
+                )
+                await asyncio.sleep(sleep)
+                delay = min(delay * 2, self.max_delay)
+
+    @staticmethod
+    def _done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Could not connect to Neo4j: {task.exception()}")
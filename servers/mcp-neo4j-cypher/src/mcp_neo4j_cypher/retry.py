@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Literal, TypeVar
+
+from neo4j.exceptions import DriverError, Neo4jError
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+Kind = Literal["read", "write"]
+
+T = TypeVar("T")
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Whether a transaction that failed with the error may succeed when run again:
+    deadlocks, lock timeouts, leader switches and lost connections, but not
+    syntax, constraint or timeout errors, nor a commit whose outcome is unknown.
+    """
+
+    if isinstance(error, (Neo4jError, DriverError)):
+        return error.is_retryable()
+    return False
+
+
+def error_name(error: BaseException) -> str:
+    """The Neo4j status code of the error, or its class for driver errors."""
+
+    code = getattr(error, "code", None)
+    return code if isinstance(code, str) and code else type(error).__name__
+
+
+class RetryPolicy:
+    """
+    Runs a transaction again when it fails with a transient error, up to
+    `max_retries` times, with exponential backoff from `initial_delay` to
+    `max_delay` seconds and jitter. No retry starts later than `deadline`
+    seconds after the first attempt. Other errors are raised at once.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 3,
+        initial_delay: float = 0.1,
+        max_delay: float = 2.0,
+        deadline: float = 10.0,
+    ) -> None:
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        # per kind and error name
+        self.retries: dict[tuple[Kind, str], int] = {}
+        # transient failures returned after the last retry, per kind
+        self.exhausted: dict[Kind, int] = {}
+
+    async def run(self, kind: Kind, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await `fn()` until it succeeds, raises the last error if it does not."""
+
+        started = time.monotonic()
+        delay = self.initial_delay
+        attempt = 0
+        while True:
+            try:
+                return await fn()
+            except Exception as e:
+                if not is_transient(e):
+                    raise
+                # half of the delay is fixed, the other half random
+                sleep = delay / 2 + random.uniform(0, delay / 2)
+                if (
+                    attempt == self.max_retries
+                    or time.monotonic() - started + sleep > self.deadline
+                ):
+                    if self.max_retries:
+                        self.exhausted[kind] = self.exhausted.get(kind, 0) + 1
+                    raise
+                attempt += 1
+                key = (kind, error_name(e))
+                self.retries[key] = self.retries.get(key, 0) + 1
+                logger.warning(
+                    f"Transient error in a {kind} transaction (retry {attempt}/"
+                    f"{self.max_retries} in {sleep:.2f} seconds): {e}"
+                )
+                await asyncio.sleep(sleep)
+                delay = min(delay * 2, self.max_delay)
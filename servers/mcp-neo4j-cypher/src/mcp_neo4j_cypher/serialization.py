@@ -0,0 +1,85 @@
+# Kept in sync with mcp_neo4j_memory/serialization.py of the mcp-neo4j-memory server,
+# checked by tests/unit/test_serialization.py.
+
+import base64
+from typing import Any
+
+import orjson
+from neo4j import Record
+from neo4j.graph import Node, Path, Relationship
+from neo4j.spatial import Point
+from neo4j.time import Date, DateTime, Duration, Time
+
+
+def _node(node: Node) -> dict[str, Any]:
+    return {
+        "element_id": node.element_id,
+        "labels": sorted(node.labels),
+        "properties": dict(node),
+    }
+
+
+def _relationship(relationship: Relationship) -> dict[str, Any]:
+    return {
+        "element_id": relationship.element_id,
+        "type": relationship.type,
+        "start": relationship.start_node.element_id,
+        "end": relationship.end_node.element_id,
+        "properties": dict(relationship),
+    }
+
+
+def _path(path: Path) -> dict[str, Any]:
+    nodes = path.nodes
+    return {
+        "start": nodes[0],
+        "end": nodes[-1],
+        "segments": [
+            {"start": nodes[i], "relationship": relationship, "end": nodes[i + 1]}
+            for i, relationship in enumerate(path.relationships)
+        ],
+        "length": len(path),
+    }
+
+
+def _point(point: Point) -> dict[str, Any]:
+    value = {"srid": point.srid, "x": point[0], "y": point[1]}
+    if len(point) > 2:
+        value["z"] = point[2]
+    return value
+
+
+def _default(value: Any) -> Any:
+    """Convert the neo4j driver types that the JSON backend does not know."""
+    if isinstance(value, Node):
+        return _node(value)
+    if isinstance(value, Relationship):
+        return _relationship(value)
+    if isinstance(value, Path):
+        return _path(value)
+    if isinstance(value, (Date, DateTime, Time, Duration)):
+        return value.iso_format()
+    if isinstance(value, Point):
+        return _point(value)
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, Record):
+        return dict(value.items())
+    return str(value)
+
+
+def dumpb(value: Any, *, indent: bool = False) -> bytes:
+    """Encode a value, which may contain neo4j driver types, to UTF-8 JSON."""
+    return orjson.dumps(
+        value, default=_default, option=orjson.OPT_INDENT_2 if indent else None
+    )
+
+
+def dumps(value: Any, *, indent: bool = False) -> str:
+    """Encode a value, which may contain neo4j driver types, to a JSON string."""
+    return dumpb(value, indent=indent).decode()
+
+
+def dump_record(record: Record) -> bytes:
+    """Encode a record as a JSON object keyed by column name."""
+    return dumpb(dict(record.items()))
@@ -1,173 +1,1056 @@
-import json
+import asyncio
+import functools
 import logging
-import re
-import sys
 import time
-from typing import Any, Optional
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Literal, Optional, TypeVar
 
 import mcp.types as types
-from mcp.server.fastmcp import FastMCP
+import orjson
+from mcp.server.fastmcp import Context, FastMCP
 from neo4j import (
+    READ_ACCESS,
     AsyncDriver,
     AsyncGraphDatabase,
-    AsyncResult,
-    AsyncTransaction,
-    GraphDatabase,
 )
-from neo4j.exceptions import DatabaseError
-from pydantic import Field
+from neo4j.api import AsyncBookmarkManager
+from pydantic import BaseModel, Field
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from . import bulk
+from .admission import Admission, Kind, ServerBusy
+from .bookmarks import SessionBookmarks, as_bookmarks, current_bookmarks
+from .bulk import BulkMode
+from .cache import (
+    ResultCache,
+    SchemaCache,
+    has_updates,
+    is_schema_change,
+    params_key,
+)
+from .cancellation import Terminator
+from .coalescer import WriteCoalescer, is_coalescible
+from .cursors import Cursor, CursorRegistry
+from .cypher import (
+    is_write_query,
+    normalize_query,
+    parameterize,
+    read_scope,
+    write_scope,
+)
+from .databases import Databases, PerDatabase
+from .formats import ResultFormat
+from .introspection import SchemaIntrospector
+from .metrics import SIZE_BUCKETS, Registry
+from .planner import QueryGuard, QueryRejected
+from .pool import pool_status as _pool_status
+from .readiness import Readiness
+from .retry import RetryPolicy
+from .serialization import dumps
+from .singleflight import SingleFlight
+from .slowlog import Order, SlowQueryLog
 
 logger = logging.getLogger("mcp_neo4j_cypher")
 
+Transport = Literal["stdio", "http", "sse"]
 
-def healthcheck(db_url: str, username: str, password: str, database: str) -> None:
-    """
-    Confirm that Neo4j is running before continuing.
-    Creates a a sync Neo4j driver instance for checking connection and closes it after connection is established.
-    """
+# names of the transports in FastMCP
+TRANSPORTS = {"stdio": "stdio", "http": "streamable-http", "sse": "sse"}
 
-    print("Confirming Neo4j is running...", file=sys.stderr)
-    sync_driver = GraphDatabase.driver(
-        db_url,
-        auth=(
-            username,
-            password,
-        ),
+
+DATABASE_DESCRIPTION = (
+    "The database to run the query on, the server default if not set."
+)
+
+
+class BatchQuery(BaseModel):
+    query: str = Field(..., description="The Cypher query to execute.")
+    params: Optional[dict[str, Any]] = Field(
+        None, description="The parameters to pass to the Cypher query."
     )
-    attempts = 0
-    success = False
-    print("\nWaiting for Neo4j to Start...\n", file=sys.stderr)
-    time.sleep(3)
-    ex = DatabaseError()
-    while not success and attempts < 3:
-        try:
-            with sync_driver.session(database=database) as session:
-                session.run("RETURN 1")
-            success = True
-            sync_driver.close()
-        except Exception as e:
-            ex = e
-            attempts += 1
-            print(
-                f"failed connection {attempts} | waiting {(1 + attempts) * 2} seconds...",
-                file=sys.stderr,
+    database: Optional[str] = Field(None, description=DATABASE_DESCRIPTION)
+
+
+TIMEOUT_DESCRIPTION = (
+    "Seconds after which the query is terminated, at most the server timeout."
+)
+
+N = TypeVar("N", int, float)
+
+
+def _budget(limit: Optional[N], server_limit: Optional[N]) -> Optional[N]:
+    """Combine a per-call limit with the server-wide one, the lowest wins."""
+    limits = [value for value in (limit, server_limit) if value is not None]
+    return min(limits) if limits else None
+
+
+def create_mcp_server(
+    neo4j_driver: AsyncDriver,
+    database: str = "neo4j",
+    *,
+    databases: Optional[list[str]] = None,
+    schema_cache_ttl: float = 60.0,
+    schema_sample_size: int = 100,
+    page_size: int = 100,
+    fetch_size: int = 1000,
+    cursor_idle_timeout: float = 300.0,
+    max_open_cursors: int = 16,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    result_cache_size: int = 0,
+    result_cache_ttl: float = 60.0,
+    batch_concurrency: int = 4,
+    bulk_concurrency: int = 4,
+    import_dir: Optional[str] = None,
+    coalesce_writes: bool = False,
+    coalesce_window: float = 0.005,
+    coalesce_max_batch: int = 32,
+    explain_queries: bool = False,
+    max_estimated_rows: Optional[int] = None,
+    reject_cartesian_products: bool = False,
+    reject_unbounded_expansions: bool = False,
+    causal_consistency: bool = True,
+    query_timeout: Optional[float] = None,
+    max_concurrent_reads: Optional[int] = None,
+    max_concurrent_writes: Optional[int] = None,
+    max_queued_calls: int = 64,
+    slow_query_threshold: Optional[float] = None,
+    slow_query_log: Optional[str] = None,
+    slow_query_sample_rate: float = 0.0,
+    autoparameterize: bool = False,
+    max_retries: int = 3,
+    retry_deadline: float = 10.0,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+) -> FastMCP:
+    readiness = Readiness(neo4j_driver)
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+        # checks the connection while the client initializes the session
+        readiness.start()
+        yield
+
+    # FastMCP only accepts localhost Host headers when it is built for localhost,
+    # the host cannot be changed once it is built
+    mcp: FastMCP = FastMCP(
+        "mcp-neo4j-cypher",
+        dependencies=["neo4j", "pydantic"],
+        lifespan=lifespan,
+        host=host,
+        port=port,
+    )
+
+    default_page_size = page_size
+    default_max_rows = max_rows
+    default_max_bytes = max_bytes
+    cursors = CursorRegistry(
+        idle_timeout=cursor_idle_timeout, max_open=max_open_cursors
+    )
+
+    # reads run in sessions with read access, which a routing driver (neo4j://)
+    # sends to followers and read replicas; state bound to a database is created
+    # on its first use
+    allowed_databases = Databases(database, databases)
+    database = allowed_databases.default
+    schema_caches = PerDatabase(lambda _: SchemaCache(ttl=schema_cache_ttl))
+    result_cache = (
+        ResultCache(result_cache_size, ttl=result_cache_ttl)
+        if result_cache_size > 0
+        else None
+    )
+    introspectors = PerDatabase(
+        lambda name: SchemaIntrospector(
+            neo4j_driver, name, sample_size=schema_sample_size
+        )
+    )
+
+    # any limit on the plan implies planning the queries
+    guards = (
+        PerDatabase(
+            lambda name: QueryGuard(
+                neo4j_driver,
+                name,
+                max_estimated_rows=max_estimated_rows,
+                reject_cartesian_products=reject_cartesian_products,
+                reject_unbounded_expansions=reject_unbounded_expansions,
+            )
+        )
+        if explain_queries
+        or max_estimated_rows is not None
+        or reject_cartesian_products
+        or reject_unbounded_expansions
+        else None
+    )
+
+    import_path = Path(import_dir) if import_dir is not None else None
+
+    coalescers = (
+        PerDatabase(
+            lambda name: WriteCoalescer(
+                neo4j_driver,
+                name,
+                window=coalesce_window,
+                max_batch=coalesce_max_batch,
+                timeout=query_timeout,
             )
-            print(f"Error: {e}", file=sys.stderr)
-            time.sleep((1 + attempts) * 2)
-    if not success:
-        sync_driver.close()
-        raise ex
+        )
+        if coalesce_writes
+        else None
+    )
 
+    # shared by all batches, so that they cannot exhaust the connection pool
+    batch_semaphore = asyncio.Semaphore(batch_concurrency)
 
-async def _read(tx: AsyncTransaction, query: str, params: dict[str, Any]) -> str:
-    raw_results = await tx.run(query, params)
-    eager_results = await raw_results.to_eager_result()
+    session_bookmarks = SessionBookmarks() if causal_consistency else None
+    terminator = Terminator(neo4j_driver)
 
-    return json.dumps([r.data() for r in eager_results.records], default=str)
+    # tool calls wait for a slot before they take connections from the pool
+    admission = (
+        Admission(max_concurrent_reads, max_concurrent_writes, max_queued_calls)
+        if max_concurrent_reads is not None or max_concurrent_writes is not None
+        else None
+    )
 
+    # transient failures are retried here instead of by the client
+    retry_policy = RetryPolicy(max_retries=max_retries, deadline=retry_deadline)
 
-async def _write(
-    tx: AsyncTransaction, query: str, params: dict[str, Any]
-) -> AsyncResult:
-    return await tx.run(query, params)
+    slow_log = (
+        SlowQueryLog(
+            neo4j_driver,
+            slow_query_threshold,
+            slow_query_log,
+            sample_rate=slow_query_sample_rate,
+            profile_timeout=query_timeout,
+        )
+        if slow_query_threshold is not None
+        else None
+    )
 
+    metrics = Registry("mcp_neo4j_")
+    tool_duration = metrics.histogram(
+        "tool_duration_seconds", "Duration of tool calls", ("tool", "database")
+    )
+    tool_errors = metrics.counter(
+        "tool_errors_total",
+        "Tool calls that raised or returned an error",
+        ("tool", "database"),
+    )
+    tool_response_bytes = metrics.histogram(
+        "tool_response_bytes",
+        "Bytes of text returned by tool calls",
+        ("tool", "database"),
+        SIZE_BUCKETS,
+    )
+    rows_returned = metrics.histogram(
+        "rows_returned",
+        "Records returned per page of a read",
+        ("database",),
+        SIZE_BUCKETS,
+    )
+    metrics.gauge(
+        "pool_connections",
+        "Connections of the driver pool",
+        ("address", "state"),
+        lambda: [
+            ((address, state), connections[state])
+            for address, connections in _pool_status(neo4j_driver)["addresses"].items()
+            for state in ("in_use", "idle")
+        ],
+    )
+    if result_cache is not None:
+        for name in ("hits", "misses", "evictions", "invalidations"):
+            metrics.gauge(
+                f"result_cache_{name}_total",
+                f"Result cache {name}",
+                (),
+                lambda name=name: [((), result_cache.stats()[name])],
+                kind="counter",
+            )
+        metrics.gauge(
+            "result_cache_bytes",
+            "Bytes of results in the result cache",
+            (),
+            lambda: [((), result_cache.bytes)],
+        )
 
-def _is_write_query(query: str) -> bool:
-    """Check if the query is a write query."""
-    return (
-        re.search(r"\b(MERGE|CREATE|SET|DELETE|REMOVE|ADD)\b", query, re.IGNORECASE)
-        is not None
+    metrics.gauge(
+        "retries_total",
+        "Transactions run again after a transient error",
+        ("kind", "error"),
+        lambda: list(retry_policy.retries.items()),
+        kind="counter",
+    )
+    metrics.gauge(
+        "retries_exhausted_total",
+        "Transient errors returned after the last retry",
+        ("kind",),
+        lambda: [((kind,), n) for kind, n in retry_policy.exhausted.items()],
+        kind="counter",
     )
 
+    if slow_log is not None:
+        metrics.gauge(
+            "slow_queries_total",
+            "Queries that took longer than the slow query threshold",
+            (),
+            lambda: [((), slow_log.recorded)],
+            kind="counter",
+        )
 
-def create_mcp_server(neo4j_driver: AsyncDriver, database: str = "neo4j") -> FastMCP:
-    mcp: FastMCP = FastMCP("mcp-neo4j-cypher", dependencies=["neo4j", "pydantic"])
+    if admission is not None:
+        gates = admission.gates
+        for name, description, kind in (
+            ("in_flight", "Calls running", "gauge"),
+            ("queued", "Calls waiting for a slot", "gauge"),
+            ("admitted", "Calls given a slot", "counter"),
+            ("rejected", "Calls rejected as busy", "counter"),
+            ("wait_seconds", "Seconds calls waited for a slot", "counter"),
+        ):
+            metrics.gauge(
+                f"admission_{name}_total" if kind == "counter" else f"admission_{name}",
+                description,
+                ("kind",),
+                lambda name=name: [((k,), getattr(g, name)) for k, g in gates.items()],
+                kind=kind,
+            )
+
+    # identical requests in flight share one execution, unless a write happened
+    # since it started
+    flights = SingleFlight()
+    writes = 0
+
+    def _client(ctx: Context) -> Optional[Any]:
+        """The client session of a tool call."""
+
+        try:
+            return ctx.session
+        except ValueError:
+            # the tool is called directly, outside of a client request
+            return None
+
+    def _bookmark_manager(ctx: Context) -> Optional[AsyncBookmarkManager]:
+        """The bookmark manager of the client session of a tool call."""
+
+        if session_bookmarks is None:
+            return None
+        return session_bookmarks.get(_client(ctx))
+
+    def _admitted(
+        kind: Kind, tool: Callable[..., Awaitable[list[types.TextContent]]]
+    ) -> Callable[..., Awaitable[list[types.TextContent]]]:
+        """Run the calls of a tool in the slots of their kind."""
+
+        if admission is None:
+            return tool
+
+        @functools.wraps(tool)
+        async def admitted(ctx: Context, **arguments: Any) -> list[types.TextContent]:
+            try:
+                async with admission.slot(kind, _client(ctx)):
+                    return await tool(ctx, **arguments)
+            except ServerBusy as e:
+                logger.warning(f"Rejected {tool.__name__} call: {e}")
+                return [types.TextContent(type="text", text=f"Error: {e}")]
+
+        return admitted
+
+    def _instrumented(
+        tool: Callable[..., Awaitable[list[types.TextContent]]],
+    ) -> Callable[..., Awaitable[list[types.TextContent]]]:
+        """Record the duration, errors and response size of the calls of a tool."""
 
-    async def get_neo4j_schema() -> list[types.TextContent]:
+        name = tool.__name__
+
+        @functools.wraps(tool)
+        async def instrumented(
+            ctx: Context, **arguments: Any
+        ) -> list[types.TextContent]:
+            # unknown databases are rejected, they are not kept as label values
+            database = arguments.get("database") or allowed_databases.default
+            if database.lower() not in allowed_databases.allowed:
+                database = ""
+            started = time.perf_counter()
+            try:
+                content = await tool(ctx, **arguments)
+            except Exception:
+                tool_errors.inc(name, database)
+                raise
+            finally:
+                tool_duration.observe(time.perf_counter() - started, name, database)
+
+            if content and content[0].text.startswith("Error"):
+                tool_errors.inc(name, database)
+            tool_response_bytes.observe(
+                sum(len(c.text.encode()) for c in content), name, database
+            )
+            return content
+
+        return instrumented
+
+    async def get_neo4j_schema(
+        ctx: Context,
+        labels: Optional[list[str]] = Field(
+            None,
+            description="Only re-profile these labels, the rest of the schema is served from cache.",
+        ),
+        database: Optional[str] = Field(
+            None, description="The database to describe, the server default if not set."
+        ),
+    ) -> list[types.TextContent]:
         """List all node, their attributes and their relationships to other nodes in the neo4j database.
-        If this fails with a message that includes "Neo.ClientError.Procedure.ProcedureNotFound"
-        suggest that the user install and enable the APOC plugin.
+        The schema is built from a sample of the nodes of each label.
         """
 
-        get_schema_query = """
-call apoc.meta.data() yield label, property, type, other, unique, index, elementType
-where elementType = 'node' and not label starts with '_'
-with label, 
-    collect(case when type <> 'RELATIONSHIP' then [property, type + case when unique then " unique" else "" end + case when index then " indexed" else "" end] end) as attributes,
-    collect(case when type = 'RELATIONSHIP' then [property, head(other)] end) as relationships
-RETURN label, apoc.map.fromPairs(attributes) as attributes, apoc.map.fromPairs(relationships) as relationships
-"""
+        database = allowed_databases.resolve(database)
+        introspector = introspectors[database]
+        schema_cache = schema_caches[database]
+
+        async def load() -> dict[str, dict[str, Any]]:
+            entries = await introspector.introspect()
+            return {
+                label: entry for label, entry in entries.items() if entry is not None
+            }
 
         try:
-            async with neo4j_driver.session(database=database) as session:
-                results_json_str = await session.execute_read(
-                    _read, get_schema_query, dict()
+            await readiness.wait()
+
+            schema = None
+            # without a cached schema the labels are profiled with all the others
+            if labels and schema_cache.fresh():
+                labels = sorted(set(labels))
+                entries, _ = await flights.do(
+                    ("labels", database, tuple(labels), writes),
+                    lambda: introspector.introspect(labels),
                 )
+                schema = schema_cache.update(entries)
+            if schema is None:
+                schema = await schema_cache.get(load)
+
+            results_json_str = dumps([schema[label] for label in sorted(schema)])
 
-                logger.debug(f"Read query returned {len(results_json_str)} rows")
+            logger.debug(f"Schema query returned {len(results_json_str)} bytes")
 
-                return [types.TextContent(type="text", text=results_json_str)]
+            return [types.TextContent(type="text", text=results_json_str)]
 
         except Exception as e:
             logger.error(f"Database error retrieving schema: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
 
+    async def _open_cursor(
+        query: str,
+        params: Optional[dict[str, Any]],
+        database: str,
+        bookmarks: frozenset[str],
+        result_format: ResultFormat,
+        max_rows: Optional[int],
+        max_bytes: Optional[int],
+        timeout: Optional[float],
+        metadata: dict[str, str],
+    ) -> Cursor:
+        # reads wait for the bookmarks without adding their own to the manager
+        session = neo4j_driver.session(
+            database=database,
+            default_access_mode=READ_ACCESS,
+            fetch_size=fetch_size,
+            bookmarks=as_bookmarks(bookmarks),
+        )
+        if autoparameterize:
+            # queries that differ only in their literals share a cached plan
+            query, params = parameterize(query, params)
+        try:
+            # the timeout bounds the transaction, including the pages read later
+            tx = await session.begin_transaction(metadata=metadata, timeout=timeout)
+            result = await tx.run(query, params)
+            keys = await result.keys()
+        except BaseException:
+            await session.close()
+            raise
+        return Cursor(
+            session,
+            tx,
+            result,
+            keys=list(keys),
+            result_format=result_format,
+            max_rows=_budget(max_rows, default_max_rows),
+            max_bytes=_budget(max_bytes, default_max_bytes),
+            database=database,
+            metadata=metadata,
+        )
+
+    async def _read_page(
+        cursor: Cursor, size: int, token: Optional[str] = None
+    ) -> list[types.TextContent]:
+        """Read the next page of a cursor, registering it if more records remain."""
+
+        encoder = cursor.encoder()
+        try:
+            rows, has_more, exhausted_budget = await cursor.fetch(size, encoder)
+        except BaseException:
+            if token is None:
+                await cursor.close()
+            else:
+                await cursors.close(token)
+            raise
+
+        results_json_str = encoder.page().decode()
+
+        logger.debug(f"Read query returned {rows} rows")
+        rows_returned.observe(rows, cursor.database or database)
+
+        content = [types.TextContent(type="text", text=results_json_str)]
+
+        if not has_more:
+            # stops pulling records and discards the rest of the result
+            if token is None:
+                await cursor.close()
+            else:
+                await cursors.close(token)
+
+            if exhausted_budget is not None:
+                content.append(
+                    types.TextContent(
+                        type="text",
+                        text=dumps(
+                            {
+                                "truncated": True,
+                                "reason": exhausted_budget,
+                                "rows": cursor.rows,
+                            }
+                        ),
+                    )
+                )
+            return content
+
+        if token is None:
+            token = await cursors.register(cursor)
+
+        content.append(
+            types.TextContent(
+                type="text",
+                text=dumps(
+                    {"continuation_token": token, "rows": cursor.rows, "has_more": True}
+                ),
+            )
+        )
+        return content
+
+    async def _check_read(
+        query: str, params: Optional[dict[str, Any]], database: str
+    ) -> None:
+        """Raise a `QueryRejected` if the query may write or is rejected by the guard."""
+
+        # rejected without waiting for the database
+        if is_write_query(query):
+            raise QueryRejected("Only MATCH queries are allowed for read-query")
+
+        await readiness.wait()
+
+        if guards is not None:
+            guard = guards[database]
+            plan = await guard.plan(query, params)
+            if plan.writes:
+                raise QueryRejected("Only MATCH queries are allowed for read-query")
+            guard.check(plan)
+
+    async def _read(
+        query: str,
+        params: Optional[dict[str, Any]],
+        database: str,
+        bookmarks: frozenset[str],
+        page_size: Optional[int],
+        max_rows: Optional[int],
+        max_bytes: Optional[int],
+        result_format: ResultFormat,
+        timeout: Optional[float],
+    ) -> list[types.TextContent]:
+        """Read the first page of a checked query, from the result cache if possible."""
+
+        page_size = page_size or default_page_size
+        timeout = _budget(timeout, query_timeout)
+        # results are shared between callers that wrote the same transactions,
+        # a caller never sees a result that misses one of its writes
+        key = (
+            database,
+            bookmarks,
+            normalize_query(query),
+            params_key(params),
+            page_size,
+            _budget(max_rows, default_max_rows),
+            _budget(max_bytes, default_max_bytes),
+            result_format,
+            timeout,
+        )
+
+        if result_cache is not None:
+            cached = result_cache.get(key)
+            if cached is not None:
+                return [types.TextContent(type="text", text=text) for text in cached]
+
+        async def execute() -> tuple[list[types.TextContent], bool]:
+            generation = result_cache.generation if result_cache is not None else None
+            started = time.perf_counter()
+            async with terminator.cancellable(database, READ_ACCESS) as metadata:
+                # nothing was returned yet, the query can be run again
+                async def first_page() -> tuple[Cursor, list[types.TextContent]]:
+                    cursor = await _open_cursor(
+                        query,
+                        params,
+                        database,
+                        bookmarks,
+                        result_format,
+                        max_rows,
+                        max_bytes,
+                        timeout,
+                        metadata,
+                    )
+                    async with cursor.lock:
+                        return cursor, await _read_page(cursor, page_size)
+
+                cursor, content = await retry_policy.run("read", first_page)
+
+            if slow_log is not None:
+                slow_log.record(
+                    "read",
+                    query,
+                    params,
+                    database,
+                    time.perf_counter() - started,
+                    cursor.rows,
+                    cursor.bytes,
+                )
+
+            # only results read in full fit in the cache, open cursors cannot
+            if result_cache is not None and cursor.closed:
+                texts = [c.text for c in content]
+                result_cache.put(
+                    key,
+                    texts,
+                    sum(len(text.encode()) for text in texts),
+                    read_scope(query),
+                    generation,
+                )
+            return content, cursor.closed
+
+        (content, complete), owner = await flights.do(("read", key, writes), execute)
+        if not owner and not complete:
+            # the continuation token belongs to the caller that ran the query
+            content, _ = await execute()
+        return content
+
     async def read_neo4j_cypher(
+        ctx: Context,
         query: str = Field(..., description="The Cypher query to execute."),
         params: Optional[dict[str, Any]] = Field(
             None, description="The parameters to pass to the Cypher query."
         ),
+        page_size: Optional[int] = Field(
+            None, description="The maximum number of records to return.", gt=0
+        ),
+        max_rows: Optional[int] = Field(
+            None,
+            description="Stop reading the result after this many records in total.",
+            gt=0,
+        ),
+        max_bytes: Optional[int] = Field(
+            None,
+            description="Stop reading the result after this many bytes of JSON in total.",
+            gt=0,
+        ),
+        format: ResultFormat = Field(
+            "rows",
+            description=(
+                "The shape of the result: `rows` is a list of objects, `columnar` lists "
+                "the columns once followed by an array of values per row, `graph` "
+                "returns deduplicated nodes and relationships referenced from the rows."
+            ),
+        ),
+        database: Optional[str] = Field(None, description=DATABASE_DESCRIPTION),
+        timeout: Optional[float] = Field(None, description=TIMEOUT_DESCRIPTION, gt=0),
     ) -> list[types.TextContent]:
-        """Execute a read Cypher query on the neo4j database."""
+        """Execute a read Cypher query on the neo4j database.
+        If more records are available, a second result holds a `continuation_token`
+        that can be passed to `fetch_more` to read the next page.
+        If `max_rows` or `max_bytes` is reached, the rest of the result is discarded
+        and a second result reports `truncated`.
+        """
 
-        if _is_write_query(query):
-            raise ValueError("Only MATCH queries are allowed for read-query")
+        database = allowed_databases.resolve(database)
 
         try:
-            async with neo4j_driver.session(database=database) as session:
-                results_json_str = await session.execute_read(_read, query, params)
-
-                logger.debug(f"Read query returned {len(results_json_str)} rows")
-
-                return [types.TextContent(type="text", text=results_json_str)]
+            await _check_read(query, params, database)
+            bookmarks = await current_bookmarks(_bookmark_manager(ctx))
+            return await _read(
+                query,
+                params,
+                database,
+                bookmarks,
+                page_size,
+                max_rows,
+                max_bytes,
+                format,
+                timeout,
+            )
 
+        except QueryRejected:
+            raise
         except Exception as e:
             logger.error(f"Database error executing query: {e}\n{query}\n{params}")
             return [
                 types.TextContent(type="text", text=f"Error: {e}\n{query}\n{params}")
             ]
 
+    async def read_neo4j_cypher_batch(
+        ctx: Context,
+        queries: list[BatchQuery] = Field(
+            ..., description="The independent read queries to execute.", min_length=1
+        ),
+        page_size: Optional[int] = Field(
+            None, description="The maximum number of records to return per query.", gt=0
+        ),
+        max_rows: Optional[int] = Field(
+            None,
+            description="Stop reading the result of each query after this many records.",
+            gt=0,
+        ),
+        max_bytes: Optional[int] = Field(
+            None,
+            description="Stop reading the result of each query after this many bytes of JSON.",
+            gt=0,
+        ),
+        format: ResultFormat = Field(
+            "rows", description="The shape of the results, as in `read_neo4j_cypher`."
+        ),
+        timeout: Optional[float] = Field(
+            None,
+            description="Seconds after which each query is terminated, at most the server timeout.",
+            gt=0,
+        ),
+    ) -> list[types.TextContent]:
+        """Execute several independent read Cypher queries concurrently on the neo4j database.
+        Returns a JSON array with one entry per query, in order. Each entry holds the
+        `result` of the query, or its `error`, and the `elapsed_ms` it took to run.
+        Entries of results with more records hold a `continuation_token` for `fetch_more`.
+        """
+
+        bookmarks = await current_bookmarks(_bookmark_manager(ctx))
+
+        async def run(item: BatchQuery) -> dict[str, Any]:
+            async with batch_semaphore:
+                started = time.perf_counter()
+                try:
+                    database = allowed_databases.resolve(item.database)
+                    await _check_read(item.query, item.params, database)
+                    content = await _read(
+                        item.query,
+                        item.params,
+                        database,
+                        bookmarks,
+                        page_size,
+                        max_rows,
+                        max_bytes,
+                        format,
+                        timeout,
+                    )
+                    # the page is already JSON, it is embedded as is
+                    entry = {"result": orjson.Fragment(content[0].text)}
+                    if len(content) > 1:
+                        entry.update(orjson.loads(content[1].text))
+
+                except Exception as e:
+                    logger.error(
+                        f"Error executing batch query: {e}\n{item.query}\n{item.params}"
+                    )
+                    entry = {"error": str(e)}
+
+                entry["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 3)
+                return entry
+
+        entries = await asyncio.gather(*(run(item) for item in queries))
+
+        logger.debug(f"Batch of {len(entries)} read queries completed")
+
+        return [types.TextContent(type="text", text=dumps(entries))]
+
+    async def _check_write(
+        query: str, params: Optional[dict[str, Any]], database: str
+    ) -> None:
+        """Raise a `QueryRejected` if the query does not write or is rejected by the guard."""
+
+        # the plan knows about writes the tokenizer cannot see, such as
+        # procedures that are not known to write
+        if guards is None and not is_write_query(query):
+            raise QueryRejected("Only write queries are allowed for write-query")
+
+        await readiness.wait()
+
+        if guards is not None:
+            guard = guards[database]
+            plan = await guard.plan(query, params, write=True)
+            if not plan.writes:
+                raise QueryRejected("Only write queries are allowed for write-query")
+            guard.check(plan)
+
+    def _written(query: str, counters: dict[str, Any], database: str) -> None:
+        """Invalidate what a successful write may have changed."""
+
+        nonlocal writes
+
+        writes += 1
+        schema_cache = schema_caches.get(database)
+        if schema_cache is not None and is_schema_change(counters):
+            schema_cache.invalidate()
+        # results are not scoped by database, those of other databases reading
+        # the same labels are invalidated too
+        if result_cache is not None and has_updates(counters):
+            result_cache.invalidate(write_scope(query))
+
     async def write_neo4j_cypher(
+        ctx: Context,
         query: str = Field(..., description="The Cypher query to execute."),
         params: Optional[dict[str, Any]] = Field(
             None, description="The parameters to pass to the Cypher query."
         ),
+        database: Optional[str] = Field(None, description=DATABASE_DESCRIPTION),
+        timeout: Optional[float] = Field(None, description=TIMEOUT_DESCRIPTION, gt=0),
     ) -> list[types.TextContent]:
         """Execute a write Cypher query on the neo4j database."""
 
-        if not _is_write_query(query):
-            raise ValueError("Only write queries are allowed for write-query")
+        database = allowed_databases.resolve(database)
+        bookmark_manager = _bookmark_manager(ctx)
 
         try:
-            async with neo4j_driver.session(database=database) as session:
-                raw_results = await session.execute_write(_write, query, params)
-                counters_json_str = json.dumps(
-                    raw_results._summary.counters.__dict__, default=str
+            await _check_write(query, params, database)
+
+            started = time.perf_counter()
+            # coalesced batches run with the server timeout, and keep running
+            # for the other callers when one of them is cancelled
+            if coalescers is not None and timeout is None and is_coalescible(query):
+                counters = await coalescers[database].submit(
+                    query, params, bookmark_manager
+                )
+            else:
+                async with terminator.cancellable(database) as metadata:
+
+                    async def write() -> dict[str, Any]:
+                        # an explicit transaction, so that the driver does not
+                        # retry it on top of the retry policy
+                        async with neo4j_driver.session(
+                            database=database, bookmark_manager=bookmark_manager
+                        ) as session:
+                            async with await session.begin_transaction(
+                                metadata=metadata,
+                                timeout=_budget(timeout, query_timeout),
+                            ) as tx:
+                                result = await tx.run(query, params)
+                                summary = await result.consume()
+                                await tx.commit()
+                        return summary.counters.__dict__
+
+                    counters = await retry_policy.run("write", write)
+            counters_json_str = dumps(counters)
+
+            _written(query, counters, database)
+            if slow_log is not None:
+                slow_log.record(
+                    "write", query, params, database, time.perf_counter() - started
                 )
 
             logger.debug(f"Write query affected {counters_json_str}")
 
             return [types.TextContent(type="text", text=counters_json_str)]
 
+        except QueryRejected:
+            raise
         except Exception as e:
             logger.error(f"Database error executing query: {e}\n{query}\n{params}")
             return [
                 types.TextContent(type="text", text=f"Error: {e}\n{query}\n{params}")
             ]
 
-    mcp.add_tool(get_neo4j_schema)
-    mcp.add_tool(read_neo4j_cypher)
-    mcp.add_tool(write_neo4j_cypher)
+    async def write_neo4j_cypher_bulk(
+        ctx: Context,
+        statement: str = Field(
+            ...,
+            description=(
+                "The Cypher statement to run for each row, the row is bound to `row`, "
+                "for example `MERGE (p:Person {id: row.id}) SET p += row`."
+            ),
+        ),
+        rows: Optional[list[dict[str, Any]]] = Field(
+            None, description="The rows to write."
+        ),
+        path: Optional[str] = Field(
+            None,
+            description="A .ndjson, .jsonl or .csv file in the import directory to read the rows from.",
+        ),
+        params: Optional[dict[str, Any]] = Field(
+            None, description="Parameters shared by all rows."
+        ),
+        batch_size: int = Field(
+            1000, description="The number of rows written per transaction.", gt=0
+        ),
+        mode: BulkMode = Field(
+            "unwind",
+            description=(
+                "`unwind` runs batches as concurrent transactions, `transactions` sends "
+                "all rows at once and batches them server side with CALL IN TRANSACTIONS."
+            ),
+        ),
+        database: Optional[str] = Field(None, description=DATABASE_DESCRIPTION),
+    ) -> list[types.TextContent]:
+        """Write many rows with one Cypher statement, in batches of separate transactions.
+        Returns the total counters, and the failed batches with their row ranges and errors.
+        Batches that fail do not stop the others and are not rolled back together.
+        """
+
+        if (rows is None) == (path is None):
+            raise ValueError("Provide either rows or path")
+        database = allowed_databases.resolve(database)
+        file = bulk.resolve_path(import_path, path) if path is not None else None
+
+        try:
+            # parsing a large file would block the event loop
+            if file is not None:
+                rows = await asyncio.to_thread(bulk.read_rows, file)
+
+            await _check_write(
+                bulk.UNWIND_QUERY.format(statement=statement),
+                {**(params or {}), "rows": []},
+                database,
+            )
+
+            async with terminator.cancellable(database) as metadata:
+                if mode == "transactions":
+                    result = await bulk.write_in_transactions(
+                        neo4j_driver,
+                        database,
+                        statement,
+                        rows,
+                        params,
+                        batch_size=batch_size,
+                        bookmark_manager=_bookmark_manager(ctx),
+                        metadata=metadata,
+                    )
+                else:
+                    result = await bulk.write_unwind(
+                        neo4j_driver,
+                        database,
+                        statement,
+                        rows,
+                        params,
+                        batch_size=batch_size,
+                        concurrency=bulk_concurrency,
+                        bookmark_manager=_bookmark_manager(ctx),
+                        metadata=metadata,
+                    )
+
+            _written(statement, result["counters"], database)
+
+            logger.debug(
+                f"Bulk write of {result['rows']} rows, {len(result['failures'])} failed batches"
+            )
+
+            return [types.TextContent(type="text", text=dumps(result))]
+
+        except QueryRejected:
+            raise
+        except Exception as e:
+            logger.error(f"Database error executing bulk write: {e}\n{statement}")
+            return [types.TextContent(type="text", text=f"Error: {e}\n{statement}")]
+
+    async def fetch_more(
+        ctx: Context,
+        continuation_token: str = Field(
+            ..., description="The continuation token returned by a previous read."
+        ),
+        page_size: Optional[int] = Field(
+            None, description="The maximum number of records to return.", gt=0
+        ),
+    ) -> list[types.TextContent]:
+        """Fetch the next page of records of a previous read Cypher query."""
+
+        cursor = await cursors.get(continuation_token)
+
+        async with cursor.lock:
+            if cursor.closed:
+                raise ValueError(
+                    "Unknown or expired continuation token, run the query again"
+                )
+
+            try:
+                # the transaction of the cursor keeps the metadata of the call that opened it
+                async with terminator.cancellable(
+                    cursor.database or database, READ_ACCESS, cursor.metadata
+                ):
+                    return await _read_page(
+                        cursor, page_size or default_page_size, continuation_token
+                    )
+
+            except Exception as e:
+                logger.error(f"Database error fetching more records: {e}")
+                return [types.TextContent(type="text", text=f"Error: {e}")]
+
+    async def pool_status() -> list[types.TextContent]:
+        """Report the in-use and idle connections of the Neo4j driver pool per server address."""
+
+        return [types.TextContent(type="text", text=dumps(_pool_status(neo4j_driver)))]
+
+    async def result_cache_stats() -> list[types.TextContent]:
+        """Report the size and the hit, miss, eviction and invalidation counts of the read result cache."""
+
+        return [types.TextContent(type="text", text=dumps(result_cache.stats()))]
+
+    async def server_metrics() -> list[types.TextContent]:
+        """Report the server metrics in the Prometheus text format: tool call latencies,
+        errors and response sizes, rows returned, and pool, cache and admission usage."""
+
+        return [types.TextContent(type="text", text=metrics.render())]
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def metrics_endpoint(request: Request) -> PlainTextResponse:
+        # served by the HTTP and SSE transports
+        return PlainTextResponse(
+            metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+        )
+
+    async def slow_queries(
+        limit: int = Field(10, description="The number of queries to return.", gt=0),
+        order_by: Order = Field(
+            "total",
+            description="Rank queries by `total` or `max` duration, or by `count` of slow runs.",
+        ),
+    ) -> list[types.TextContent]:
+        """Report the queries that ran longer than the slow query threshold, aggregated by
+        normalized query and database: the shape of their parameters, their number of slow
+        runs, total, mean and max duration, rows and bytes read, and the db hits of the
+        last profiled run."""
+
+        return [
+            types.TextContent(type="text", text=dumps(slow_log.top(limit, order_by)))
+        ]
+
+    async def admission_stats() -> list[types.TextContent]:
+        """Report the in-flight and queued calls, rejections and wait times of the read and write slots."""
+
+        return [types.TextContent(type="text", text=dumps(admission.stats()))]
+
+    mcp.add_tool(_instrumented(_admitted("read", get_neo4j_schema)))
+    mcp.add_tool(_instrumented(_admitted("read", read_neo4j_cypher)))
+    mcp.add_tool(_instrumented(_admitted("read", read_neo4j_cypher_batch)))
+    mcp.add_tool(_instrumented(_admitted("read", fetch_more)))
+    mcp.add_tool(pool_status)
+    mcp.add_tool(server_metrics)
+    mcp.add_tool(_instrumented(_admitted("write", write_neo4j_cypher)))
+    mcp.add_tool(_instrumented(_admitted("write", write_neo4j_cypher_bulk)))
+    if result_cache is not None:
+        mcp.add_tool(result_cache_stats)
+    if admission is not None:
+        mcp.add_tool(admission_stats)
+    if slow_log is not None:
+        mcp.add_tool(slow_queries)
 
     return mcp
 
@@ -177,6 +1060,38 @@ def main(
     username: str,
     password: str,
     database: str,
+    schema_cache_ttl: float = 60.0,
+    schema_sample_size: int = 100,
+    page_size: int = 100,
+    max_rows: Optional[int] = None,
+    max_bytes: Optional[int] = None,
+    result_cache_size: int = 0,
+    result_cache_ttl: float = 60.0,
+    explain_queries: bool = False,
+    max_estimated_rows: Optional[int] = None,
+    reject_cartesian_products: bool = False,
+    reject_unbounded_expansions: bool = False,
+    import_dir: Optional[str] = None,
+    coalesce_writes: bool = False,
+    coalesce_window: float = 0.005,
+    coalesce_max_batch: int = 32,
+    fetch_size: int = 1000,
+    driver_config: Optional[dict[str, Any]] = None,
+    transport: Transport = "stdio",
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    databases: Optional[list[str]] = None,
+    causal_consistency: bool = True,
+    query_timeout: Optional[float] = None,
+    max_concurrent_reads: Optional[int] = None,
+    max_concurrent_writes: Optional[int] = None,
+    max_queued_calls: int = 64,
+    slow_query_threshold: Optional[float] = None,
+    slow_query_log: Optional[str] = None,
+    slow_query_sample_rate: float = 0.0,
+    autoparameterize: bool = False,
+    max_retries: int = 3,
+    retry_deadline: float = 10.0,
 ) -> None:
     logger.info("Starting MCP neo4j Server")
 
@@ -186,13 +1101,49 @@ def main(
             username,
             password,
         ),
+        fetch_size=fetch_size,
+        **(driver_config or {}),
     )
 
-    mcp = create_mcp_server(neo4j_driver, database)
-
-    healthcheck(db_url, username, password, database)
+    mcp = create_mcp_server(
+        neo4j_driver,
+        database,
+        databases=databases,
+        causal_consistency=causal_consistency,
+        query_timeout=query_timeout,
+        max_concurrent_reads=max_concurrent_reads,
+        max_concurrent_writes=max_concurrent_writes,
+        max_queued_calls=max_queued_calls,
+        slow_query_threshold=slow_query_threshold,
+        slow_query_log=slow_query_log,
+        slow_query_sample_rate=slow_query_sample_rate,
+        autoparameterize=autoparameterize,
+        max_retries=max_retries,
+        retry_deadline=retry_deadline,
+        schema_cache_ttl=schema_cache_ttl,
+        schema_sample_size=schema_sample_size,
+        page_size=page_size,
+        max_rows=max_rows,
+        max_bytes=max_bytes,
+        result_cache_size=result_cache_size,
+        result_cache_ttl=result_cache_ttl,
+        explain_queries=explain_queries,
+        max_estimated_rows=max_estimated_rows,
+        reject_cartesian_products=reject_cartesian_products,
+        reject_unbounded_expansions=reject_unbounded_expansions,
+        import_dir=import_dir,
+        coalesce_writes=coalesce_writes,
+        coalesce_window=coalesce_window,
+        coalesce_max_batch=coalesce_max_batch,
+        fetch_size=fetch_size,
+        host=host,
+        port=port,
+    )
 
-    mcp.run(transport="stdio")
+    if transport != "stdio":
+        # all the clients share the driver, its connection pool and the caches
+        logger.info(f"Serving {transport} on {host}:{port}")
+    mcp.run(transport=TRANSPORTS[transport])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,249 @@
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from logging.handlers import RotatingFileHandler
+from typing import Any, Literal, Optional
+
+from neo4j import READ_ACCESS, AsyncDriver, Query
+
+from .cypher import normalize_query
+from .planner import PLAN_PREFIX_RE, plan_operators
+from .serialization import dumps
+
+logger = logging.getLogger("mcp_neo4j_cypher")
+
+Kind = Literal["read", "write"]
+Order = Literal["total", "max", "count"]
+
+
+def params_shape(value: Any) -> Any:
+    """The names and types of parameters, without their values."""
+
+    if isinstance(value, dict):
+        return {str(key): params_shape(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        # lists are described by their first item, they may hold many rows
+        return [params_shape(value[0])] if value else []
+    if value is None:
+        return "null"
+    return type(value).__name__
+
+
+def profile_tree(operator: dict[str, Any]) -> dict[str, Any]:
+    """The operators of a `PROFILE` plan, with their rows and db hits."""
+
+    return {
+        "operator": operator.get("operatorType"),
+        "details": operator.get("args", {}).get("Details"),
+        "rows": operator.get("rows"),
+        "db_hits": operator.get("dbHits"),
+        "children": [profile_tree(child) for child in operator.get("children", [])],
+    }
+
+
+class SlowQuery:
+    """The slow executions of one normalized query on one database."""
+
+    def __init__(self, query: str, database: str, kind: Kind) -> None:
+        self.query = query
+        self.database = database
+        self.kind = kind
+        self.params: Any = {}
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.rows = 0
+        self.bytes = 0
+        self.db_hits: Optional[int] = None
+        self.last_seen = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "query": self.query,
+            "database": self.database,
+            "kind": self.kind,
+            "params": self.params,
+            "count": self.count,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds / self.count * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "db_hits": self.db_hits,
+            "last_seen": _timestamp(self.last_seen),
+        }
+
+
+def _timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat(
+        timespec="milliseconds"
+    )
+
+
+class SlowQueryLog:
+    """
+    Records the queries that take `threshold` seconds or more, aggregated by
+    normalized query and database, and appends each of them to a rotating
+    NDJSON file at `path`. A `sample_rate` of the slow reads is run again with
+    `PROFILE` in a read only session, one at a time, to log their db hits and
+    operators. Writes are never run again.
+    At most `max_queries` normalized queries are kept, the ones that took the
+    least time in total are dropped first.
+    """
+
+    def __init__(
+        self,
+        neo4j_driver: AsyncDriver,
+        threshold: float,
+        path: Optional[str] = None,
+        *,
+        sample_rate: float = 0.0,
+        profile_timeout: Optional[float] = None,
+        max_queries: int = 1000,
+        max_file_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+    ) -> None:
+        self.neo4j_driver = neo4j_driver
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.profile_timeout = profile_timeout
+        self.max_queries = max_queries
+        self.recorded = 0
+        self.profiled = 0
+        self._queries: dict[tuple[str, str], SlowQuery] = {}
+        self._profiling: Optional[asyncio.Task] = None
+
+        # a logger of its own, outside of the logging hierarchy
+        self._file: Optional[logging.Logger] = None
+        if path is not None:
+            handler = RotatingFileHandler(
+                path,
+                maxBytes=max_file_bytes,
+                backupCount=backup_count,
+                encoding="utf-8",
+                delay=True,
+            )
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._file = logging.Logger("mcp_neo4j_cypher.slow_queries", logging.INFO)
+            self._file.addHandler(handler)
+
+    def record(
+        self,
+        kind: Kind,
+        query: str,
+        params: Optional[dict[str, Any]],
+        database: str,
+        seconds: float,
+        rows: Optional[int] = None,
+        size: Optional[int] = None,
+    ) -> bool:
+        """Record an execution if it is slow, returns whether it was."""
+
+        if seconds < self.threshold:
+            return False
+
+        normalized = normalize_query(query)
+        key = (normalized, database)
+        entry = self._queries.get(key)
+        if entry is None:
+            if len(self._queries) >= self.max_queries:
+                fastest = min(self._queries.values(), key=lambda q: q.total_seconds)
+                del self._queries[(fastest.query, fastest.database)]
+            entry = self._queries[key] = SlowQuery(normalized, database, kind)
+
+        entry.params = params_shape(params or {})
+        entry.count += 1
+        entry.total_seconds += seconds
+        entry.max_seconds = max(entry.max_seconds, seconds)
+        entry.rows += rows or 0
+        entry.bytes += size or 0
+        entry.last_seen = time.time()
+        self.recorded += 1
+
+        self._write(
+            {
+                "event": "slow_query",
+                "time": _timestamp(entry.last_seen),
+                "kind": kind,
+                "database": database,
+                "query": normalized,
+                "params": entry.params,
+                "duration_ms": round(seconds * 1000, 3),
+                "rows": rows,
+                "bytes": size,
+            }
+        )
+
+        if (
+            kind == "read"
+            and self._profiling is None
+            and self.sample_rate > 0
+            and random.random() < self.sample_rate
+        ):
+            self._profiling = asyncio.create_task(
+                self._profile(query, params, database, key)
+            )
+            self._profiling.add_done_callback(self._profiled)
+        return True
+
+    def _profiled(self, task: asyncio.Task) -> None:
+        self._profiling = None
+
+    async def _profile(
+        self,
+        query: str,
+        params: Optional[dict[str, Any]],
+        database: str,
+        key: tuple[str, str],
+    ) -> None:
+        try:
+            # a read session, so that a query that writes fails instead
+            async with self.neo4j_driver.session(
+                database=database, default_access_mode=READ_ACCESS
+            ) as session:
+                result = await session.run(
+                    Query(
+                        "PROFILE " + PLAN_PREFIX_RE.sub("", query, count=1),
+                        timeout=self.profile_timeout,
+                    ),
+                    params,
+                )
+                summary = await result.consume()
+        except Exception as e:
+            logger.warning(f"Failed to profile slow query: {e}\n{query}")
+            return
+
+        plan = summary.profile or {}
+        db_hits = sum(operator.get("dbHits", 0) for operator in plan_operators(plan))
+        entry = self._queries.get(key)
+        if entry is not None:
+            entry.db_hits = db_hits
+        self.profiled += 1
+
+        self._write(
+            {
+                "event": "profile",
+                "time": _timestamp(time.time()),
+                "database": database,
+                "query": key[0],
+                "db_hits": db_hits,
+                "plan": profile_tree(plan),
+            }
+        )
+
+    def _write(self, event: dict[str, Any]) -> None:
+        if self._file is not None:
+            self._file.info(dumps(event))
+
+    def top(self, limit: int = 10, order_by: Order = "total") -> list[dict[str, Any]]:
+        """The slowest queries, by total, maximum duration or number of executions."""
+
+        sort_key = {
+            "total": lambda q: q.total_seconds,
+            "max": lambda q: q.max_seconds,
+            "count": lambda q: q.count,
+        }[order_by]
+        queries = sorted(self._queries.values(), key=sort_key, reverse=True)
+        return [query.as_dict() for query in queries[:limit]]
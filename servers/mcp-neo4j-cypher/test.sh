@@ -1 +1 @@
-uv run pytest tests/integration -s 
\ No newline at end of file
+uv run pytest tests -s
\ No newline at end of file
@@ -0,0 +1,119 @@
+"""
+Compares the payload size of the `rows`, `columnar` and `graph` result formats
+on synthetic records shaped like common read queries.
+
+    python tests/benchmarks/bench_formats.py
+"""
+
+from neo4j import Record
+from neo4j.graph import Graph, Node, Path
+
+from mcp_neo4j_cypher.formats import page_encoder
+
+ROWS = 500
+
+
+def wide_table() -> tuple[list[str], list[Record]]:
+    """MATCH (e:Event) RETURN e.id AS id, e.status AS status, ... (12 columns)"""
+    keys = [
+        "event_id",
+        "status",
+        "severity",
+        "road_name",
+        "direction",
+        "start_time",
+        "end_time",
+        "lanes_closed",
+        "reported_by",
+        "latitude",
+        "longitude",
+        "description",
+    ]
+    records = [
+        Record(
+            {
+                "event_id": f"INC-{i}",
+                "status": "open" if i % 3 else "closed",
+                "severity": i % 5,
+                "road_name": f"Road {i % 40}",
+                "direction": "northbound" if i % 2 else "southbound",
+                "start_time": f"2024-01-{i % 28 + 1:02d}T08:00:00",
+                "end_time": None,
+                "lanes_closed": i % 3,
+                "reported_by": "operator",
+                "latitude": 55.6 + i / 1000,
+                "longitude": 12.5 + i / 1000,
+                "description": "Lane closure due to roadworks",
+            }
+        )
+        for i in range(ROWS)
+    ]
+    return keys, records
+
+
+def _graph(nodes: int) -> tuple[Graph, list[Node]]:
+    graph = Graph()
+    return graph, [
+        Node(
+            graph,
+            f"4:db:{i}",
+            i,
+            ["Junction"],
+            {"id": f"J-{i}", "name": f"Junction {i}", "lanes": 3},
+        )
+        for i in range(nodes)
+    ]
+
+
+def _link(graph: Graph, i: int, start: Node, end: Node):
+    link = graph.relationship_type("LINK")(
+        graph, f"5:db:{i}", i, {"length": 120.5, "speed_limit": 50}
+    )
+    link._start_node = start
+    link._end_node = end
+    return link
+
+
+def neighbourhood() -> tuple[list[str], list[Record]]:
+    """MATCH (a:Junction)-[r:LINK]->(b:Junction) RETURN a, r, b over a small hub graph"""
+    graph, nodes = _graph(50)
+    records = []
+    for i in range(ROWS):
+        start, end = nodes[i % 10], nodes[(i * 7) % 50]
+        records.append(Record({"a": start, "r": _link(graph, i, start, end), "b": end}))
+    return ["a", "r", "b"], records
+
+
+def paths() -> tuple[list[str], list[Record]]:
+    """MATCH p = (:Junction)-[:LINK*3]->(:Junction) RETURN p over a small graph"""
+    graph, nodes = _graph(20)
+    links = [_link(graph, i, nodes[i], nodes[i + 1]) for i in range(19)]
+    records = []
+    for i in range(ROWS):
+        start = i % 16
+        records.append(Record({"p": Path(nodes[start], *links[start : start + 3])}))
+    return ["p"], records
+
+
+def payload(result_format: str, keys: list[str], records: list[Record]) -> int:
+    encoder = page_encoder(result_format, keys)
+    for record in records:
+        encoder.encode(record)
+        encoder.accept()
+    return len(encoder.page())
+
+
+if __name__ == "__main__":
+    for name, make in (
+        ("wide table", wide_table),
+        ("neighbourhood", neighbourhood),
+        ("paths", paths),
+    ):
+        keys, records = make()
+        rows = payload("rows", keys, records)
+        print(f"{name} ({len(records)} records)")
+        for result_format in ("rows", "columnar", "graph"):
+            size = payload(result_format, keys, records)
+            print(
+                f"  {result_format:>8}: {size:>9,} bytes ({size / rows:6.1%} of rows)"
+            )
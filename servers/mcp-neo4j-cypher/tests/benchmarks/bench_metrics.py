@@ -0,0 +1,110 @@
+"""
+Measures the cost of the metrics on the hot path: a histogram observation, a
+counter increment, and a `read_neo4j_cypher` call with and without its
+instrumentation, against an in-memory driver so that only the server overhead
+is timed.
+
+    python tests/benchmarks/bench_metrics.py
+"""
+
+import asyncio
+import time
+import timeit
+
+from mcp.server.fastmcp import Context
+from neo4j import Record
+
+from mcp_neo4j_cypher.metrics import Histogram, Registry
+from mcp_neo4j_cypher.server import create_mcp_server
+
+CALLS = 20_000
+ROUNDS = 10
+ROWS = 10
+
+
+class Result:
+    def __init__(self) -> None:
+        self.records = [Record({"id": i, "name": f"n{i}"}) for i in range(ROWS)]
+
+    async def keys(self) -> list[str]:
+        return ["id", "name"]
+
+    async def fetch(self, n: int) -> list[Record]:
+        records, self.records = self.records[:n], self.records[n:]
+        return records
+
+    async def peek(self) -> None:
+        return self.records[0] if self.records else None
+
+
+class Transaction:
+    async def run(self, query, params) -> Result:
+        return Result()
+
+    async def close(self) -> None:
+        pass
+
+
+class Session:
+    async def begin_transaction(self, **kwargs) -> Transaction:
+        return Transaction()
+
+    async def close(self) -> None:
+        pass
+
+
+class Driver:
+    def session(self, **kwargs) -> Session:
+        return Session()
+
+    async def verify_connectivity(self) -> None:
+        pass
+
+
+async def per_call(fn, arguments: dict) -> float:
+    start = time.perf_counter()
+    for _ in range(CALLS // ROUNDS):
+        await fn(**arguments)
+    return (time.perf_counter() - start) / (CALLS // ROUNDS)
+
+
+async def main() -> None:
+    histogram = Histogram("h", "h", ("tool", "database"))
+    seconds = timeit.timeit(
+        lambda: histogram.observe(0.01, "read_neo4j_cypher", "neo4j"), number=CALLS
+    )
+    print(f"{'Histogram.observe':>28}: {seconds / CALLS * 1e9:8.0f} ns")
+
+    counter = Registry().counter("c_total", "c", ("tool", "database"))
+    seconds = timeit.timeit(
+        lambda: counter.inc("read_neo4j_cypher", "neo4j"), number=CALLS
+    )
+    print(f"{'Counter.inc':>28}: {seconds / CALLS * 1e9:8.0f} ns")
+
+    mcp = create_mcp_server(Driver(), "neo4j")
+    instrumented = mcp._tool_manager.get_tool("read_neo4j_cypher").fn
+    arguments = dict(
+        ctx=Context(),
+        query="MATCH (n) RETURN n.id AS id, n.name AS name",
+        params=None,
+        page_size=None,
+        max_rows=None,
+        max_bytes=None,
+        format="rows",
+        database=None,
+        timeout=None,
+    )
+    # alternated rounds, the fastest of each is kept
+    bare = measured = float("inf")
+    for _ in range(ROUNDS):
+        bare = min(bare, await per_call(instrumented.__wrapped__, arguments))
+        measured = min(measured, await per_call(instrumented, arguments))
+    print(f"{'read_neo4j_cypher':>28}: {bare * 1e6:8.1f} us")
+    print(
+        f"{'instrumented':>28}: {measured * 1e6:8.1f} us "
+        f"({(measured - bare) * 1e6:+.1f} us, {(measured / bare - 1) * 100:+.1f}%)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
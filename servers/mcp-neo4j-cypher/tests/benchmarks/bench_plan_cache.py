@@ -0,0 +1,134 @@
+"""
+Runs queries that differ only in their literals, as written by a model, with
+and without `parameterize`, against a running Neo4j database. Neo4j caches
+plans by query text, so the hit rate of its plan cache follows from the number
+of distinct texts that were run after the caches were cleared. Reports it with
+the time Neo4j took to plan and start each query and the throughput.
+
+    NEO4J_URI=bolt://localhost:7687 NEO4J_PASSWORD=password \\
+        python tests/benchmarks/bench_plan_cache.py [queries]
+
+With `--offline` no database is used: the hit rates are computed from the query
+texts alone, with the time `parameterize` takes per query.
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Any, Optional
+
+from neo4j import AsyncDriver, AsyncGraphDatabase
+
+from mcp_neo4j_cypher.cypher import parameterize
+
+PEOPLE = 1000
+TEMPLATE = (
+    "MATCH (p:BenchPerson)-[:KNOWS]->(f:BenchPerson) "
+    "WHERE p.age > {age} AND p.city = '{city}' AND f.score >= {score} "
+    "RETURN f.name AS name, f.score AS score ORDER BY score DESC LIMIT 10"
+)
+CITIES = ["Berlin", "Lisbon", "Malmö", "Oslo", "Porto", "Turin"]
+
+
+async def _setup(driver: AsyncDriver) -> None:
+    await driver.execute_query(
+        "UNWIND range(1, $n) AS i "
+        "CREATE (:BenchPerson {id: i, name: 'p' + i, age: i % 80, "
+        "city: $cities[i % size($cities)], score: rand()})",
+        n=PEOPLE,
+        cities=CITIES,
+    )
+    await driver.execute_query(
+        "MATCH (p:BenchPerson), (f:BenchPerson) WHERE f.id = (p.id * 7) % $n + 1 "
+        "CREATE (p)-[:KNOWS]->(f)",
+        n=PEOPLE,
+    )
+
+
+async def _teardown(driver: AsyncDriver) -> None:
+    await driver.execute_query("MATCH (p:BenchPerson) DETACH DELETE p")
+
+
+def _queries(n: int) -> list[str]:
+    rng = random.Random(42)
+    return [
+        TEMPLATE.format(
+            age=rng.randint(18, 70),
+            city=rng.choice(CITIES),
+            score=round(rng.random(), 2),
+        )
+        for _ in range(n)
+    ]
+
+
+def _hit_rate(texts: set[str], queries: list[str]) -> float:
+    # every distinct text is planned once, the other runs hit the cache
+    return 1 - len(texts) / len(queries)
+
+
+def _offline(queries: list[str]) -> None:
+    start = time.perf_counter()
+    rewritten = [parameterize(query)[0] for query in queries]
+    elapsed = time.perf_counter() - start
+
+    for name, texts in (("literals", set(queries)), ("parameterized", set(rewritten))):
+        print(
+            f"{name:>14}: {len(texts):5} plans, "
+            f"{_hit_rate(texts, queries):7.2%} plan cache hits"
+        )
+    print(f"{'parameterize':>14}: {elapsed / len(queries) * 1e6:6.1f} µs/query")
+
+
+async def _run(driver: AsyncDriver, queries: list[str], rewrite: bool) -> None:
+    await driver.execute_query("CALL db.clearQueryCaches()")
+
+    texts = set()
+    available_after = []
+    start = time.perf_counter()
+    for query in queries:
+        params: Optional[dict[str, Any]] = None
+        if rewrite:
+            query, params = parameterize(query)
+        texts.add(query)
+        _, summary, _ = await driver.execute_query(query, params, routing_="r")
+        available_after.append(summary.result_available_after)
+    elapsed = time.perf_counter() - start
+
+    hit_rate = _hit_rate(texts, queries)
+    name = "parameterized" if rewrite else "literals"
+    print(
+        f"{name:>14}: {len(texts):5} plans, {hit_rate:6.1%} plan cache hits, "
+        f"{statistics.mean(available_after):6.2f} ms to first record "
+        f"(p95 {statistics.quantiles(available_after, n=20)[-1]:.0f} ms), "
+        f"{len(queries) / elapsed:7.1f} queries/s"
+    )
+
+
+async def main(n: int) -> None:
+    driver = AsyncGraphDatabase.driver(
+        os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        auth=(
+            os.getenv("NEO4J_USERNAME", "neo4j"),
+            os.getenv("NEO4J_PASSWORD", "password"),
+        ),
+    )
+    try:
+        await _setup(driver)
+        queries = _queries(n)
+        await _run(driver, queries, rewrite=False)
+        await _run(driver, queries, rewrite=True)
+    finally:
+        await _teardown(driver)
+        await driver.close()
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if arg != "--offline"]
+    n = int(args[0]) if args else 500
+    if "--offline" in sys.argv:
+        _offline(_queries(n))
+    else:
+        asyncio.run(main(n))
@@ -0,0 +1,59 @@
+"""
+Compares the throughput of the record serializer with the previous
+`json.dumps([r.data() ...], default=str)` path on synthetic records.
+
+    python tests/benchmarks/bench_serialization.py
+"""
+
+import functools
+import json
+import timeit
+
+import pytz
+from neo4j import Record
+from neo4j.graph import Graph, Node
+from neo4j.spatial import WGS84Point
+from neo4j.time import DateTime
+
+from mcp_neo4j_cypher.serialization import dump_record
+
+ROWS = 1000
+REPEAT = 20
+
+
+def make_records(rows: int) -> list[Record]:
+    graph = Graph()
+    records = []
+    for i in range(rows):
+        node = Node(
+            graph,
+            f"4:db:{i}",
+            i,
+            ["Incident"],
+            {
+                "id": f"INC-{i}",
+                "severity": i % 5,
+                "score": i / 7,
+                "tags": ["road", "closure"],
+                "reported": DateTime(2024, 1, 31, 12, 30, i % 60, tzinfo=pytz.utc),
+                "location": WGS84Point((12.5, 55.6)),
+            },
+        )
+        records.append(Record({"n": node, "name": f"Incident {i}", "rank": i}))
+    return records
+
+
+def previous(records: list[Record]) -> str:
+    return json.dumps([r.data() for r in records], default=str)
+
+
+def current(records: list[Record]) -> str:
+    return (b"[" + b",".join(dump_record(r) for r in records) + b"]").decode()
+
+
+if __name__ == "__main__":
+    records = make_records(ROWS)
+    for name, encode in (("json.dumps + data()", previous), ("dump_record", current)):
+        run = functools.partial(encode, records)
+        seconds = min(timeit.repeat(run, number=1, repeat=REPEAT))
+        print(f"{name:>20}: {ROWS / seconds:>10,.0f} records/s")
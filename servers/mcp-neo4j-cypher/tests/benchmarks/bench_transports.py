@@ -0,0 +1,154 @@
+"""
+Compares N clients each spawning their own stdio server with N clients sharing
+one streamable HTTP server, against a running Neo4j database. Reports the time
+until every client is initialized, the throughput and latency of read queries,
+and the number of Neo4j connections opened.
+
+    NEO4J_URI=bolt://localhost:7687 NEO4J_PASSWORD=password \\
+        python tests/benchmarks/bench_transports.py [clients] [calls per client]
+
+With `server_metrics` as third argument the clients call a tool that does not
+query Neo4j, which measures the transports alone and runs without a database.
+"""
+
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+SRC = str(Path(__file__).parents[2] / "src")
+PORT = 8765
+QUERY = "UNWIND range(1, 100) AS i RETURN i, toString(i) AS s"
+CALLS = {
+    "read_neo4j_cypher": {"query": QUERY},
+    "server_metrics": {},
+}
+SERVER = [sys.executable, "-c", "import mcp_neo4j_cypher; mcp_neo4j_cypher.main()"]
+ENV = dict(os.environ, PYTHONPATH=SRC)
+
+
+async def _calls(session: ClientSession, calls: int, tool: str) -> list[float]:
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        result = await session.call_tool(tool, CALLS[tool])
+        latencies.append(time.perf_counter() - start)
+        if result.isError or result.content[0].text.startswith("Error"):
+            raise RuntimeError(result.content[0].text)
+    return latencies
+
+
+async def _connections(session: ClientSession) -> int:
+    result = await session.call_tool("pool_status", {})
+    status = json.loads(result.content[0].text)
+    return sum(a["in_use"] + a["idle"] for a in status["addresses"].values())
+
+
+async def _run(
+    connect, clients: int, calls: int, tool: str, shared: bool
+) -> tuple[float, float, list[float], int]:
+    initialized = asyncio.Queue()
+    go = asyncio.Event()
+
+    async def client() -> tuple[list[float], float, int]:
+        # the transports must be entered and exited in the same task
+        async with connect() as (read, write, *_):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized.put_nowait(time.perf_counter())
+                await go.wait()
+                latencies = await _calls(session, calls, tool)
+                finished = time.perf_counter()
+                return latencies, finished, await _connections(session)
+
+    start = time.perf_counter()
+    tasks = asyncio.gather(*(client() for _ in range(clients)))
+    for _ in range(clients):
+        # a client that fails before initializing fails the run
+        getter = asyncio.ensure_future(initialized.get())
+        await asyncio.wait([getter, tasks], return_when=asyncio.FIRST_COMPLETED)
+        if tasks.done():
+            getter.cancel()
+            tasks.result()
+        ready = await getter
+    started = time.perf_counter()
+    go.set()
+
+    results = await tasks
+    latencies = [x for xs, _, _ in results for x in xs]
+    elapsed = max(finished for _, finished, _ in results) - started
+    if shared:
+        # every session reports the same pool
+        connections = results[0][2]
+    else:
+        connections = sum(n for _, _, n in results)
+    return ready - start, elapsed, latencies, connections
+
+
+async def stdio(
+    clients: int, calls: int, tool: str
+) -> tuple[float, float, list[float], int]:
+    parameters = StdioServerParameters(command=SERVER[0], args=SERVER[1:], env=ENV)
+    return await _run(lambda: stdio_client(parameters), clients, calls, tool, False)
+
+
+async def http(
+    clients: int, calls: int, tool: str
+) -> tuple[float, float, list[float], int]:
+    server = subprocess.Popen(
+        SERVER + ["--transport", "http", "--port", str(PORT)],
+        env=ENV,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        url = f"http://127.0.0.1:{PORT}/mcp"
+        # wait for the server to listen
+        for _ in range(100):
+            try:
+                async with streamablehttp_client(url) as (read, write, _):
+                    async with ClientSession(read, write) as session:
+                        await session.initialize()
+                break
+            except Exception:
+                await asyncio.sleep(0.1)
+
+        return await _run(
+            lambda: streamablehttp_client(url), clients, calls, tool, True
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def report(name: str, clients: int, result: tuple) -> None:
+    initialized, elapsed, latencies, connections = result
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{name:<6} {clients:>3} clients  "
+        f"init {initialized:6.2f}s  "
+        f"{len(latencies) / elapsed:8.1f} calls/s  "
+        f"p50 {statistics.median(latencies) * 1000:7.1f}ms  "
+        f"p95 {p95 * 1000:7.1f}ms  "
+        f"{connections:>4} connections"
+    )
+
+
+async def main() -> None:
+    clients = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    calls = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    tool = sys.argv[3] if len(sys.argv) > 3 else "read_neo4j_cypher"
+    report("stdio", clients, await stdio(clients, calls, tool))
+    report("http", clients, await http(clients, calls, tool))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,56 @@
+"""
+Compares the previous regex write check with the tokenizer based classifier,
+with and without its memo, on queries shaped like typical tool calls.
+
+    python tests/benchmarks/bench_write_classifier.py
+"""
+
+import functools
+import re
+import timeit
+from typing import Callable
+
+from mcp_neo4j_cypher.cypher import is_write_query
+
+REPEAT = 20
+NUMBER = 1000
+
+QUERIES = [
+    "MATCH (n:Person) RETURN n.name LIMIT 10",
+    "MATCH (n:Person {name: $name})-[:FRIEND*1..3]->(m) RETURN m.name, m.created",
+    """
+    // people that reviewed a movie
+    MATCH (p:Person)-[r:REVIEWED]->(m:Movie)
+    WHERE m.title CONTAINS 'SET' AND r.rating > $rating
+    WITH p, collect(m {.title, .released}) AS movies
+    RETURN p.name, movies ORDER BY size(movies) DESC LIMIT 25
+    """,
+    "UNWIND $rows AS row MERGE (n:Person {id: row.id}) SET n += row.properties",
+]
+
+
+def previous(query: str) -> bool:
+    return (
+        re.search(r"\b(MERGE|CREATE|SET|DELETE|REMOVE|ADD)\b", query, re.IGNORECASE)
+        is not None
+    )
+
+
+def uncached(query: str) -> bool:
+    return is_write_query.__wrapped__(query)
+
+
+def _classify_all(classify: Callable[[str], bool]) -> list[bool]:
+    return [classify(q) for q in QUERIES]
+
+
+if __name__ == "__main__":
+    for name, classify in (
+        ("regex", previous),
+        ("tokenizer", uncached),
+        ("tokenizer, memoized", is_write_query),
+    ):
+        run = functools.partial(_classify_all, classify)
+        seconds = min(timeit.repeat(run, number=NUMBER, repeat=REPEAT))
+        per_query = seconds / NUMBER / len(QUERIES) * 1e6
+        print(f"{name:>20}: {per_query:8.2f} µs/query")
@@ -1,13 +1,23 @@
+import asyncio
 import json
 from typing import Any
 
+import httpx
 import pytest
 from mcp.server import FastMCP
 
+from mcp_neo4j_cypher.server import create_mcp_server
+
+
+async def _call_tool(server: FastMCP, name: str, arguments: dict[str, Any]) -> Any:
+    """The content of a tool call, newer versions of mcp also return structured output."""
+    result = await server.call_tool(name, arguments)
+    return result[0] if isinstance(result, tuple) else result
+
 
 @pytest.mark.asyncio(loop_scope="function")
 async def test_get_neo4j_schema(mcp_server: FastMCP, init_data: Any):
-    response = await mcp_server.call_tool("get_neo4j_schema", dict())
+    response = await _call_tool(mcp_server, "get_neo4j_schema", dict())
 
     schema = json.loads(response[0].text)[0]
 
@@ -17,11 +27,61 @@ async def test_get_neo4j_schema(mcp_server: FastMCP, init_data: Any):
     assert "relationships" in schema
 
 
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_neo4j_schema_samples_labels(mcp_server: FastMCP, init_data: Any):
+    response = await _call_tool(mcp_server, "get_neo4j_schema", dict())
+
+    schema = {entry["label"]: entry for entry in json.loads(response[0].text)}
+
+    assert schema["Person"]["attributes"]["name"] == "STRING"
+    assert schema["Person"]["attributes"]["age"] == "INTEGER"
+    assert schema["Person"]["relationships"] == {"FRIEND": "Person"}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_neo4j_schema_incoming_relationships(
+    mcp_server: FastMCP, setup: Any, init_data: Any
+):
+    with setup.get_driver().session(database="neo4j") as session:
+        session.run(
+            "MATCH (a:Person {name: 'Alice'}) CREATE (a)-[:REVIEWED]->(:Movie {title: 'Up'})"
+        )
+
+    response = await _call_tool(mcp_server, "get_neo4j_schema", dict())
+
+    schema = {entry["label"]: entry for entry in json.loads(response[0].text)}
+    # movies only appear as relationship targets
+    assert schema["Movie"]["relationships"] == {"REVIEWED": "Person"}
+    assert schema["Person"]["relationships"] == {
+        "FRIEND": "Person",
+        "REVIEWED": "Movie",
+    }
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_get_neo4j_schema_refresh_labels(
+    mcp_server: FastMCP, setup: Any, init_data: Any
+):
+    await _call_tool(mcp_server, "get_neo4j_schema", dict())
+
+    # changed outside of the server, so the cached schema is not invalidated
+    with setup.get_driver().session(database="neo4j") as session:
+        session.run("MATCH (p:Person) SET p.email = p.name + '@example.com'")
+
+    response = await _call_tool(mcp_server, "get_neo4j_schema", dict())
+    schema = {entry["label"]: entry for entry in json.loads(response[0].text)}
+    assert "email" not in schema["Person"]["attributes"]
+
+    response = await _call_tool(mcp_server, "get_neo4j_schema", dict(labels=["Person"]))
+    schema = {entry["label"]: entry for entry in json.loads(response[0].text)}
+    assert schema["Person"]["attributes"]["email"] == "STRING"
+
+
 @pytest.mark.asyncio(loop_scope="function")
 async def test_write_neo4j_cypher(mcp_server: FastMCP):
     # Execute a Cypher query to create a node
     query = "CREATE (n:Test {name: 'test', age: 123}) RETURN n.name"
-    response = await mcp_server.call_tool("write_neo4j_cypher", dict(query=query))
+    response = await _call_tool(mcp_server, "write_neo4j_cypher", dict(query=query))
 
     result = json.loads(response[0].text)
     # Verify the node creation
@@ -42,7 +102,7 @@ async def test_read_neo4j_cypher(mcp_server: FastMCP, init_data: Any):
     ORDER BY p.name, friend.name
     """
 
-    response = await mcp_server.call_tool("read_neo4j_cypher", dict(query=query))
+    response = await _call_tool(mcp_server, "read_neo4j_cypher", dict(query=query))
     result = json.loads(response[0].text)
     # # Verify the query result
     assert len(result) == 2
@@ -50,3 +110,439 @@ async def test_read_neo4j_cypher(mcp_server: FastMCP, init_data: Any):
     assert result[0]["friend_name"] == "Bob"
     assert result[1]["person"] == "Bob"
     assert result[1]["friend_name"] == "Charlie"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_read_neo4j_cypher_pagination(mcp_server: FastMCP, init_data: Any):
+    query = "MATCH (p:Person) RETURN p.name AS name ORDER BY name"
+
+    response = await _call_tool(
+        mcp_server, "read_neo4j_cypher", dict(query=query, page_size=2)
+    )
+    first_page = json.loads(response[0].text)
+    continuation = json.loads(response[1].text)
+
+    assert [r["name"] for r in first_page] == ["Alice", "Bob"]
+    assert continuation["rows"] == 2
+
+    response = await _call_tool(
+        mcp_server,
+        "fetch_more",
+        dict(continuation_token=continuation["continuation_token"]),
+    )
+
+    assert len(response) == 1
+    assert [r["name"] for r in json.loads(response[0].text)] == ["Charlie"]
+
+    # the exhausted cursor is closed
+    with pytest.raises(Exception):
+        await _call_tool(
+            mcp_server,
+            "fetch_more",
+            dict(continuation_token=continuation["continuation_token"]),
+        )
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_read_neo4j_cypher_max_rows(mcp_server: FastMCP, init_data: Any):
+    query = "MATCH (p:Person) RETURN p.name AS name ORDER BY name"
+
+    response = await _call_tool(
+        mcp_server, "read_neo4j_cypher", dict(query=query, max_rows=1)
+    )
+
+    assert [r["name"] for r in json.loads(response[0].text)] == ["Alice"]
+    assert json.loads(response[1].text) == {
+        "truncated": True,
+        "reason": "max_rows",
+        "rows": 1,
+    }
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_read_neo4j_cypher_max_bytes(mcp_server: FastMCP, init_data: Any):
+    query = "MATCH (p:Person) RETURN p.name AS name ORDER BY name"
+
+    response = await _call_tool(
+        mcp_server, "read_neo4j_cypher", dict(query=query, max_bytes=40)
+    )
+
+    assert len(response[0].text) <= 40
+    assert json.loads(response[1].text)["reason"] == "max_bytes"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_read_neo4j_cypher_formats(mcp_server: FastMCP, init_data: Any):
+    query = """
+    MATCH (p:Person)-[r:FRIEND]->(friend)
+    RETURN p, r, friend
+    ORDER BY p.name
+    """
+
+    response = await _call_tool(
+        mcp_server, "read_neo4j_cypher", dict(query=query, format="columnar")
+    )
+    result = json.loads(response[0].text)
+    assert result["columns"] == ["p", "r", "friend"]
+    assert len(result["rows"]) == 2
+
+    response = await _call_tool(
+        mcp_server, "read_neo4j_cypher", dict(query=query, format="graph")
+    )
+    result = json.loads(response[0].text)
+    # Bob is both a friend and has a friend, but is returned once
+    assert len(result["nodes"]) == 3
+    assert len(result["relationships"]) == 2
+    assert result["rows"][0]["p"] == {"$node": result["rows"][0]["p"]["$node"]}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_read_neo4j_cypher_result_cache(async_neo4j_driver: Any, init_data: Any):
+    mcp_server = create_mcp_server(
+        async_neo4j_driver, "neo4j", result_cache_size=1024 * 1024
+    )
+    query = "MATCH (p:Person) RETURN count(p) AS people"
+
+    response = await _call_tool(mcp_server, "read_neo4j_cypher", dict(query=query))
+    assert json.loads(response[0].text) == [{"people": 3}]
+
+    # whitespace and comments do not change the cache key
+    response = await _call_tool(
+        mcp_server,
+        "read_neo4j_cypher",
+        dict(query=query.replace(" ", "  ") + " // cached"),
+    )
+    assert json.loads(response[0].text) == [{"people": 3}]
+
+    # a write to an unrelated label keeps the entry
+    await _call_tool(
+        mcp_server, "write_neo4j_cypher", dict(query="CREATE (:City {name: 'Paris'})")
+    )
+    response = await _call_tool(mcp_server, "result_cache_stats", dict())
+    stats = json.loads(response[0].text)
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+
+    await _call_tool(
+        mcp_server, "write_neo4j_cypher", dict(query="CREATE (:Person {name: 'Dave'})")
+    )
+    response = await _call_tool(mcp_server, "read_neo4j_cypher", dict(query=query))
+    assert json.loads(response[0].text) == [{"people": 4}]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_query_guard(async_neo4j_driver: Any, init_data: Any):
+    mcp_server = create_mcp_server(
+        async_neo4j_driver,
+        "neo4j",
+        reject_cartesian_products=True,
+        reject_unbounded_expansions=True,
+    )
+
+    response = await _call_tool(
+        mcp_server,
+        "read_neo4j_cypher",
+        dict(query="MATCH (p:Person) RETURN count(p) AS people"),
+    )
+    assert json.loads(response[0].text) == [{"people": 3}]
+
+    with pytest.raises(Exception, match="cartesian product"):
+        await _call_tool(
+            mcp_server,
+            "read_neo4j_cypher",
+            dict(query="MATCH (a:Person), (b:Person) RETURN a, b"),
+        )
+
+    with pytest.raises(Exception, match="upper bound"):
+        await _call_tool(
+            mcp_server,
+            "read_neo4j_cypher",
+            dict(query="MATCH (a:Person)-[:FRIEND*]->(b) RETURN b"),
+        )
+
+    with pytest.raises(Exception, match="Only write queries"):
+        await _call_tool(
+            mcp_server, "write_neo4j_cypher", dict(query="MATCH (p:Person) RETURN p")
+        )
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_read_neo4j_cypher_batch(mcp_server: FastMCP, init_data: Any):
+    queries = [
+        dict(query="MATCH (p:Person) RETURN count(p) AS people"),
+        dict(
+            query="MATCH (p:Person {name: $name}) RETURN p.age", params={"name": "Bob"}
+        ),
+        dict(query="MATCH (p:Person) RETURN p.name ORDER BY p.name", params={}),
+        dict(query="MATCH (p:Person RETURN p"),
+    ]
+
+    response = await _call_tool(
+        mcp_server, "read_neo4j_cypher_batch", dict(queries=queries, page_size=2)
+    )
+    results = json.loads(response[0].text)
+
+    assert len(results) == 4
+    assert results[0]["result"] == [{"people": 3}]
+    assert results[1]["result"] == [{"p.age": 25}]
+    assert results[2]["result"] == [{"p.name": "Alice"}, {"p.name": "Bob"}]
+    assert results[2]["has_more"] is True
+    assert "error" in results[3]
+    assert all(result["elapsed_ms"] >= 0 for result in results)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_write_neo4j_cypher_bulk(mcp_server: FastMCP, clear_data: Any):
+    rows = [{"id": i, "name": f"Person {i}"} for i in range(25)]
+
+    for mode in ("unwind", "transactions"):
+        response = await _call_tool(
+            mcp_server,
+            "write_neo4j_cypher_bulk",
+            dict(
+                statement="MERGE (p:Person {id: row.id}) SET p.name = row.name",
+                rows=rows,
+                batch_size=10,
+                mode=mode,
+            ),
+        )
+        result = json.loads(response[0].text)
+        assert result["batches"] == 3
+        assert result["committed_batches"] == 3
+        assert result["failures"] == []
+
+    response = await _call_tool(
+        mcp_server,
+        "read_neo4j_cypher",
+        dict(query="MATCH (p:Person) RETURN count(p) AS people"),
+    )
+    assert json.loads(response[0].text) == [{"people": 25}]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_database_argument(async_neo4j_driver: Any, init_data: Any):
+    mcp_server = create_mcp_server(async_neo4j_driver, "neo4j", databases=["system"])
+
+    response = await _call_tool(
+        mcp_server,
+        "read_neo4j_cypher",
+        dict(query="SHOW DATABASES YIELD name RETURN name", database="system"),
+    )
+    names = {row["name"] for row in json.loads(response[0].text)}
+    assert {"neo4j", "system"} <= names
+
+    response = await _call_tool(
+        mcp_server,
+        "read_neo4j_cypher",
+        dict(query="MATCH (p:Person) RETURN count(p) AS people", database="NEO4J"),
+    )
+    assert json.loads(response[0].text) == [{"people": 3}]
+
+    with pytest.raises(Exception, match="not allowed"):
+        await _call_tool(
+            mcp_server, "read_neo4j_cypher", dict(query="RETURN 1", database="other")
+        )
+
+    with pytest.raises(Exception, match="not allowed"):
+        await _call_tool(
+            mcp_server,
+            "write_neo4j_cypher",
+            dict(query="CREATE (:Person)", database="other"),
+        )
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_reads_see_previous_writes(mcp_server: FastMCP, clear_data: Any):
+    # the read session starts after the bookmark of the write
+    for i in range(3):
+        await _call_tool(
+            mcp_server,
+            "write_neo4j_cypher",
+            dict(query="CREATE (:Person {name: $name})", params={"name": f"p{i}"}),
+        )
+        response = await _call_tool(
+            mcp_server,
+            "read_neo4j_cypher",
+            dict(query="MATCH (p:Person) RETURN count(p) AS people"),
+        )
+        assert json.loads(response[0].text) == [{"people": i + 1}]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_query_timeout(mcp_server: FastMCP):
+    response = await _call_tool(
+        mcp_server,
+        "read_neo4j_cypher",
+        dict(query="CALL apoc.util.sleep(60000) RETURN 1 AS one", timeout=1),
+    )
+    assert response[0].text.startswith("Error:")
+
+    response = await _call_tool(
+        mcp_server,
+        "write_neo4j_cypher",
+        dict(query="CALL apoc.util.sleep(60000) CREATE (:Person)", timeout=1),
+    )
+    assert response[0].text.startswith("Error:")
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cancelled_call_terminates_its_query(
+    async_neo4j_driver: Any, mcp_server: FastMCP
+):
+    async def running() -> list[str]:
+        records, _, _ = await async_neo4j_driver.execute_query(
+            "SHOW TRANSACTIONS YIELD metaData, currentQuery "
+            "WHERE currentQuery CONTAINS 'apoc.util.sleep' AND metaData.mcp_call IS NOT NULL "
+            "RETURN metaData.mcp_call AS call"
+        )
+        return [record["call"] for record in records]
+
+    for tool, query in (
+        ("read_neo4j_cypher", "CALL apoc.util.sleep(60000) RETURN 1 AS one"),
+        ("write_neo4j_cypher", "CALL apoc.util.sleep(60000) CREATE (:Person)"),
+    ):
+        call = asyncio.create_task(_call_tool(mcp_server, tool, dict(query=query)))
+        for _ in range(50):
+            await asyncio.sleep(0.1)
+            if await running():
+                break
+        assert len(await running()) == 1
+
+        call.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await call
+
+        # the query is terminated instead of sleeping for a minute
+        for _ in range(50):
+            await asyncio.sleep(0.1)
+            if not await running():
+                break
+        assert await running() == []
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_server_metrics(mcp_server: FastMCP, init_data: Any):
+    await _call_tool(
+        mcp_server,
+        "read_neo4j_cypher",
+        dict(query="MATCH (p:Person) RETURN p.name AS name"),
+    )
+    await _call_tool(
+        mcp_server, "read_neo4j_cypher", dict(query="MATCH (p:Person) RETURN")
+    )
+
+    response = await _call_tool(mcp_server, "server_metrics", dict())
+    metrics = response[0].text
+    assert (
+        'mcp_neo4j_tool_duration_seconds_count{tool="read_neo4j_cypher",database="neo4j"} 2'
+        in metrics
+    )
+    assert (
+        'mcp_neo4j_tool_errors_total{tool="read_neo4j_cypher",database="neo4j"} 1'
+        in metrics
+    )
+    assert 'mcp_neo4j_rows_returned_sum{database="neo4j"} 3' in metrics
+    assert 'mcp_neo4j_pool_connections{address="' in metrics
+
+    # the same metrics are served over HTTP
+    app = mcp_server.streamable_http_app()
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "mcp_neo4j_tool_duration_seconds_bucket" in response.text
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_slow_queries(async_neo4j_driver: Any, init_data: Any, tmp_path: Any):
+    path = tmp_path / "slow.ndjson"
+    mcp_server = create_mcp_server(
+        async_neo4j_driver,
+        "neo4j",
+        slow_query_threshold=0,
+        slow_query_log=str(path),
+        slow_query_sample_rate=1.0,
+    )
+
+    await _call_tool(
+        mcp_server,
+        "read_neo4j_cypher",
+        dict(
+            query="MATCH (p:Person) WHERE p.age > $age RETURN p.name", params={"age": 1}
+        ),
+    )
+    await _call_tool(
+        mcp_server, "write_neo4j_cypher", dict(query="CREATE (:Person {name: 'Dave'})")
+    )
+
+    # the profile of the read runs in the background
+    for _ in range(50):
+        response = await _call_tool(mcp_server, "slow_queries", dict())
+        queries = json.loads(response[0].text)
+        if queries and all(q["kind"] == "write" or q["db_hits"] for q in queries):
+            break
+        await asyncio.sleep(0.1)
+
+    read = next(q for q in queries if q["kind"] == "read")
+    assert read["params"] == {"age": "int"}
+    assert read["rows"] == 3
+    assert read["db_hits"] > 0
+    assert {q["kind"] for q in queries} == {"read", "write"}
+
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    profile = next(event for event in events if event["event"] == "profile")
+    assert profile["plan"]["operator"].startswith("ProduceResults")
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_autoparameterized_reads(async_neo4j_driver: Any, init_data: Any):
+    plain = create_mcp_server(async_neo4j_driver, "neo4j")
+    rewriting = create_mcp_server(async_neo4j_driver, "neo4j", autoparameterize=True)
+    query = (
+        "MATCH (p:Person) WHERE p.age > 26 AND p.name <> 'Bob' "
+        "RETURN p.name, p.age + 1, 'person' AS kind ORDER BY p.name LIMIT 5"
+    )
+
+    expected = await _call_tool(plain, "read_neo4j_cypher", dict(query=query))
+    response = await _call_tool(rewriting, "read_neo4j_cypher", dict(query=query))
+
+    # the literals of unaliased return items are kept, so are the column names
+    assert json.loads(response[0].text) == json.loads(expected[0].text)
+    assert [row["kind"] for row in json.loads(response[0].text)] == [
+        "person",
+        "person",
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_deadlocked_writes_are_retried(mcp_server: FastMCP, init_data: Any):
+    # each write locks one person, waits, then locks the other
+    query = (
+        "MATCH (a:Person {name: $first}) SET a.visits = coalesce(a.visits, 0) + 1 "
+        "WITH a CALL apoc.util.sleep(500) "
+        "MATCH (b:Person {name: $second}) SET b.visits = coalesce(b.visits, 0) + 1"
+    )
+
+    responses = await asyncio.gather(
+        _call_tool(
+            mcp_server,
+            "write_neo4j_cypher",
+            dict(query=query, params={"first": "Alice", "second": "Bob"}),
+        ),
+        _call_tool(
+            mcp_server,
+            "write_neo4j_cypher",
+            dict(query=query, params={"first": "Bob", "second": "Alice"}),
+        ),
+    )
+
+    for response in responses:
+        assert json.loads(response[0].text)["properties_set"] == 2
+
+    response = await _call_tool(mcp_server, "server_metrics", dict())
+    assert (
+        'mcp_neo4j_retries_total{kind="write",'
+        'error="Neo.TransientError.Transaction.DeadlockDetected"} 1'
+    ) in response[0].text
@@ -0,0 +1,95 @@
+"""
+Fakes of the driver shared by the unit tests. A `FakeDriver` records the
+sessions it opens and the queries they run; tests subclass it and override
+`respond` to decide what each query returns or raises.
+
+Imported by the test modules as `fakes`, pytest puts this directory on the path.
+"""
+
+from typing import Any, Optional
+
+from neo4j import Query
+
+
+class FakeCounters:
+    def __init__(self, **counters: Any) -> None:
+        self.__dict__.update(counters)
+
+
+class FakeSummary:
+    def __init__(self, counters: Optional[FakeCounters] = None, **fields: Any) -> None:
+        self.counters = counters if counters is not None else FakeCounters()
+        self.__dict__.update(fields)
+
+
+class FakeResult:
+    def __init__(self, records=(), summary: Optional[FakeSummary] = None) -> None:
+        self.records = list(records)
+        self.summary = summary if summary is not None else FakeSummary()
+
+    async def data(self) -> list[dict[str, Any]]:
+        return self.records
+
+    async def consume(self) -> FakeSummary:
+        return self.summary
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for record in self.records:
+            yield record
+
+
+class FakeTx:
+    def __init__(self, session: "FakeSession") -> None:
+        self.session = session
+
+    async def run(self, query, params=None) -> FakeResult:
+        return await self.session.run(query, params)
+
+
+class FakeSession:
+    def __init__(self, driver: "FakeDriver", **config: Any) -> None:
+        self.driver = driver
+        self.config = config
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *exc) -> bool:
+        return False
+
+    async def run(self, query, parameters=None, **kwargs: Any) -> FakeResult:
+        if isinstance(query, Query):
+            self.driver.metadata.append(query.metadata)
+            query = query.text
+        params = {**(parameters or {}), **kwargs}
+        self.driver.runs.append((query, params))
+        return self.driver.respond(query, params)
+
+    async def execute_write(self, fn, *args: Any) -> Any:
+        return await fn(FakeTx(self), *args)
+
+
+class FakeDriver:
+    session_class = FakeSession
+
+    def __init__(self) -> None:
+        self.sessions: list[dict[str, Any]] = []
+        self.runs: list[tuple[str, dict[str, Any]]] = []
+        self.metadata: list[Optional[dict[str, Any]]] = []
+
+    @property
+    def queries(self) -> list[str]:
+        return [query for query, _ in self.runs]
+
+    def session(self, **config: Any) -> FakeSession:
+        self.sessions.append(config)
+        return self.session_class(self, **config)
+
+    async def verify_connectivity(self) -> None:
+        pass
+
+    def respond(self, query: str, params: dict[str, Any]) -> FakeResult:
+        return FakeResult()
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+from mcp_neo4j_cypher.admission import Admission, Gate, ServerBusy
+
+
+async def _hold(gate, client, order, release):
+    async with gate.slot(client):
+        order.append(client)
+        await release.wait()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_gate_bounds_calls_in_flight():
+    gate = Gate("read", 2, max_queue=8)
+    release = asyncio.Event()
+    order = []
+
+    tasks = [asyncio.create_task(_hold(gate, "a", order, release)) for _ in range(5)]
+    await asyncio.sleep(0)
+    assert gate.in_flight == 2
+    assert gate.queued == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["a"] * 5
+    assert gate.stats()["in_flight"] == 0
+    assert gate.stats()["queued"] == 0
+    assert gate.stats()["admitted"] == 5
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_gate_serves_clients_round_robin():
+    gate = Gate("read", 1, max_queue=8)
+    order = []
+
+    async def call(client):
+        async with gate.slot(client):
+            order.append(client)
+            await asyncio.sleep(0)
+
+    # a burst from one client does not hold up the calls of another
+    tasks = [asyncio.create_task(call("a")) for _ in range(4)]
+    tasks += [asyncio.create_task(call("b")) for _ in range(2)]
+    await asyncio.gather(*tasks)
+
+    assert order == ["a", "a", "b", "a", "b", "a"]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_full_queue_rejects_calls():
+    gate = Gate("write", 1, max_queue=2)
+    release = asyncio.Event()
+    order = []
+
+    tasks = [asyncio.create_task(_hold(gate, "a", order, release)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    with pytest.raises(ServerBusy, match="1 write calls are running and 2 are waiting"):
+        async with gate.slot("a"):
+            pass
+    assert gate.rejected == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_full_queue_evicts_the_longest_client_queue():
+    gate = Gate("read", 1, max_queue=3)
+    release = asyncio.Event()
+    order = []
+
+    tasks = [asyncio.create_task(_hold(gate, "a", order, release)) for _ in range(4)]
+    await asyncio.sleep(0)
+    assert gate.queued == 3
+
+    # the newest call of the client with the most waiting calls makes room
+    other = asyncio.create_task(_hold(gate, "b", order, release))
+    await asyncio.sleep(0)
+    assert gate.queued == 3
+    assert gate.rejected == 1
+
+    release.set()
+    results = await asyncio.gather(*tasks, other, return_exceptions=True)
+    assert isinstance(results[3], ServerBusy)
+    assert order == ["a", "a", "b", "a"]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cancelled_calls_leave_the_queue():
+    gate = Gate("read", 1, max_queue=8)
+    release = asyncio.Event()
+    order = []
+
+    first = asyncio.create_task(_hold(gate, "a", order, release))
+    waiting = asyncio.create_task(_hold(gate, "b", order, release))
+    await asyncio.sleep(0)
+    assert gate.queued == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert gate.queued == 0
+
+    release.set()
+    await first
+    assert order == ["a"]
+    assert gate.in_flight == 0
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_unlimited_gate_admits_every_call():
+    admission = Admission(max_writes=1)
+    release = asyncio.Event()
+    order = []
+
+    tasks = [
+        asyncio.create_task(_hold(admission.gates["read"], "a", order, release))
+        for _ in range(10)
+    ]
+    await asyncio.sleep(0)
+    assert admission.stats()["read"]["in_flight"] == 10
+    assert admission.stats()["read"]["limit"] is None
+
+    release.set()
+    await asyncio.gather(*tasks)
@@ -0,0 +1,49 @@
+import gc
+
+import pytest
+
+from mcp_neo4j_cypher.bookmarks import SessionBookmarks, as_bookmarks, current_bookmarks
+
+
+class ClientSession:
+    pass
+
+
+def test_each_client_session_has_its_own_manager():
+    bookmarks = SessionBookmarks()
+    alice, bob = ClientSession(), ClientSession()
+
+    assert bookmarks.get(alice) is bookmarks.get(alice)
+    assert bookmarks.get(alice) is not bookmarks.get(bob)
+    assert bookmarks.get(None) is bookmarks.get(None)
+    assert bookmarks.get(None) is not bookmarks.get(alice)
+    assert len(bookmarks) == 2
+
+
+def test_managers_are_dropped_with_their_client_session():
+    bookmarks = SessionBookmarks()
+    session = ClientSession()
+    bookmarks.get(session)
+
+    del session
+    gc.collect()
+
+    assert len(bookmarks) == 0
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_current_bookmarks():
+    bookmarks = SessionBookmarks()
+    manager = bookmarks.get(None)
+
+    assert await current_bookmarks(None) == frozenset()
+    assert await current_bookmarks(manager) == frozenset()
+
+    await manager.update_bookmarks([], ["tx:1"])
+    await manager.update_bookmarks(["tx:1"], ["tx:2"])
+    assert await current_bookmarks(manager) == frozenset({"tx:2"})
+
+
+def test_as_bookmarks():
+    assert as_bookmarks(frozenset()) is None
+    assert as_bookmarks(frozenset({"tx:1"})).raw_values == frozenset({"tx:1"})
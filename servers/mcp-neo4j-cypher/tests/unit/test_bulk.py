@@ -0,0 +1,142 @@
+import json
+
+import pytest
+from fakes import FakeCounters, FakeDriver, FakeResult, FakeSummary
+from mcp.server.fastmcp import Context
+
+from mcp_neo4j_cypher.bulk import (
+    add_counters,
+    read_rows,
+    resolve_path,
+    write_in_transactions,
+    write_unwind,
+)
+from mcp_neo4j_cypher.server import create_mcp_server
+
+
+def test_read_rows_ndjson(tmp_path):
+    path = tmp_path / "people.ndjson"
+    path.write_text('{"id": 1, "name": "Alice"}\n\n{"id": 2, "name": "Bob"}\n')
+
+    assert read_rows(path) == [{"id": 1, "name": "Alice"}, {"id": 2, "name": "Bob"}]
+
+
+def test_read_rows_csv(tmp_path):
+    path = tmp_path / "people.csv"
+    path.write_text("id,name\n1,Alice\n2,Bob\n")
+
+    assert read_rows(path) == [{"id": "1", "name": "Alice"}, {"id": "2", "name": "Bob"}]
+
+
+def test_read_rows_unsupported(tmp_path):
+    with pytest.raises(ValueError, match="Unsupported file type"):
+        read_rows(tmp_path / "people.xlsx")
+
+
+def test_resolve_path(tmp_path):
+    assert resolve_path(tmp_path, "rows.csv") == (tmp_path / "rows.csv").resolve()
+
+    with pytest.raises(ValueError, match="outside of the import directory"):
+        resolve_path(tmp_path, "../secrets.csv")
+    with pytest.raises(ValueError, match="disabled"):
+        resolve_path(None, "rows.csv")
+
+
+def test_add_counters():
+    total = {}
+    add_counters(total, {"nodes_created": 2, "_contains_updates": True})
+    add_counters(total, {"nodes_created": 3, "properties_set": 1})
+
+    assert total == {"nodes_created": 5, "properties_set": 1}
+
+
+class Driver(FakeDriver):
+    def __init__(self, statuses=()):
+        super().__init__()
+        self.statuses = list(statuses)
+
+    def respond(self, query, params):
+        rows = params["rows"]
+        if any(row.get("fail") for row in rows):
+            raise RuntimeError("constraint violated")
+        counters = FakeCounters(nodes_created=len(rows))
+        return FakeResult(self.statuses, FakeSummary(counters))
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_write_unwind_reports_failed_batches():
+    driver = Driver()
+    rows = [{"id": i} for i in range(5)] + [{"id": 5, "fail": True}]
+
+    result = await write_unwind(
+        driver, "neo4j", "CREATE (:Row {id: row.id})", rows, batch_size=2
+    )
+
+    assert result["rows"] == 6
+    assert result["batches"] == 3
+    assert result["committed_batches"] == 2
+    assert result["counters"] == {"nodes_created": 4}
+    assert result["failures"] == [
+        {"batch": 2, "rows": [4, 6], "error": "constraint violated"}
+    ]
+    assert driver.queries[0].startswith("UNWIND $rows AS row\n")
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_write_in_transactions_reports_failed_batches():
+    statuses = [
+        {"transaction": "tx-1", "committed": True, "error": None},
+        {"transaction": "tx-1", "committed": True, "error": None},
+        {"transaction": "tx-2", "committed": False, "error": "constraint violated"},
+        {"transaction": "tx-2", "committed": False, "error": "constraint violated"},
+        {"transaction": "tx-3", "committed": True, "error": None},
+    ]
+    driver = Driver(statuses)
+    rows = [{"id": i} for i in range(5)]
+
+    result = await write_in_transactions(
+        driver,
+        "neo4j",
+        "CREATE (:Row {id: row.id})",
+        rows,
+        batch_size=2,
+        metadata={"mcp_call": "call-1"},
+    )
+
+    assert result["batches"] == 3
+    assert result["committed_batches"] == 2
+    assert result["failures"] == [
+        {"batch": 1, "rows": [2, 4], "error": "constraint violated"}
+    ]
+    assert "IN TRANSACTIONS OF 2 ROWS" in driver.queries[0]
+    assert driver.metadata == [{"mcp_call": "call-1"}]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_bulk_tool_writes_to_the_given_database(tmp_path):
+    (tmp_path / "people.ndjson").write_text('{"id": 1}\n{"id": 2}\n')
+    driver = Driver()
+    mcp = create_mcp_server(
+        driver, "neo4j", databases=["movies"], import_dir=str(tmp_path)
+    )
+    write_bulk = mcp._tool_manager.get_tool("write_neo4j_cypher_bulk").fn
+    arguments = dict(
+        statement="CREATE (:Person {id: row.id})",
+        rows=None,
+        params=None,
+        batch_size=1000,
+        mode="unwind",
+    )
+
+    content = await write_bulk(
+        ctx=Context(), path="people.ndjson", database="Movies", **arguments
+    )
+
+    assert json.loads(content[0].text)["counters"] == {"nodes_created": 2}
+    assert [session["database"] for session in driver.sessions] == ["movies"]
+
+    # files that cannot be read are reported like database errors
+    content = await write_bulk(
+        ctx=Context(), path="missing.ndjson", database=None, **arguments
+    )
+    assert content[0].text.startswith("Error: [Errno 2] No such file or directory")
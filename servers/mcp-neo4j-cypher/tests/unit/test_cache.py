@@ -0,0 +1,218 @@
+import asyncio
+
+import pytest
+
+from mcp_neo4j_cypher.cache import (
+    ResultCache,
+    SchemaCache,
+    has_updates,
+    is_schema_change,
+    params_key,
+)
+
+
+def test_is_schema_change():
+    assert is_schema_change({"labels_added": 1, "nodes_created": 1})
+    assert is_schema_change({"indexes_removed": 1})
+    assert not is_schema_change({"nodes_created": 0, "properties_set": 0})
+    # ordinary writes keep the cached schema
+    assert not is_schema_change(
+        {"properties_set": 2, "relationships_created": 1, "nodes_deleted": 1}
+    )
+    assert not is_schema_change({})
+
+
+def test_has_updates():
+    assert has_updates({"nodes_created": 1})
+    assert not has_updates({"nodes_created": 0, "_contains_updates": True})
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_schema_cache_reuses_value_within_ttl():
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return f"schema-{calls}"
+
+    cache = SchemaCache(ttl=60)
+
+    assert await cache.get(loader) == "schema-1"
+    assert await cache.get(loader) == "schema-1"
+    assert calls == 1
+
+    cache.invalidate()
+
+    assert await cache.get(loader) == "schema-2"
+    assert calls == 2
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_schema_cache_disabled_with_zero_ttl():
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        return "schema"
+
+    cache = SchemaCache(ttl=0)
+
+    await cache.get(loader)
+    await cache.get(loader)
+    assert calls == 2
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_schema_cache_shares_inflight_load():
+    calls = 0
+    release = asyncio.Event()
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "schema"
+
+    cache = SchemaCache(ttl=60)
+    waiters = [asyncio.create_task(cache.get(loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["schema"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_schema_cache_discards_load_invalidated_midway():
+    release = asyncio.Event()
+
+    async def loader():
+        await release.wait()
+        return "stale"
+
+    cache = SchemaCache(ttl=60)
+    waiter = asyncio.create_task(cache.get(loader))
+    await asyncio.sleep(0)
+    cache.invalidate()
+    release.set()
+
+    assert await waiter == "stale"
+
+    async def fresh_loader():
+        return "fresh"
+
+    assert await cache.get(fresh_loader) == "fresh"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_schema_cache_does_not_cache_errors():
+    async def failing_loader():
+        raise RuntimeError("boom")
+
+    async def loader():
+        return "schema"
+
+    cache = SchemaCache(ttl=60)
+
+    with pytest.raises(RuntimeError):
+        await cache.get(failing_loader)
+
+    assert await cache.get(loader) == "schema"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_schema_cache_update_merges_labels():
+    async def loader():
+        return {"Person": {"label": "Person"}, "Movie": {"label": "Movie"}}
+
+    cache = SchemaCache(ttl=60)
+
+    assert cache.update({"Person": {"label": "Person", "attributes": {}}}) is None
+
+    await cache.get(loader)
+    schema = cache.update(
+        {"Person": {"label": "Person", "attributes": {}}, "Movie": None}
+    )
+
+    assert schema == {"Person": {"label": "Person", "attributes": {}}}
+    assert await cache.get(loader) == schema
+
+
+def test_params_key_is_canonical():
+    assert params_key({"a": 1, "b": {"d": 2, "c": 3}}) == params_key(
+        {"b": {"c": 3, "d": 2}, "a": 1}
+    )
+    assert params_key(None) == params_key({})
+    assert params_key({"a": 1}) != params_key({"a": "1"})
+
+
+def test_result_cache_hits_and_misses():
+    cache = ResultCache(max_bytes=100)
+
+    assert cache.get("q") is None
+    cache.put("q", ["result"], 6)
+    assert cache.get("q") == ["result"]
+
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["bytes"] == 6
+
+
+def test_result_cache_evicts_least_recently_used_by_size():
+    cache = ResultCache(max_bytes=10)
+
+    cache.put("a", "a", 4)
+    cache.put("b", "b", 4)
+    cache.get("a")
+    cache.put("c", "c", 4)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a"
+    assert cache.get("c") == "c"
+    assert cache.stats()["evictions"] == 1
+
+    # larger than the whole cache, never stored
+    cache.put("d", "d", 11)
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+
+def test_result_cache_expires_entries(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr("mcp_neo4j_cypher.cache.time.monotonic", lambda: now)
+    cache = ResultCache(max_bytes=100, ttl=10)
+
+    cache.put("q", "result", 6)
+    now += 11
+
+    assert cache.get("q") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_result_cache_invalidates_by_scope():
+    cache = ResultCache(max_bytes=100)
+    cache.put("people", 1, 1, frozenset({"Person"}))
+    cache.put("cities", 2, 1, frozenset({"City"}))
+    cache.put("anything", 3, 1, None)
+
+    cache.invalidate(frozenset({"Person", "FRIEND"}))
+
+    assert cache.get("people") is None
+    assert cache.get("anything") is None
+    assert cache.get("cities") == 2
+
+    cache.invalidate()
+    assert cache.get("cities") is None
+    assert cache.stats()["invalidations"] == 3
+
+
+def test_result_cache_skips_results_read_before_invalidation():
+    cache = ResultCache(max_bytes=100)
+
+    generation = cache.generation
+    cache.invalidate(frozenset({"Person"}))
+    cache.put("q", "stale", 5, frozenset({"City"}), generation)
+
+    assert cache.get("q") is None
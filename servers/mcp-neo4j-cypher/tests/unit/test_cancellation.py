@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from fakes import FakeDriver, FakeResult
+from neo4j import READ_ACCESS, WRITE_ACCESS
+
+from mcp_neo4j_cypher.cancellation import (
+    METADATA_KEY,
+    SHOW_QUERY,
+    TERMINATE_QUERY,
+    Terminator,
+)
+
+
+class Driver(FakeDriver):
+    def __init__(self, transactions=(), fail=False):
+        super().__init__()
+        self.transactions = list(transactions)
+        self.fail = fail
+
+    def respond(self, query, params):
+        if self.fail:
+            raise RuntimeError("connection refused")
+        if query == SHOW_QUERY:
+            return FakeResult([{"transactionId": tx} for tx in self.transactions])
+        return FakeResult()
+
+
+async def _cancel(terminator, *args):
+    started = asyncio.Event()
+    tags = []
+
+    async def call():
+        async with terminator.cancellable(*args) as metadata:
+            tags.append(metadata)
+            started.set()
+            await asyncio.sleep(60)
+
+    task = asyncio.create_task(call())
+    await started.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    await asyncio.gather(*terminator._tasks)
+    return tags[0]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cancelled_call_terminates_its_transactions():
+    driver = Driver(["neo4j-transaction-7"])
+    terminator = Terminator(driver)
+
+    metadata = await _cancel(terminator, "movies", READ_ACCESS)
+
+    call = metadata[METADATA_KEY]
+    assert driver.runs == [
+        (SHOW_QUERY, {"call": call}),
+        (TERMINATE_QUERY, {"ids": ["neo4j-transaction-7"]}),
+    ]
+    assert driver.sessions == [
+        {"database": "movies", "default_access_mode": READ_ACCESS}
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cancellable_reuses_metadata():
+    driver = Driver()
+    terminator = Terminator(driver)
+
+    metadata = await _cancel(terminator, "neo4j", WRITE_ACCESS, {METADATA_KEY: "c1"})
+
+    assert metadata == {METADATA_KEY: "c1"}
+    # no transaction is left, there is nothing to terminate
+    assert driver.runs == [(SHOW_QUERY, {"call": "c1"})]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_completed_call_terminates_nothing():
+    driver = Driver(["neo4j-transaction-7"])
+    terminator = Terminator(driver)
+
+    async with terminator.cancellable("neo4j") as first:
+        pass
+    async with terminator.cancellable("neo4j") as second:
+        pass
+
+    assert first != second
+    assert driver.runs == []
+    assert not terminator._tasks
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_failed_termination_is_logged():
+    terminator = Terminator(Driver(fail=True))
+
+    assert await terminator.terminate("neo4j", "c1") == []
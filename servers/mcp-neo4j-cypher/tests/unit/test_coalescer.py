@@ -0,0 +1,181 @@
+import asyncio
+
+import pytest
+from fakes import FakeCounters, FakeDriver, FakeResult, FakeSession, FakeSummary
+from neo4j import AsyncGraphDatabase, Bookmarks
+
+from mcp_neo4j_cypher.coalescer import WriteCoalescer, is_coalescible
+
+
+def test_is_coalescible():
+    assert is_coalescible("MERGE (p:Person {id: $id})")
+    assert is_coalescible("MATCH (n:Index) SET n.index = 1")
+    assert not is_coalescible("CREATE INDEX FOR (n:Person) ON (n.id)")
+    assert not is_coalescible("DROP CONSTRAINT person_id")
+    assert not is_coalescible(
+        "UNWIND $rows AS row CALL { WITH row CREATE (n) } IN TRANSACTIONS"
+    )
+
+
+class Session(FakeSession):
+    async def execute_write(self, fn, writes):
+        bookmarks = self.config.get("bookmarks")
+        self.driver.transactions.append([w.query for w in writes])
+        self.driver.bookmarks.append(set(bookmarks.raw_values) if bookmarks else set())
+        return await super().execute_write(fn, writes)
+
+    async def last_bookmarks(self):
+        return Bookmarks.from_raw_values([f"tx:{len(self.driver.transactions)}"])
+
+
+class Driver(FakeDriver):
+    session_class = Session
+
+    def __init__(self):
+        super().__init__()
+        self.transactions = []
+        self.bookmarks = []
+
+    def respond(self, query, params):
+        if "fail" in query:
+            raise RuntimeError("constraint violated")
+        return FakeResult(summary=FakeSummary(FakeCounters(nodes_created=params["n"])))
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_coalescer_commits_concurrent_writes_together():
+    driver = Driver()
+    coalescer = WriteCoalescer(driver, window=0.01)
+
+    results = await asyncio.gather(
+        *(coalescer.submit(f"CREATE (:N {{i: {i}}})", {"n": i}) for i in range(3))
+    )
+
+    assert [r["nodes_created"] for r in results] == [0, 1, 2]
+    assert len(driver.transactions) == 1
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_coalescer_flushes_full_batches():
+    driver = Driver()
+    coalescer = WriteCoalescer(driver, window=10, max_batch=2)
+
+    await asyncio.wait_for(
+        asyncio.gather(*(coalescer.submit("CREATE (n)", {"n": 1}) for _ in range(4))),
+        1,
+    )
+
+    assert [len(t) for t in driver.transactions] == [2, 2]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_coalescer_isolates_failing_write():
+    driver = Driver()
+    coalescer = WriteCoalescer(driver, window=0.01)
+
+    queries = ["CREATE (a)", "CREATE (b)", "CREATE (fail)", "CREATE (c)"]
+    results = await asyncio.gather(
+        *(coalescer.submit(q, {"n": 1}) for q in queries), return_exceptions=True
+    )
+
+    assert isinstance(results[2], RuntimeError)
+    assert all(r == {"nodes_created": 1} for i, r in enumerate(results) if i != 2)
+    # the whole batch, then the halves, then the failing half split again
+    assert driver.transactions == [
+        queries,
+        queries[:2],
+        queries[2:],
+        ["CREATE (fail)"],
+        ["CREATE (c)"],
+    ]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_coalescer_skips_cancelled_writes():
+    driver = Driver()
+    coalescer = WriteCoalescer(driver, window=0.01)
+
+    cancelled = asyncio.create_task(coalescer.submit("CREATE (a)", {"n": 1}))
+    kept = asyncio.create_task(coalescer.submit("CREATE (b)", {"n": 1}))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await kept == {"nodes_created": 1}
+    assert driver.transactions == [["CREATE (b)"]]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_coalescer_passes_bookmarks_between_callers_and_batches():
+    driver = Driver()
+    coalescer = WriteCoalescer(driver, window=0.01)
+    alice = AsyncGraphDatabase.bookmark_manager(initial_bookmarks=["tx:alice"])
+    bob = AsyncGraphDatabase.bookmark_manager(initial_bookmarks=["tx:bob"])
+
+    await asyncio.gather(
+        coalescer.submit("CREATE (:A)", {"n": 1}, alice),
+        coalescer.submit("CREATE (:B)", {"n": 1}, bob),
+        coalescer.submit("CREATE (:C)", {"n": 1}),
+    )
+    await coalescer.submit("CREATE (:A)", {"n": 1}, alice)
+
+    # the batch starts after the writes of every caller
+    assert driver.bookmarks == [{"tx:alice", "tx:bob"}, {"tx:1"}]
+    assert await alice.get_bookmarks() == {"tx:2"}
+    assert await bob.get_bookmarks() == {"tx:1"}
+
+
+class StalledSession(Session):
+    async def execute_write(self, fn, writes):
+        self.driver.started.set()
+        await asyncio.Event().wait()
+
+
+class StalledDriver(Driver):
+    session_class = StalledSession
+
+    def __init__(self):
+        super().__init__()
+        self.started = asyncio.Event()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_coalescer_fails_writes_of_a_cancelled_commit():
+    driver = StalledDriver()
+    coalescer = WriteCoalescer(driver, window=0.01)
+
+    writes = [
+        asyncio.create_task(coalescer.submit("CREATE (a)", {"n": 1})),
+        asyncio.create_task(coalescer.submit("CREATE (b)", {"n": 1})),
+    ]
+    await driver.started.wait()
+    # as on shutdown
+    for commit in coalescer._commits:
+        commit.cancel()
+
+    results = await asyncio.wait_for(asyncio.gather(*writes, return_exceptions=True), 1)
+    assert [str(r) for r in results] == [
+        "The write was cancelled before its commit was confirmed"
+    ] * 2
+
+
+class FailingBookmarkManager:
+    async def get_bookmarks(self):
+        raise RuntimeError("bookmarks unavailable")
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_coalescer_fails_writes_when_bookmarks_cannot_be_read():
+    driver = Driver()
+    coalescer = WriteCoalescer(driver, window=0.01)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            coalescer.submit("CREATE (a)", {"n": 1}, FailingBookmarkManager()),
+            coalescer.submit("CREATE (b)", {"n": 1}),
+            return_exceptions=True,
+        ),
+        1,
+    )
+
+    assert [str(r) for r in results] == ["bookmarks unavailable"] * 2
+    assert driver.transactions == []
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+
+from mcp_neo4j_cypher.cursors import Cursor, CursorRegistry
+from mcp_neo4j_cypher.formats import RowsEncoder
+
+
+class FakeResult:
+    def __init__(self, records):
+        self.records = list(records)
+
+    async def fetch(self, n):
+        page, self.records = self.records[:n], self.records[n:]
+        return page
+
+    async def peek(self):
+        return self.records[0] if self.records else None
+
+
+class StrEncoder(RowsEncoder):
+    def _encode_row(self, record):
+        return str(record).encode()
+
+
+async def fetch(cursor, n):
+    encoder = StrEncoder([])
+    added, has_more, exhausted_budget = await cursor.fetch(n, encoder)
+    assert added == len(encoder._parts)
+    return [part.decode() for part in encoder._parts], has_more, exhausted_budget
+
+
+class FakeClosable:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def make_cursor(records=(), **budgets):
+    return Cursor(FakeClosable(), FakeClosable(), FakeResult(records), **budgets)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cursor_fetch_pages():
+    cursor = make_cursor(range(5))
+
+    assert await fetch(cursor, 2) == (["0", "1"], True, None)
+    assert await fetch(cursor, 2) == (["2", "3"], True, None)
+    assert await fetch(cursor, 2) == (["4"], False, None)
+    assert cursor.rows == 5
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cursor_stops_at_max_rows():
+    cursor = make_cursor(range(10), max_rows=3)
+
+    assert await fetch(cursor, 2) == (["0", "1"], True, None)
+    assert await fetch(cursor, 2) == (["2"], False, "max_rows")
+    assert cursor.rows == 3
+    # the rest of the result is left unread
+    assert cursor.result.records == list(range(3, 10))
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cursor_max_rows_matching_result_is_not_truncated():
+    cursor = make_cursor(range(3), max_rows=3)
+
+    assert await fetch(cursor, 5) == (["0", "1", "2"], False, None)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cursor_stops_at_max_bytes():
+    cursor = make_cursor(["aaaa", "bbbb", "cccc"], max_bytes=14)
+
+    assert await fetch(cursor, 10) == (["aaaa", "bbbb"], False, "max_bytes")
+    assert cursor.rows == 2
+    assert cursor.bytes == 10
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_registry_get_and_close():
+    registry = CursorRegistry()
+    cursor = make_cursor()
+    token = await registry.register(cursor)
+
+    assert await registry.get(token) is cursor
+
+    await registry.close(token)
+
+    assert cursor.closed
+    assert cursor.session.closed and cursor.tx.closed
+    with pytest.raises(ValueError):
+        await registry.get(token)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_registry_closes_least_recently_used_cursor():
+    registry = CursorRegistry(max_open=2)
+    first, second, third = make_cursor(), make_cursor(), make_cursor()
+    first_token = await registry.register(first)
+    second_token = await registry.register(second)
+
+    # touching the first cursor makes the second one the least recently used
+    await registry.get(first_token)
+    await registry.register(third)
+
+    assert len(registry) == 2
+    assert second.closed and not first.closed
+    with pytest.raises(ValueError):
+        await registry.get(second_token)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_registry_does_not_close_cursors_being_read():
+    registry = CursorRegistry(max_open=2)
+    first, second, third, fourth = (make_cursor() for _ in range(4))
+    await registry.register(first)
+    await registry.register(second)
+
+    async with first.lock:
+        await registry.register(third)
+        assert second.closed and not first.closed
+
+        async with third.lock:
+            with pytest.raises(ValueError, match="Too many open results"):
+                await registry.register(fourth)
+        assert fourth.closed and not first.closed and not third.closed
+        assert len(registry) == 2
+
+    await registry.close_all()
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_registry_expires_idle_cursors():
+    registry = CursorRegistry(idle_timeout=0.05)
+    cursor = make_cursor()
+    token = await registry.register(cursor)
+
+    await asyncio.sleep(0.1)
+
+    with pytest.raises(ValueError):
+        await registry.get(token)
+    assert cursor.closed
+
+    await registry.close_all()
@@ -0,0 +1,202 @@
+import pytest
+
+from mcp_neo4j_cypher.cypher import (
+    normalize_query,
+    parameterize,
+    read_scope,
+    write_scope,
+)
+
+
+def test_normalize_query_strips_whitespace_and_comments():
+    query = """
+    MATCH (n:Person)  // people only
+    /* a block
+       comment */
+    RETURN n.name,   'two  spaces // kept'
+    """
+
+    assert normalize_query(query) == normalize_query(
+        "MATCH (n:Person) RETURN n.name, 'two  spaces // kept'"
+    )
+    assert "two  spaces // kept" in normalize_query(query)
+    assert "people" not in normalize_query(query)
+
+
+def test_normalize_query_keeps_case_and_quoting():
+    assert normalize_query("MATCH (n:person)") != normalize_query("MATCH (n:Person)")
+    assert normalize_query("RETURN `a b`") == "RETURN `a b`"
+
+
+@pytest.mark.parametrize(
+    "query, scope",
+    [
+        ("MATCH (n:Person) RETURN n", {"Person"}),
+        (
+            "MATCH (n:Person)-[:FRIEND]->(m:Person) RETURN n.name, count(m)",
+            {"Person", "FRIEND"},
+        ),
+        (
+            "MATCH (n:Person {name: $name}) WITH n MATCH (n)-[:FRIEND*1..2]-(m:City) RETURN m",
+            {"Person", "FRIEND", "City"},
+        ),
+        ("MATCH (n:`Odd Label`) WHERE (n.age > 3) RETURN n", {"Odd Label"}),
+        ("MATCH (n:A|B) RETURN n", {"A", "B"}),
+    ],
+)
+def test_read_scope(query, scope):
+    assert read_scope(query) == scope
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "MATCH (n) RETURN n",
+        "MATCH (a:Person)-->(b:Person) RETURN a",
+        "MATCH (a:Person)-[r]->(b:Person) RETURN a",
+        "MATCH p = (a:Person)-[:FRIEND]->(b) RETURN p",
+        "MATCH (n:Person) RETURN apoc.node.degree(n)",
+        "CALL db.labels() YIELD label RETURN label",
+        "MATCH (n:$($label)) RETURN n",
+    ],
+)
+def test_read_scope_unbounded(query):
+    assert read_scope(query) is None
+
+
+@pytest.mark.parametrize(
+    "query, scope",
+    [
+        ("CREATE (n:Person {name: $name})", {"Person"}),
+        ("UNWIND $rows AS row CREATE (:Event {id: row.id})", {"Event"}),
+        (
+            "MATCH (a:Person), (b:City) CREATE (a)-[:LIVES_IN]->(b)",
+            {"Person", "City", "LIVES_IN"},
+        ),
+    ],
+)
+def test_write_scope(query, scope):
+    assert write_scope(query) == scope
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "MATCH (n:Person) SET n.age = 1",
+        "MATCH (n:Person) DETACH DELETE n",
+        "MERGE (n:Person {name: $name})",
+        "CREATE INDEX FOR (n:Person) ON (n.name)",
+        "CREATE (n:$($label))",
+        "CALL apoc.create.node(['Person'], {})",
+    ],
+)
+def test_write_scope_unknown(query):
+    assert write_scope(query) is None
+
+
+def test_parameterize_lifts_literals():
+    query, params = parameterize(
+        """
+        MATCH (e:Incident)  // open incidents
+        WHERE e.id = 'INC-123' AND e.score > 2.5 AND e.kind IN ["road", 'rail']
+        RETURN e.id AS id, e.score * 2 AS score
+        ORDER BY score SKIP 5 LIMIT 10
+        """,
+        {"since": 2024},
+    )
+
+    assert query == (
+        "MATCH (e:Incident) WHERE e.id = $lit0 AND e.score > $lit1 "
+        "AND e.kind IN [$lit2, $lit3] RETURN e.id AS id, e.score * $lit4 AS score "
+        "ORDER BY score SKIP $lit5 LIMIT $lit6"
+    )
+    assert params == {
+        "since": 2024,
+        "lit0": "INC-123",
+        "lit1": 2.5,
+        "lit2": "road",
+        "lit3": "rail",
+        "lit4": 2,
+        "lit5": 5,
+        "lit6": 10,
+    }
+
+
+def test_parameterize_shares_the_text_of_queries_differing_in_literals():
+    first, first_params = parameterize("MATCH (e {id: 'INC-1'}) RETURN e")
+    second, second_params = parameterize("MATCH (e {id:  'INC-2'})\nRETURN e")
+
+    assert first == second
+    assert first_params == {"lit0": "INC-1"}
+    assert second_params == {"lit0": "INC-2"}
+
+
+@pytest.mark.parametrize(
+    "literal, value",
+    [
+        ("'it\\'s'", "it's"),
+        ('"a\\tb\\\\"', "a\tb\\"),
+        ("'\\u00e9'", "é"),
+        ("0x1F", 31),
+        ("0o17", 15),
+        ("1_000", 1000),
+        ("1e3", 1000.0),
+        (".5", 0.5),
+    ],
+)
+def test_parameterize_reads_literal_values(literal, value):
+    assert parameterize(f"MATCH (n) WHERE n.v = {literal} RETURN n")[1] == {
+        "lit0": value
+    }
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        # variable length relationships and quantified path patterns
+        "MATCH p = (a)-[*1..3]->(b) RETURN p",
+        "MATCH (a)-[r:KNOWS|LIKES*2]->(b) RETURN b",
+        "MATCH ((a)-->(b)){2,5} RETURN a",
+        # unaliased RETURN items name their column after their text
+        "MATCH (n) RETURN n.age + 1, 'label', n {.name, k: 3}",
+        # literals that cannot be read are kept
+        "MATCH (n) WHERE n.v = 010 AND n.s = 'a\\qb' RETURN n",
+        # commands
+        "SHOW INDEXES WHERE name = 'by_id'",
+    ],
+)
+def test_parameterize_keeps_structural_literals(query):
+    assert parameterize(query) == (query, {})
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        "CYPHER 5",
+        "CYPHER 25",
+        "CYPHER 5 runtime=slotted",
+        "EXPLAIN CYPHER 5",
+        "CYPHER 5 PROFILE",
+    ],
+)
+def test_parameterize_keeps_query_options(options):
+    assert parameterize(f"{options} MATCH (n) WHERE n.x = 1 RETURN n") == (
+        f"{options} MATCH (n) WHERE n.x = $lit0 RETURN n",
+        {"lit0": 1},
+    )
+
+
+def test_parameterize_lifts_aliased_return_items():
+    assert parameterize("CALL { RETURN 1 } RETURN 2 AS two") == (
+        "CALL { RETURN 1 } RETURN $lit0 AS two",
+        {"lit0": 2},
+    )
+
+
+def test_parameterize_avoids_existing_parameter_names():
+    query, params = parameterize(
+        "MATCH (n) WHERE n.a = $lit0 AND n.b = 'x' RETURN n", {"lit0": 1}
+    )
+
+    assert query == "MATCH (n) WHERE n.a = $lit0 AND n.b = $_lit0 RETURN n"
+    assert params == {"lit0": 1, "_lit0": "x"}
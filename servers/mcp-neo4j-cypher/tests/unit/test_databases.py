@@ -0,0 +1,42 @@
+import pytest
+
+from mcp_neo4j_cypher.databases import Databases, PerDatabase
+
+
+def test_resolve_defaults_to_the_default_database():
+    databases = Databases("neo4j", ["movies"])
+
+    assert databases.resolve(None) == "neo4j"
+    assert databases.resolve("movies") == "movies"
+
+
+def test_resolve_is_case_insensitive():
+    databases = Databases("Neo4j", ["Movies"])
+
+    assert databases.resolve(None) == "neo4j"
+    assert databases.resolve("NEO4J") == "neo4j"
+    assert databases.resolve("movies") == "movies"
+
+
+def test_resolve_rejects_databases_not_allowed():
+    databases = Databases("neo4j")
+
+    with pytest.raises(ValueError, match="'movies' is not allowed"):
+        databases.resolve("movies")
+
+
+def test_per_database_objects_are_created_once_on_first_use():
+    created = []
+
+    def factory(database: str) -> dict:
+        created.append(database)
+        return {"database": database}
+
+    values = PerDatabase(factory)
+    assert values.get("neo4j") is None
+    assert created == []
+
+    assert values["neo4j"] is values["neo4j"]
+    assert values["movies"] == {"database": "movies"}
+    assert created == ["neo4j", "movies"]
+    assert values.get("neo4j") == {"database": "neo4j"}
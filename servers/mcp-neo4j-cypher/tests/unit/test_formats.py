@@ -0,0 +1,115 @@
+import json
+
+from neo4j import Record
+from neo4j.graph import Graph, Node, Path
+
+from mcp_neo4j_cypher.formats import page_encoder
+
+
+def make_records():
+    graph = Graph()
+    alice = Node(graph, "4:db:1", 1, ["Person"], {"name": "Alice"})
+    bob = Node(graph, "4:db:2", 2, ["Person"], {"name": "Bob"})
+    knows = graph.relationship_type("KNOWS")(graph, "5:db:1", 1, {})
+    knows._start_node = alice
+    knows._end_node = bob
+    return [
+        Record({"a": alice, "r": knows, "b": bob}),
+        Record({"a": bob, "r": None, "b": alice}),
+    ], Path(alice, knows)
+
+
+def encode_page(result_format, records, keys):
+    encoder = page_encoder(result_format, keys)
+    size = 0
+    for record in records:
+        size += encoder.encode(record)
+        encoder.accept()
+    return encoder.page(), size
+
+
+def test_rows_format():
+    records = [Record({"name": "Alice", "age": 30}), Record({"name": "Bob", "age": 25})]
+
+    page, size = encode_page("rows", records, ["name", "age"])
+
+    assert json.loads(page) == [
+        {"name": "Alice", "age": 30},
+        {"name": "Bob", "age": 25},
+    ]
+    assert size == len(page) - 1
+
+
+def test_columnar_format():
+    records = [Record({"name": "Alice", "age": 30}), Record({"name": "Bob", "age": 25})]
+
+    page, _ = encode_page("columnar", records, ["name", "age"])
+
+    assert json.loads(page) == {
+        "columns": ["name", "age"],
+        "rows": [["Alice", 30], ["Bob", 25]],
+    }
+
+
+def test_columnar_format_empty_page_keeps_columns():
+    page, _ = encode_page("columnar", [], ["name"])
+
+    assert json.loads(page) == {"columns": ["name"], "rows": []}
+
+
+def test_graph_format_deduplicates_entities():
+    records, _ = make_records()
+
+    page, size = encode_page("graph", records, ["a", "r", "b"])
+    result = json.loads(page)
+
+    assert result["nodes"] == {
+        "4:db:1": {"labels": ["Person"], "properties": {"name": "Alice"}},
+        "4:db:2": {"labels": ["Person"], "properties": {"name": "Bob"}},
+    }
+    assert result["relationships"] == {
+        "5:db:1": {
+            "type": "KNOWS",
+            "start": "4:db:1",
+            "end": "4:db:2",
+            "properties": {},
+        }
+    }
+    assert result["rows"] == [
+        {
+            "a": {"$node": "4:db:1"},
+            "r": {"$relationship": "5:db:1"},
+            "b": {"$node": "4:db:2"},
+        },
+        {"a": {"$node": "4:db:2"}, "r": None, "b": {"$node": "4:db:1"}},
+    ]
+    # the reported sizes account for the entities as well as the rows
+    assert abs(size - len(page)) < 40
+
+
+def test_graph_format_paths_and_nested_values():
+    _, path = make_records()
+
+    page, _ = encode_page(
+        "graph", [Record({"p": path, "ns": [path.start_node]})], ["p"]
+    )
+    result = json.loads(page)
+
+    assert result["rows"] == [
+        {
+            "p": {
+                "$path": {"nodes": ["4:db:1", "4:db:2"], "relationships": ["5:db:1"]}
+            },
+            "ns": [{"$node": "4:db:1"}],
+        }
+    ]
+    assert set(result["nodes"]) == {"4:db:1", "4:db:2"}
+
+
+def test_unaccepted_record_is_not_in_page():
+    records, _ = make_records()
+    encoder = page_encoder("graph", ["a", "r", "b"])
+
+    encoder.encode(records[0])
+
+    assert json.loads(encoder.page()) == {"nodes": {}, "relationships": {}, "rows": []}
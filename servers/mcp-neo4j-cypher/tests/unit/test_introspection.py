@@ -0,0 +1,149 @@
+import json
+
+import pytest
+from fakes import FakeDriver, FakeResult
+from mcp.server.fastmcp import Context
+from neo4j.spatial import CartesianPoint
+from neo4j.time import Date, DateTime, Duration, Time
+
+from mcp_neo4j_cypher.introspection import (
+    APOC_AVAILABLE_QUERY,
+    INDEXES_QUERY,
+    LABELS_QUERY,
+    RELATIONSHIP_TYPES_QUERY,
+    UNIQUE_CONSTRAINTS_QUERY,
+    SchemaIntrospector,
+    _property_type,
+    _quote,
+)
+from mcp_neo4j_cypher.server import create_mcp_server
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (True, "BOOLEAN"),
+        (42, "INTEGER"),
+        (4.2, "FLOAT"),
+        ("Alice", "STRING"),
+        (b"\x00", "BYTE_ARRAY"),
+        (Date(2024, 1, 31), "DATE"),
+        (DateTime(2024, 1, 31, 12, 0, 0), "LOCAL_DATE_TIME"),
+        (Time(12, 0, 0), "LOCAL_TIME"),
+        (Duration(days=1), "DURATION"),
+        (CartesianPoint((1.0, 2.0)), "POINT"),
+        (["a", "b"], "LIST OF STRING"),
+        ([], "LIST"),
+    ],
+)
+def test_property_type(value, expected):
+    assert _property_type(value) == expected
+
+
+def test_quote_escapes_backticks():
+    assert _quote("Person") == "`Person`"
+    assert _quote("We`ird") == "`We``ird`"
+
+
+# Person {name, age} -[:FRIEND]-> Person, Tag nodes without properties, and a
+# Ghost label that no node has anymore
+GRAPH = {
+    "Person": {
+        "properties": [{"key": "name", "value": "Alice"}, {"key": "age", "value": 30}],
+        "apoc": [{"key": "name", "type": "STRING"}, {"key": "age", "type": "INTEGER"}],
+        "relationships": [{"type": "FRIEND", "target": "Person"}],
+        "found": True,
+    },
+    "Tag": {"properties": [], "apoc": [], "relationships": [], "found": True},
+    "Ghost": {"properties": [], "apoc": [], "relationships": [], "found": False},
+}
+
+
+class Driver(FakeDriver):
+    def __init__(self, apoc=False):
+        super().__init__()
+        self.apoc = apoc
+
+    def respond(self, query, params):
+        return FakeResult(self.records(query))
+
+    def records(self, query):
+        if query == LABELS_QUERY:
+            return [{"label": label} for label in GRAPH] + [{"label": "_Bloom"}]
+        if query == RELATIONSHIP_TYPES_QUERY:
+            return [{"relationshipType": "FRIEND"}]
+        if query == APOC_AVAILABLE_QUERY:
+            if self.apoc is None:
+                raise RuntimeError("SHOW FUNCTIONS is not allowed")
+            return [{"available": self.apoc}]
+        if query == INDEXES_QUERY:
+            return [{"labelsOrTypes": ["Person"], "properties": ["name"]}]
+        if query == UNIQUE_CONSTRAINTS_QUERY:
+            return []
+        label = query.split("`")[1]
+        if "apoc.meta.cypher.type" in query:
+            return GRAPH[label]["apoc"]
+        if "keys(n)" in query:
+            return GRAPH[label]["properties"]
+        if "type(r)" in query:
+            return GRAPH[label]["relationships"]
+        return [{"found": GRAPH[label]["found"]}]
+
+    def profiled(self):
+        return sorted(
+            query.split("`")[1] for query in self.queries if "keys(n)" in query
+        )
+
+
+PERSON = {
+    "label": "Person",
+    "attributes": {"age": "INTEGER", "name": "STRING indexed"},
+    "relationships": {"FRIEND": "Person"},
+}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+@pytest.mark.parametrize("apoc", [False, True, None])
+async def test_introspect_profiles_every_label(apoc):
+    driver = Driver(apoc)
+
+    schema = await SchemaIntrospector(driver).introspect()
+
+    assert schema == {
+        "Ghost": None,
+        "Person": PERSON,
+        "Tag": {"label": "Tag", "attributes": {}, "relationships": {}},
+    }
+    # values are typed server side only when APOC is available
+    typed = any("apoc.meta.cypher.type(" in query for query in driver.queries)
+    assert typed == bool(apoc)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_introspect_label_subset():
+    driver = Driver()
+
+    schema = await SchemaIntrospector(driver).introspect(["Person", "Person", "_Bloom"])
+
+    assert schema == {"Person": PERSON}
+    assert LABELS_QUERY not in driver.queries
+    assert driver.profiled() == ["Person"]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_schema_labels_are_profiled_once_when_not_cached():
+    driver = Driver()
+    mcp = create_mcp_server(driver)
+    get_schema = mcp._tool_manager.get_tool("get_neo4j_schema").fn
+
+    content = await get_schema(ctx=Context(), labels=["Person"], database=None)
+    assert [entry["label"] for entry in json.loads(content[0].text)] == [
+        "Person",
+        "Tag",
+    ]
+    assert driver.profiled() == ["Ghost", "Person", "Tag"]
+
+    # with a cached schema, only the given labels are profiled again
+    driver.runs.clear()
+    await get_schema(ctx=Context(), labels=["Person"], database=None)
+    assert driver.profiled() == ["Person"]
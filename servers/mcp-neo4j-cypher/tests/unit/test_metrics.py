@@ -0,0 +1,65 @@
+from mcp_neo4j_cypher.metrics import Registry
+
+
+def test_counter_renders_per_label_values():
+    registry = Registry("mcp_")
+    errors = registry.counter("errors_total", "Errors", ("tool",))
+    errors.inc("read")
+    errors.inc("read")
+    errors.inc("write", amount=3)
+
+    assert errors.value("read") == 2
+    assert registry.render() == (
+        "# HELP mcp_errors_total Errors\n"
+        "# TYPE mcp_errors_total counter\n"
+        'mcp_errors_total{tool="read"} 2\n'
+        'mcp_errors_total{tool="write"} 3\n'
+    )
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = Registry()
+    duration = registry.histogram("duration_seconds", "Duration", ("tool",), (0.1, 1))
+    for value in (0.05, 0.1, 0.5, 2):
+        duration.observe(value, "read")
+
+    assert duration.count("read") == 4
+    assert duration.count("write") == 0
+    assert registry.render().splitlines()[2:] == [
+        'duration_seconds_bucket{tool="read",le="0.1"} 2',
+        'duration_seconds_bucket{tool="read",le="1"} 3',
+        'duration_seconds_bucket{tool="read",le="+Inf"} 4',
+        'duration_seconds_sum{tool="read"} 2.65',
+        'duration_seconds_count{tool="read"} 4',
+    ]
+
+
+def test_gauge_is_collected_when_rendered():
+    connections = {"localhost:7687": 3}
+    registry = Registry()
+    registry.gauge(
+        "connections",
+        "Connections",
+        ("address",),
+        lambda: [((address,), n) for address, n in connections.items()],
+    )
+    registry.gauge("hits_total", "Hits", (), lambda: [((), 5)], kind="counter")
+
+    connections["localhost:7687"] = 4
+    assert registry.render().splitlines() == [
+        "# HELP connections Connections",
+        "# TYPE connections gauge",
+        'connections{address="localhost:7687"} 4',
+        "# HELP hits_total Hits",
+        "# TYPE hits_total counter",
+        "hits_total 5",
+    ]
+
+
+def test_label_values_are_escaped():
+    registry = Registry()
+    registry.counter("calls_total", "Calls", ("query",)).inc('RETURN "a\\b"\n')
+
+    assert registry.render().splitlines()[-1] == (
+        'calls_total{query="RETURN \\"a\\\\b\\"\\n"} 1'
+    )
@@ -0,0 +1,115 @@
+import pytest
+from fakes import FakeDriver, FakeResult, FakeSummary
+
+from mcp_neo4j_cypher.planner import PlanSummary, QueryGuard, summarize_plan
+
+
+def operator(operator_type, estimated_rows=1.0, details="", children=()):
+    return {
+        "operatorType": f"{operator_type}@neo4j",
+        "args": {"EstimatedRows": estimated_rows, "Details": details},
+        "identifiers": [],
+        "children": list(children),
+    }
+
+
+def test_summarize_plan_reads_largest_estimate():
+    plan = operator(
+        "ProduceResults",
+        10.0,
+        children=[operator("Limit", 10.0, children=[operator("AllNodesScan", 5e6)])],
+    )
+
+    summary = summarize_plan("r", plan)
+
+    assert summary.estimated_rows == 5e6
+    assert not summary.writes
+    assert not summary.cartesian_product
+    assert not summary.unbounded_expansion
+
+
+def test_summarize_plan_detects_cartesian_products():
+    plan = operator(
+        "ProduceResults",
+        children=[
+            operator(
+                "CartesianProduct",
+                children=[operator("NodeByLabelScan"), operator("NodeByLabelScan")],
+            )
+        ],
+    )
+
+    assert summarize_plan("r", plan).cartesian_product
+
+
+@pytest.mark.parametrize(
+    "details, unbounded",
+    [
+        ("(a)-[anon_0*]->(b)", True),
+        ("(a)-[r*2..]->(b)", True),
+        ("(a)-[r*..]->(b)", True),
+        ("(a)-[r*1..3]->(b)", False),
+        ("(a)-[r*3]->(b)", False),
+        ("(a) ((x)-[]->(y)){1, *} (b)", True),
+        ("(a) ((x)-[]->(y)){1, 5} (b)", False),
+    ],
+)
+def test_summarize_plan_detects_unbounded_expansions(details, unbounded):
+    plan = operator(
+        "ProduceResults", children=[operator("VarLengthExpand(All)", details=details)]
+    )
+
+    assert summarize_plan("r", plan).unbounded_expansion == unbounded
+
+
+@pytest.mark.parametrize("query_type", ["w", "rw", "s"])
+def test_plan_summary_writes(query_type):
+    assert summarize_plan(query_type, operator("ProduceResults")).writes
+
+
+def test_guard_check():
+    guard = QueryGuard(
+        None,
+        max_estimated_rows=1000,
+        reject_cartesian_products=True,
+        reject_unbounded_expansions=True,
+    )
+
+    guard.check(PlanSummary("r", 1000, False, False))
+    with pytest.raises(ValueError, match="estimates 1,001 rows"):
+        guard.check(PlanSummary("r", 1001, False, False))
+    with pytest.raises(ValueError, match="cartesian product"):
+        guard.check(PlanSummary("r", 1, True, False))
+    with pytest.raises(ValueError, match="upper bound"):
+        guard.check(PlanSummary("r", 1, False, True))
+
+
+def test_guard_check_without_limits():
+    QueryGuard(None).check(PlanSummary("r", 1e12, True, True))
+
+
+class Driver(FakeDriver):
+    def respond(self, query, params):
+        plan = operator("ProduceResults", 3.0)
+        return FakeResult(summary=FakeSummary(query_type="r", plan=plan))
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_guard_caches_plans_per_normalized_query():
+    driver = Driver()
+    guard = QueryGuard(driver)
+
+    first = await guard.plan("MATCH (n) RETURN n")
+    second = await guard.plan("MATCH (n)\n  RETURN n // again")
+
+    assert first == second == PlanSummary("r", 3.0, False, False)
+    assert driver.queries == ["EXPLAIN MATCH (n) RETURN n"]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_guard_replaces_profile_prefix():
+    driver = Driver()
+
+    await QueryGuard(driver).plan("PROFILE MATCH (n) RETURN n")
+
+    assert driver.queries == ["EXPLAIN  MATCH (n) RETURN n"]
@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+from neo4j import AsyncGraphDatabase
+
+from mcp_neo4j_cypher.pool import pool_status
+
+
+def test_pool_status_counts_connections_per_address():
+    pool = SimpleNamespace(
+        pool_config=SimpleNamespace(max_connection_pool_size=10),
+        connections={
+            "localhost:7687": [
+                SimpleNamespace(in_use=True),
+                SimpleNamespace(in_use=False),
+                SimpleNamespace(in_use=False),
+            ],
+            "localhost:7688": [],
+        },
+    )
+
+    assert pool_status(SimpleNamespace(_pool=pool)) == {
+        "max_connection_pool_size": 10,
+        "addresses": {
+            "localhost:7687": {"in_use": 1, "idle": 2},
+            "localhost:7688": {"in_use": 0, "idle": 0},
+        },
+    }
+
+
+def test_pool_status_of_unused_driver():
+    driver = AsyncGraphDatabase.driver(
+        "bolt://localhost:7687", max_connection_pool_size=5
+    )
+
+    assert pool_status(driver) == {"max_connection_pool_size": 5, "addresses": {}}
+
+
+def test_pool_status_without_pool():
+    assert pool_status(SimpleNamespace()) == {"addresses": {}}
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+from mcp.server.fastmcp import Context
+from neo4j.exceptions import ServiceUnavailable
+
+from mcp_neo4j_cypher import readiness
+from mcp_neo4j_cypher.planner import QueryRejected
+from mcp_neo4j_cypher.readiness import Readiness
+from mcp_neo4j_cypher.server import create_mcp_server
+
+READ_ARGUMENTS = dict(
+    params=None,
+    page_size=None,
+    max_rows=None,
+    max_bytes=None,
+    format="rows",
+    database=None,
+    timeout=None,
+)
+
+
+class FakeDriver:
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = 0
+
+    async def verify_connectivity(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("not yet")
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_readiness_checks_once():
+    driver = FakeDriver()
+    readiness = Readiness(driver)
+
+    await asyncio.gather(readiness.wait(), readiness.wait())
+    await readiness.wait()
+
+    assert readiness.ready
+    assert driver.calls == 1
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_readiness_retries_with_backoff():
+    driver = FakeDriver(failures=2)
+    readiness = Readiness(driver, attempts=3, initial_delay=0.01)
+
+    await readiness.wait()
+
+    assert readiness.ready
+    assert driver.calls == 3
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_readiness_failure_is_checked_again():
+    driver = FakeDriver(failures=2)
+    readiness = Readiness(driver, attempts=2, initial_delay=0.01)
+
+    with pytest.raises(ConnectionError):
+        await readiness.wait()
+    assert not readiness.ready
+
+    await readiness.wait()
+    assert readiness.ready
+    assert driver.calls == 3
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_readiness_starts_in_background():
+    driver = FakeDriver()
+    readiness = Readiness(driver)
+
+    readiness.start()
+    await asyncio.sleep(0)
+
+    assert driver.calls == 1
+    await readiness.wait()
+    assert driver.calls == 1
+
+
+class UnreachableDriver:
+    def __init__(self):
+        self.calls = 0
+
+    async def verify_connectivity(self):
+        self.calls += 1
+        raise ServiceUnavailable("unreachable")
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_reads_that_write_are_rejected_without_waiting():
+    driver = UnreachableDriver()
+    read = create_mcp_server(driver)._tool_manager.get_tool("read_neo4j_cypher").fn
+
+    with pytest.raises(QueryRejected):
+        await read(ctx=Context(), query="CREATE (n)", **READ_ARGUMENTS)
+    assert driver.calls == 0
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_unreachable_database_is_reported_as_an_error(monkeypatch):
+    async def sleep(delay):
+        pass
+
+    monkeypatch.setattr(readiness.asyncio, "sleep", sleep)
+    driver = UnreachableDriver()
+    read = create_mcp_server(driver)._tool_manager.get_tool("read_neo4j_cypher").fn
+
+    content = await read(ctx=Context(), query="MATCH (n) RETURN n", **READ_ARGUMENTS)
+
+    assert content[0].text.startswith("Error: unreachable\nMATCH (n) RETURN n")
+    assert driver.calls == 5
@@ -0,0 +1,147 @@
+import asyncio
+
+import pytest
+from neo4j.exceptions import (
+    CypherSyntaxError,
+    IncompleteCommit,
+    Neo4jError,
+    ServiceUnavailable,
+    SessionExpired,
+)
+
+from mcp_neo4j_cypher import retry
+from mcp_neo4j_cypher.retry import RetryPolicy, error_name, is_transient
+
+DEADLOCK = "Neo.TransientError.Transaction.DeadlockDetected"
+SYNTAX_ERROR = "Neo.ClientError.Statement.SyntaxError"
+
+
+def _neo4j_error(code: str) -> Neo4jError:
+    # the error class of the code, as the driver builds it from a failure
+    return Neo4jError._hydrate_neo4j(code=code, message="failed")
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(retry.asyncio, "sleep", sleep)
+    return delays
+
+
+def test_transient_errors():
+    assert is_transient(_neo4j_error(DEADLOCK))
+    assert is_transient(_neo4j_error("Neo.TransientError.General.DatabaseUnavailable"))
+    assert is_transient(ServiceUnavailable("connection reset"))
+    assert is_transient(SessionExpired("leader switched"))
+
+    assert not is_transient(_neo4j_error(SYNTAX_ERROR))
+    assert not is_transient(
+        _neo4j_error("Neo.ClientError.Transaction.TransactionTimedOut")
+    )
+    # the commit may have happened, running the write again could repeat it
+    assert not is_transient(IncompleteCommit("connection lost during commit"))
+    assert not is_transient(ValueError("not a driver error"))
+
+
+def test_error_name():
+    assert error_name(_neo4j_error(DEADLOCK)) == DEADLOCK
+    assert error_name(ServiceUnavailable("connection reset")) == "ServiceUnavailable"
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_transient_errors_are_retried_with_backoff(sleeps):
+    policy = RetryPolicy(max_retries=5, initial_delay=0.1, max_delay=0.3)
+    errors = [_neo4j_error(DEADLOCK)] * 3 + [ServiceUnavailable("reset")]
+
+    async def run():
+        if errors:
+            raise errors.pop(0)
+        return "done"
+
+    assert await policy.run("write", run) == "done"
+
+    # doubled up to the maximum, half of each delay is random
+    assert len(sleeps) == 4
+    for delay, sleep in zip((0.1, 0.2, 0.3, 0.3), sleeps):
+        assert delay / 2 <= sleep <= delay
+    assert policy.retries == {
+        ("write", DEADLOCK): 3,
+        ("write", "ServiceUnavailable"): 1,
+    }
+    assert policy.exhausted == {}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_permanent_errors_are_raised_at_once(sleeps):
+    policy = RetryPolicy()
+    calls = 0
+
+    async def run():
+        nonlocal calls
+        calls += 1
+        raise _neo4j_error(SYNTAX_ERROR)
+
+    with pytest.raises(CypherSyntaxError):
+        await policy.run("read", run)
+    assert (calls, sleeps, policy.retries) == (1, [], {})
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_retries_stop_after_max_retries(sleeps):
+    policy = RetryPolicy(max_retries=2)
+    calls = 0
+
+    async def run():
+        nonlocal calls
+        calls += 1
+        raise SessionExpired("leader switched")
+
+    with pytest.raises(SessionExpired):
+        await policy.run("read", run)
+    assert (calls, len(sleeps)) == (3, 2)
+    assert policy.exhausted == {"read": 1}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_retries_stop_at_the_deadline(sleeps, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(retry.time, "monotonic", lambda: now[0])
+    policy = RetryPolicy(max_retries=10, initial_delay=1, max_delay=1, deadline=2.4)
+
+    async def run():
+        # each attempt takes a second
+        now[0] += 1
+        raise ServiceUnavailable("unreachable")
+
+    with pytest.raises(ServiceUnavailable):
+        await policy.run("read", run)
+    # a third attempt would have started after the deadline
+    assert len(sleeps) == 1
+    assert policy.exhausted == {"read": 1}
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_no_retries():
+    policy = RetryPolicy(max_retries=0)
+
+    async def run():
+        raise ServiceUnavailable("unreachable")
+
+    with pytest.raises(ServiceUnavailable):
+        await policy.run("read", run)
+    assert (policy.retries, policy.exhausted) == ({}, {})
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_cancellation_is_not_retried():
+    policy = RetryPolicy()
+
+    async def run():
+        raise asyncio.CancelledError()
+
+    with pytest.raises(asyncio.CancelledError):
+        await policy.run("read", run)
@@ -0,0 +1,110 @@
+import json
+from pathlib import Path as FilePath
+
+import pytest
+import pytz
+from neo4j import Record
+from neo4j.graph import Graph, Node, Path
+from neo4j.spatial import CartesianPoint, WGS84Point
+from neo4j.time import Date, DateTime, Duration, Time
+
+from mcp_neo4j_cypher import serialization
+from mcp_neo4j_cypher.serialization import dump_record, dumpb, dumps
+
+# the copy of the module in the memory server of this repository
+MEMORY_SERIALIZATION = (
+    FilePath(__file__).parents[3]
+    / "mcp-neo4j-memory/src/mcp_neo4j_memory/serialization.py"
+)
+
+
+def make_graph():
+    graph = Graph()
+    alice = Node(graph, "4:db:1", 1, ["Person"], {"name": "Alice"})
+    bob = Node(graph, "4:db:2", 2, ["Person", "Actor"], {"name": "Bob"})
+    knows = graph.relationship_type("KNOWS")(graph, "5:db:1", 1, {"since": 2020})
+    knows._start_node = alice
+    knows._end_node = bob
+    return alice, bob, knows
+
+
+def test_dumps_node_and_relationship():
+    _, bob, knows = make_graph()
+
+    assert json.loads(dumps(bob)) == {
+        "element_id": "4:db:2",
+        "labels": ["Actor", "Person"],
+        "properties": {"name": "Bob"},
+    }
+    assert json.loads(dumps(knows)) == {
+        "element_id": "5:db:1",
+        "type": "KNOWS",
+        "start": "4:db:1",
+        "end": "4:db:2",
+        "properties": {"since": 2020},
+    }
+
+
+def test_dumps_path_segments():
+    alice, _, knows = make_graph()
+
+    path = json.loads(dumps(Path(alice, knows)))
+
+    assert path["length"] == 1
+    assert path["start"]["element_id"] == "4:db:1"
+    assert path["end"]["element_id"] == "4:db:2"
+    assert path["segments"][0]["relationship"]["type"] == "KNOWS"
+
+
+def test_dumps_temporal_and_spatial_values():
+    value = {
+        "date": Date(2024, 1, 31),
+        "datetime": DateTime(2024, 1, 31, 12, 30, 0, tzinfo=pytz.utc),
+        "time": Time(12, 30, 0),
+        "duration": Duration(days=3, seconds=5),
+        "point": WGS84Point((12.5, 55.6)),
+        "point3d": CartesianPoint((1.0, 2.0, 3.0)),
+        "bytes": b"abc",
+    }
+
+    assert json.loads(dumps(value)) == {
+        "date": "2024-01-31",
+        "datetime": "2024-01-31T12:30:00.000000000+00:00",
+        "time": "12:30:00.000000000",
+        "duration": "P3DT5S",
+        "point": {"srid": 4326, "x": 12.5, "y": 55.6},
+        "point3d": {"srid": 9157, "x": 1.0, "y": 2.0, "z": 3.0},
+        "bytes": "YWJj",
+    }
+
+
+def test_dump_record_keys_by_column():
+    alice, _, _ = make_graph()
+    record = Record({"n": alice, "count": 3})
+
+    assert json.loads(dump_record(record)) == {
+        "n": {
+            "element_id": "4:db:1",
+            "labels": ["Person"],
+            "properties": {"name": "Alice"},
+        },
+        "count": 3,
+    }
+
+
+def test_dumpb_indent():
+    assert dumpb({"a": [1]}, indent=True) == b'{\n  "a": [\n    1\n  ]\n}'
+
+
+def _code(path) -> list[str]:
+    # without the leading comment, which names the other copy
+    lines = FilePath(path).read_text().splitlines()
+    while lines and (lines[0].startswith("#") or not lines[0]):
+        lines.pop(0)
+    return lines
+
+
+def test_memory_server_copy_is_in_sync():
+    if not MEMORY_SERIALIZATION.exists():
+        pytest.skip("the memory server is not in this tree")
+    assert _code(MEMORY_SERIALIZATION) == _code(serialization.__file__)
@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+
+from mcp_neo4j_cypher.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_single_flight_shares_concurrent_calls():
+    calls = 0
+    release = asyncio.Event()
+
+    async def fn():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    flights = SingleFlight()
+    waiters = [asyncio.create_task(flights.do("q", fn)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*waiters)
+    assert [value for value, _ in results] == [1, 1, 1]
+    assert [owner for _, owner in results] == [True, False, False]
+    assert len(flights) == 0
+
+    # the call is forgotten once done
+    assert await flights.do("q", fn) == (2, True)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_single_flight_keeps_distinct_keys_apart():
+    async def fn(value):
+        await asyncio.sleep(0)
+        return value
+
+    flights = SingleFlight()
+    results = await asyncio.gather(
+        flights.do("a", lambda: fn("a")), flights.do("b", lambda: fn("b"))
+    )
+    assert results == [("a", True), ("b", True)]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_single_flight_shares_errors():
+    release = asyncio.Event()
+
+    async def fn():
+        await release.wait()
+        raise RuntimeError("boom")
+
+    flights = SingleFlight()
+    waiters = [asyncio.create_task(flights.do("q", fn)) for _ in range(2)]
+    await asyncio.sleep(0)
+    release.set()
+
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_single_flight_survives_cancelled_waiter():
+    release = asyncio.Event()
+    started = 0
+
+    async def fn():
+        nonlocal started
+        started += 1
+        await release.wait()
+        return "result"
+
+    flights = SingleFlight()
+    owner = asyncio.create_task(flights.do("q", fn))
+    follower = asyncio.create_task(flights.do("q", fn))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await follower == ("result", False)
+    assert owner.cancelled()
+    assert started == 1
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_single_flight_cancels_call_without_waiters():
+    cancelled = asyncio.Event()
+
+    async def fn():
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    flights = SingleFlight()
+    waiters = [asyncio.create_task(flights.do("q", fn)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert len(flights) == 0
@@ -0,0 +1,129 @@
+import json
+
+import pytest
+from fakes import FakeDriver, FakeResult, FakeSummary
+from neo4j import READ_ACCESS
+
+from mcp_neo4j_cypher.slowlog import SlowQueryLog, params_shape
+
+PROFILE = {
+    "operatorType": "ProduceResults@neo4j",
+    "args": {"Details": "name"},
+    "rows": 3,
+    "dbHits": 0,
+    "children": [
+        {
+            "operatorType": "NodeByLabelScan@neo4j",
+            "args": {"Details": "p:Person"},
+            "rows": 3,
+            "dbHits": 4,
+            "children": [],
+        }
+    ],
+}
+
+
+class Driver(FakeDriver):
+    def respond(self, query, params):
+        return FakeResult(summary=FakeSummary(profile=PROFILE))
+
+
+def test_params_shape():
+    assert params_shape(
+        {"name": "Alice", "age": 30, "tags": ["a", "b"], "rows": [{"id": 1}], "x": None}
+    ) == {
+        "name": "str",
+        "age": "int",
+        "tags": ["str"],
+        "rows": [{"id": "int"}],
+        "x": "null",
+    }
+    assert params_shape({"empty": []}) == {"empty": []}
+
+
+def test_fast_queries_are_not_recorded():
+    slow_log = SlowQueryLog(Driver(), 0.5)
+
+    assert not slow_log.record("read", "RETURN 1", None, "neo4j", 0.1)
+    assert slow_log.top() == []
+
+
+def test_slow_queries_are_aggregated_by_normalized_query():
+    slow_log = SlowQueryLog(Driver(), 0.5)
+
+    slow_log.record("read", "MATCH (p) RETURN p", {"id": 1}, "neo4j", 1.0, 10, 100)
+    slow_log.record(
+        "read", "MATCH  (p)\nRETURN p // all", {"id": 2}, "neo4j", 2.0, 5, 50
+    )
+    slow_log.record("write", "CREATE (p)", None, "neo4j", 0.6)
+    for _ in range(3):
+        slow_log.record("read", "MATCH (p) RETURN p", None, "other", 0.5, 1, 10)
+
+    top = slow_log.top()
+    assert [(q["query"], q["database"], q["count"]) for q in top] == [
+        ("MATCH ( p ) RETURN p", "neo4j", 2),
+        ("MATCH ( p ) RETURN p", "other", 3),
+        ("CREATE ( p )", "neo4j", 1),
+    ]
+    assert top[0]["params"] == {"id": "int"}
+    assert top[0]["total_ms"] == 3000
+    assert top[0]["mean_ms"] == 1500
+    assert top[0]["max_ms"] == 2000
+    assert (top[0]["rows"], top[0]["bytes"]) == (15, 150)
+
+    assert [q["count"] for q in slow_log.top(2, order_by="count")] == [3, 2]
+    assert [q["max_ms"] for q in slow_log.top(order_by="max")] == [2000, 600, 500]
+
+
+def test_fastest_queries_are_dropped_first():
+    slow_log = SlowQueryLog(Driver(), 0, max_queries=2)
+
+    slow_log.record("read", "RETURN 1", None, "neo4j", 3)
+    slow_log.record("read", "RETURN 2", None, "neo4j", 1)
+    slow_log.record("read", "RETURN 3", None, "neo4j", 2)
+
+    assert [q["query"] for q in slow_log.top()] == ["RETURN 1", "RETURN 3"]
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_sampled_reads_are_profiled(tmp_path):
+    driver = Driver()
+    path = tmp_path / "slow.ndjson"
+    slow_log = SlowQueryLog(driver, 0.5, str(path), sample_rate=1.0)
+
+    slow_log.record("write", "CREATE (p:Person)", None, "neo4j", 1.0)
+    slow_log.record(
+        "read", "EXPLAIN MATCH (p:Person) RETURN p.name", {"n": 1}, "neo4j", 1.0, 3, 30
+    )
+    # one profile runs at a time
+    slow_log.record("read", "MATCH (p:Person) RETURN p", None, "neo4j", 1.0, 3, 30)
+    await slow_log._profiling
+
+    # writes are never run again
+    assert driver.runs == [("PROFILE  MATCH (p:Person) RETURN p.name", {"n": 1})]
+    assert driver.sessions == [
+        {"database": "neo4j", "default_access_mode": READ_ACCESS}
+    ]
+    assert {q["query"]: q["db_hits"] for q in slow_log.top()} == {
+        "CREATE ( p : Person )": None,
+        "EXPLAIN MATCH ( p : Person ) RETURN p . name": 4,
+        "MATCH ( p : Person ) RETURN p": None,
+    }
+
+    events = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [event["event"] for event in events] == [
+        "slow_query",
+        "slow_query",
+        "slow_query",
+        "profile",
+    ]
+    assert events[1]["query"] == "EXPLAIN MATCH ( p : Person ) RETURN p . name"
+    assert events[1]["params"] == {"n": "int"}
+    assert (events[1]["duration_ms"], events[1]["rows"], events[1]["bytes"]) == (
+        1000,
+        3,
+        30,
+    )
+    assert events[3]["db_hits"] == 4
+    assert events[3]["plan"]["operator"] == "ProduceResults@neo4j"
+    assert events[3]["plan"]["children"][0]["details"] == "p:Person"
@@ -0,0 +1,49 @@
+import httpx
+import pytest
+
+from mcp_neo4j_cypher.server import create_mcp_server
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-03-26",
+        "capabilities": {},
+        "clientInfo": {"name": "test", "version": "1"},
+    },
+}
+
+
+class FakeDriver:
+    async def verify_connectivity(self):
+        pass
+
+
+async def _initialize(host: str, host_header: str) -> int:
+    mcp = create_mcp_server(FakeDriver(), host=host)
+    app = mcp.streamable_http_app()
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            response = await client.post(
+                "/mcp",
+                json=INITIALIZE,
+                headers={
+                    "Host": host_header,
+                    "Accept": "application/json, text/event-stream",
+                },
+            )
+    return response.status_code
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_shared_server_accepts_any_host():
+    assert await _initialize("0.0.0.0", "db-host.internal:8000") == 200
+
+
+@pytest.mark.asyncio(loop_scope="function")
+async def test_local_server_rejects_other_hosts():
+    assert await _initialize("127.0.0.1", "localhost:8000") == 200
+    assert await _initialize("127.0.0.1", "db-host.internal:8000") == 421
@@ -0,0 +1,116 @@
+import pytest
+
+from mcp_neo4j_cypher.cypher import is_write_query
+
+READS = [
+    "MATCH (n) RETURN n",
+    "match (n:Person) return n.name",
+    "MATCH (n:Person) WHERE n.name = 'CREATE' RETURN n",
+    'MATCH (n:Person) WHERE n.bio CONTAINS "DELETE everything" RETURN n',
+    "MATCH (n:Person) WHERE n.quote = 'it\\'s a SET' RETURN n",
+    "MATCH (n) // DELETE this later\nRETURN n",
+    "MATCH (n) /* MERGE\n SET */ RETURN n",
+    "MATCH (n) RETURN n.created, n.set, n.deleted",
+    "MATCH (n) RETURN n.created_at AS createdAt",
+    "MATCH (n:Delete) RETURN n",
+    "MATCH (n:Create|Merge) RETURN n",
+    "MATCH ()-[r:SET]->() RETURN count(r)",
+    "MATCH (n) RETURN n {.name, created: n.createdAt}",
+    "RETURN {set: 1, remove: 2} AS m",
+    "MATCH (`create`:Person) RETURN `create`",
+    "MATCH (n) RETURN n.`delete`",
+    "MATCH (start:Station)-[:LINK]->(stop:Station) RETURN start, stop",
+    "MATCH p = (start)-[*1..3]->(end) RETURN p",
+    "MATCH (n) WHERE n.name STARTS WITH 'Al' RETURN n",
+    "UNWIND $rows AS row RETURN row",
+    "WITH 'MERGE (n)' AS text RETURN text",
+    "CALL db.labels() YIELD label RETURN label",
+    "CALL db.schema.visualization()",
+    "CALL apoc.meta.data()",
+    "CALL apoc.cypher.run('MATCH (n) RETURN n', {}) YIELD value RETURN value",
+    "CALL apoc.cypher.runManyReadOnly('MATCH (n) RETURN n;', {})",
+    "MATCH (n) RETURN n.insert, n:Insert",
+    "CALL gds.pageRank.stream('graph') YIELD nodeId, score RETURN nodeId, score",
+    "MATCH (n) CALL { WITH n MATCH (n)-->(m) RETURN count(m) AS degree } RETURN n, degree",
+    "MATCH (n:Person) RETURN count { (n)-[:FRIEND]->() } AS friends",
+    "MATCH (n:Person) WHERE exists { (n)-[:FRIEND]->() } RETURN n",
+    "SHOW INDEXES",
+    "SHOW CONSTRAINTS YIELD name RETURN name",
+    "EXPLAIN MATCH (n) RETURN n",
+    "PROFILE MATCH (n) RETURN n",
+    "MATCH (n) RETURN apoc.create.uuid() AS id",
+    "MATCH (n) RETURN n ORDER BY n.name SKIP 10 LIMIT 10",
+    "MATCH (n) WHERE n.name =~ '(?i)drop.*' RETURN n",
+    "RETURN 'unterminated",
+    "",
+]
+
+WRITES = [
+    "CREATE (n:Person {name: 'Alice'})",
+    "create (n)",
+    "MERGE (n:Person {name: $name})",
+    "MATCH (n) SET n.name = 'x'",
+    "MATCH (n) SET n += $props",
+    "MATCH (n) SET n:Label",
+    "MATCH (n) DELETE n",
+    "MATCH (n) DETACH DELETE n",
+    "MATCH (n) REMOVE n.name",
+    "MATCH (n) REMOVE n:Label",
+    "MATCH (n) WHERE n.name = 'x' // comment\nSET n.y = 1",
+    "MATCH (n) /* read */ CREATE (m)",
+    "MATCH (n) CALL { WITH n SET n.seen = true } RETURN n",
+    "MATCH (n) CALL { WITH n CREATE (n)-[:R]->(:M) } IN TRANSACTIONS",
+    "UNWIND $rows AS row MERGE (n:Person {id: row.id}) SET n += row",
+    "LOAD CSV FROM 'file:///a.csv' AS row CREATE (:Row {value: row[0]})",
+    "MATCH (n) FOREACH (x IN [1, 2] | SET n.x = x)",
+    "MATCH (n) WITH n MATCH (m) MERGE (n)-[:KNOWS]->(m)",
+    "CREATE INDEX person_name FOR (n:Person) ON (n.name)",
+    "DROP INDEX person_name",
+    "CREATE CONSTRAINT FOR (n:Person) REQUIRE n.id IS UNIQUE",
+    "DROP CONSTRAINT person_id",
+    "CREATE DATABASE test",
+    "ALTER DATABASE test SET ACCESS READ ONLY",
+    "START DATABASE test",
+    "STOP DATABASE test",
+    "CREATE USER bob SET PASSWORD 'secret'",
+    "GRANT ROLE reader TO bob",
+    "REVOKE ROLE reader FROM bob",
+    "DENY WRITE ON GRAPH * TO bob",
+    "RENAME ROLE reader TO viewer",
+    "CALL apoc.create.node(['Person'], {name: 'Alice'})",
+    "CALL apoc.cypher.runMany('CREATE (n:Person); CREATE (m:Person);', {})",
+    "CALL apoc.cypher.runFile('create.cypher')",
+    "CALL apoc.cypher.runFiles(['a.cypher', 'b.cypher'])",
+    "MATCH (n:Person) WITH collect(n) AS people CALL apoc.nodes.link(people, 'NEXT') RETURN 1",
+    "CALL db.index.vector.createNodeIndex('embeddings', 'Doc', 'embedding', 1536, 'cosine')",
+    "INSERT (n:Person {name: 'Alice'})",
+    "MATCH (a), (b) INSERT (a)-[:KNOWS]->(b)",
+    "CALL apoc.merge.node(['Person'], {id: 1})",
+    "CALL apoc.refactor.mergeNodes([a, b])",
+    "CALL apoc.periodic.iterate('MATCH (n) RETURN n', 'SET n.x = 1', {})",
+    "CALL apoc.cypher.doIt('CREATE (n)', {})",
+    "CALL apoc.do.when(true, 'CREATE (n)', '', {})",
+    "CALL apoc.nodes.delete(nodes, 100)",
+    "CALL apoc.schema.assert({}, {})",
+    "CALL db.createLabel('Person')",
+    "CALL dbms.setConfigValue('db.logs.query.enabled', 'INFO')",
+    "CALL gds.pageRank.write('graph', {writeProperty: 'rank'})",
+    "PROFILE MATCH (n) SET n.x = 1",
+]
+
+
+@pytest.mark.parametrize("query", READS)
+def test_read_queries(query):
+    assert not is_write_query(query)
+
+
+@pytest.mark.parametrize("query", WRITES)
+def test_write_queries(query):
+    assert is_write_query(query)
+
+
+def test_results_are_memoized():
+    is_write_query.cache_clear()
+    is_write_query("MATCH (n) RETURN n")
+    is_write_query("MATCH (n) RETURN n")
+    assert is_write_query.cache_info().hits == 1
@@ -1,6 +1,6 @@
-from . import server
 import asyncio
 import argparse
+import importlib
 import os
 
 
@@ -18,8 +18,18 @@ def main():
                        help='Neo4j password')
     
     args = parser.parse_args()
+
+    # the driver and the MCP server stack are only imported once the arguments are valid
+    from . import server
     asyncio.run(server.main(args.db_url, args.username, args.password))
 
 
+def __getattr__(name):
+    # import the server lazily, so that `--help` does not load the driver
+    if name == "server":
+        return importlib.import_module(f"{__name__}.server")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Optionally expose other important items at package level
 __all__ = ["main", "server"]
@@ -1,6 +1,5 @@
 import os
 import logging
-import json
 from typing import Any, Dict, List, Optional
 from contextlib import asynccontextmanager
 
@@ -13,6 +12,8 @@ from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
 
+from .serialization import dumps
+
 # Set up logging
 logger = logging.getLogger('mcp_neo4j_memory')
 logger.setLevel(logging.INFO)
@@ -418,7 +419,7 @@ async def main(neo4j_uri: str, neo4j_user: str, neo4j_password: str):
         try:
             if name == "read_graph":
                 result = await memory.read_graph()
-                return [types.TextContent(type="text", text=json.dumps(result.model_dump(), indent=2))]
+                return [types.TextContent(type="text", text=dumps(result.model_dump(), indent=True))]
 
             if not arguments:
                 raise ValueError(f"No arguments provided for tool: {name}")
@@ -426,17 +427,17 @@ async def main(neo4j_uri: str, neo4j_user: str, neo4j_password: str):
             if name == "create_entities":
                 entities = [Entity(**entity) for entity in arguments.get("entities", [])]
                 result = await memory.create_entities(entities)
-                return [types.TextContent(type="text", text=json.dumps([e.model_dump() for e in result], indent=2))]
+                return [types.TextContent(type="text", text=dumps([e.model_dump() for e in result], indent=True))]
                 
             elif name == "create_relations":
                 relations = [Relation(**relation) for relation in arguments.get("relations", [])]
                 result = await memory.create_relations(relations)
-                return [types.TextContent(type="text", text=json.dumps([r.model_dump() for r in result], indent=2))]
+                return [types.TextContent(type="text", text=dumps([r.model_dump() for r in result], indent=True))]
                 
             elif name == "add_observations":
                 observations = [ObservationAddition(**obs) for obs in arguments.get("observations", [])]
                 result = await memory.add_observations(observations)
-                return [types.TextContent(type="text", text=json.dumps(result, indent=2))]
+                return [types.TextContent(type="text", text=dumps(result, indent=True))]
                 
             elif name == "delete_entities":
                 await memory.delete_entities(arguments.get("entityNames", []))
@@ -454,11 +455,11 @@ async def main(neo4j_uri: str, neo4j_user: str, neo4j_password: str):
                 
             elif name == "search_nodes":
                 result = await memory.search_nodes(arguments.get("query", ""))
-                return [types.TextContent(type="text", text=json.dumps(result.model_dump(), indent=2))]
+                return [types.TextContent(type="text", text=dumps(result.model_dump(), indent=True))]
                 
             elif name == "find_nodes" or name == "open_nodes":
                 result = await memory.find_nodes(arguments.get("names", []))
-                return [types.TextContent(type="text", text=json.dumps(result.model_dump(), indent=2))]
+                return [types.TextContent(type="text", text=dumps(result.model_dump(), indent=True))]
                 
             else:
                 raise ValueError(f"Unknown tool: {name}")
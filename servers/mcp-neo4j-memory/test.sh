@@ -1,4 +1,4 @@
 export NEO4J_URI=neo4j://localhost:7687
 export NEO4J_USERNAME=neo4j
 export NEO4J_PASSWORD=password
-uv run pytest tests/test_neo4j_memory_integration.py
+uv run pytest tests